@@ -1,6 +1,7 @@
 import pydantic
 import numpy as np
 import os
+import shutil
 from time import time
 
 from tidy3d import *
@@ -17,6 +18,14 @@ def test_simulation_load_export():
     assert SIM == SIM2, "original and loaded simulations are not the same"
 
 
+def test_simulation_compact_json():
+    """The compact json string used for upload loads the same simulation."""
+    sim_compact = Simulation.parse_raw(SIM._json_string(indent=None))
+    assert sim_compact == SIM
+    assert "\n" not in SIM._json_string(indent=None)
+    assert len(SIM._json_string(indent=None)) < len(SIM._json_string())
+
+
 @clear_tmp
 def test_simulation_preserve_types():
 
@@ -136,3 +145,36 @@ def test_yaml():
     sim.to_yaml(path1)
     sim1 = Simulation.from_yaml(path1)
     assert sim1 == sim
+
+
+@clear_tmp
+def test_result_cache():
+    """Data is found by simulation contents and the least recently used data is removed."""
+    from tidy3d.web.cache import ResultCache
+
+    cache = ResultCache(directory="tests/tmp/cache", max_size_bytes=150)
+    try:
+        cache.clear()
+        path = "tests/tmp/sim_data.hdf5"
+
+        assert not cache.get(SIM, path=path)
+        for sim, data in ((SIM, b"a" * 100), (SIM2, b"b" * 100)):
+            with open(path, "wb") as f:
+                f.write(data)
+            cache.put(sim, path=path)
+
+        # only the last one fits
+        stats = cache.stats()
+        assert stats["num_entries"] == 1 and stats["size_bytes"] == 100
+        assert not cache.get(SIM, path=path)
+        assert cache.get(Simulation.parse_raw(SIM2.json()), path="tests/tmp/copy.hdf5")
+        with open("tests/tmp/copy.hdf5", "rb") as f:
+            assert f.read() == b"b" * 100
+
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 2
+        cache.clear()
+        assert cache.stats()["num_entries"] == 0
+    finally:
+        # the lock file is left in the cache directory, so it is removed with it
+        shutil.rmtree(cache.directory)
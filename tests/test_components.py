@@ -2,9 +2,14 @@ from typing import Dict
 import pytest
 import numpy as np
 import pydantic
+import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+from shapely.strtree import STRtree
 
 from tidy3d import *
-from tidy3d.log import ValidationError, SetupError
+import tidy3d.components.simulation as simulation_module
+from tidy3d.log import ValidationError, SetupError, Tidy3dKeyError
+from tidy3d.components.validators import get_validator_times, reset_validator_times
 from .utils import assert_log_level
 
 
@@ -115,6 +120,137 @@ def test_sim_bounds():
                 place_box(tuple(center))
 
 
+def test_sim_validator_times():
+    """make sure the validators over all structures are timed and find the right structure"""
+
+    reset_validator_times()
+    structures = [
+        Structure(geometry=Box(size=(0.1, 0.1, 0.1), center=(x, 0, 0)), medium=Medium())
+        for x in np.linspace(-0.4, 0.4, 100)
+    ]
+    sim = Simulation(
+        size=(1, 1, 1), grid_size=(0.1, 0.1, 0.1), run_time=1e-12, structures=structures
+    )
+
+    times = get_validator_times()
+    assert "Simulation._structures_not_at_edges" in times
+    assert "Simulation.objects_in_sim_bounds[structures]" in times
+
+    # the bounds of the structures are computed again after they are modified
+    structures[42].geometry.center = (2, 0, 0)
+    with pytest.raises(SetupError, match=r"structures\[42\]"):
+        sim.structures = structures
+
+    reset_validator_times()
+    assert not get_validator_times()
+
+
+def test_trusted_construction():
+    """make sure trusted models skip validation until validate_deferred is called"""
+
+    sim = Simulation(size=(1.0, 1.0, 1.0), grid_size=(0.1, 0.1, 0.1), run_time=1e-12)
+    assert not sim.is_trusted
+    assert sim.validate_deferred() is sim
+
+    box = Box.construct_trusted(center=(0.0, 0.0, 0.0), size=(0.5, 0.5, 0.5))
+    structure = Structure.construct_trusted(geometry=box, medium=Medium())
+    sim_trusted = sim.copy_trusted(update=dict(structures=[structure]))
+    assert sim_trusted.is_trusted
+    assert not sim.is_trusted
+
+    # trusted models are found when nested in validated ones
+    sim_nested = sim.copy(update=dict(structures=[structure]))
+    assert sim_nested.is_trusted
+
+    sim_valid = sim_trusted.validate_deferred()
+    assert not sim_valid.is_trusted
+    assert sim_valid == Simulation(
+        size=(1.0, 1.0, 1.0),
+        grid_size=(0.1, 0.1, 0.1),
+        run_time=1e-12,
+        structures=[Structure(geometry=Box(size=(0.5, 0.5, 0.5)), medium=Medium())],
+    )
+
+    # invalid values are only caught when validating
+    box_invalid = Box.construct_trusted(center=(0.0, 0.0, 0.0), size=(-1.0, 0.5, 0.5))
+    structure_invalid = Structure.construct_trusted(geometry=box_invalid, medium=Medium())
+    sim_invalid = sim.copy_trusted(update=dict(structures=[structure_invalid]))
+    with pytest.raises(pydantic.ValidationError):
+        sim_invalid.validate_pre_upload()
+
+
+def test_updated_copy():
+    """make sure updated copies share the components that are not updated"""
+
+    structures = [
+        Structure(
+            geometry=PolySlab(vertices=[(0, 0), (1, 0), (1, 1)], slab_bounds=(0, 1)),
+            medium=Medium(permittivity=2.0),
+        ),
+        Structure(geometry=Box(size=(1, 1, 1)), medium=Medium()),
+    ]
+    sim = Simulation(
+        size=(4, 4, 4), grid_size=(0.1, 0.1, 0.1), run_time=1e-12, structures=structures
+    )
+
+    src = VolumeSource(
+        source_time=GaussianPulse(freq0=3e14, fwidth=1e13), size=(0, 0, 0), polarization="Ex"
+    )
+    sim_src = sim.updated_copy(sources=[src])
+    assert sim_src.sources[0] == src
+    assert not sim.sources
+    assert sim_src.structures[0].geometry is sim.structures[0].geometry
+
+    sim_slab = sim.updated_copy(path="structures/0/geometry", slab_bounds=(0.0, 2.0))
+    assert sim_slab.structures[0].geometry.bounds[1][2] == 2.0
+    assert sim.structures[0].geometry.bounds[1][2] == 1.0
+    assert sim_slab.structures[1].geometry is sim.structures[1].geometry
+
+    # updated components are validated
+    with pytest.raises(SetupError):
+        sim.updated_copy(path="structures/1/geometry", center=(10, 0, 0))
+    with pytest.raises(Tidy3dKeyError):
+        sim.updated_copy(path="structures/2/geometry", center=(0, 0, 0))
+    with pytest.raises(Tidy3dKeyError):
+        sim.updated_copy(path="structures/0/geometry", not_a_field=0)
+
+
+def test_cached_properties():
+    """make sure cached properties are computed again after a nested component is modified"""
+
+    geometries = [Box(size=(1, 1, 1)), Sphere(radius=0.5), Cylinder(radius=0.5, length=1)]
+    structures = [Structure(geometry=geometry, medium=Medium()) for geometry in geometries]
+    sim = Simulation(
+        size=(4, 4, 4), grid_size=(0.1, 0.1, 0.1), run_time=1e-12, structures=structures
+    )
+
+    for structure in sim.structures:
+        assert structure.geometry.bounds[1][0] == 0.5
+        assert structure.geometry.bounds is structure.geometry.bounds
+    shapes = sim._get_structures_plane(z=0)
+    assert max(shape.bounds[2] for _, shape in shapes) == 0.5
+
+    assert sim._get_structures_plane(z=0) == shapes
+
+    # assigning a field of an unrelated model keeps the cached values
+    bounds = sim.structures[0].geometry.bounds
+    pulse = GaussianPulse(freq0=1e14, fwidth=1e13)
+    pulse.freq0 = 2e14
+    assert sim.structures[0].geometry.bounds is bounds
+
+    for structure in sim.structures:
+        structure.geometry.center = (1, 0, 0)
+        assert structure.geometry.bounds[1][0] == 1.5
+    shapes = sim._get_structures_plane(z=0)
+    assert max(shape.bounds[2] for _, shape in shapes) == 1.5
+
+    # copies with fields replaced do not share the cached values
+    box = Box(size=(1, 1, 1))
+    assert box.bounds[1][0] == 0.5
+    assert box.copy(update=dict(center=(1, 0, 0))).bounds[1][0] == 1.5
+    assert box.copy().bounds is box.bounds
+
+
 def test_sim_grid_size():
 
     size = (1, 1, 1)
@@ -149,6 +285,38 @@ def _test_monitor_size():
         s.validate_contents()
 
 
+def test_sim_estimate():
+
+    monitors = [
+        FieldMonitor(size=(2, 2, 2), freqs=[1e14, 2e14], name="field"),
+        FluxMonitor(size=(2, 2, 0), freqs=[1e14], name="flux"),
+        FieldTimeMonitor(size=(1, 0, 1), name="time"),
+    ]
+    sim = Simulation(
+        size=(4, 4, 4),
+        grid_size=(0.1, 0.1, 0.1),
+        run_time=1e-13,
+        pml_layers=[PML(), PML(), None],
+        symmetry=(1, 0, -1),
+        monitors=monitors,
+    )
+    estimate = sim.estimate()
+
+    assert estimate.num_cells == sim.num_cells
+    assert estimate.num_cells_solver == sim.num_cells // 4
+    assert estimate.num_time_steps == sim.num_time_steps
+
+    for monitor in monitors:
+        num_cells = np.prod(sim.discretize(sim.min_sym_box(monitor)).num_cells)
+        storage = monitor.storage_size(num_cells=num_cells, tmesh=sim.tmesh)
+        assert estimate.monitor_storage[monitor.name] == storage
+    assert estimate.monitor_storage_total == sum(estimate.monitor_storage.values())
+    assert estimate.solver_memory > estimate.monitor_storage_total
+
+    batch = web.Batch(simulations={"task": sim})
+    assert batch.estimate()["task"] == estimate
+
+
 @pytest.mark.parametrize("freq, log_level", [(1.5, 30), (2.5, None), (3.5, 30)])
 def test_monitor_medium_frequency_range(caplog, freq, log_level):
     # monitor frequency above or below a given medium's range should throw a warning
@@ -272,6 +440,100 @@ def test_sim_plane_wave_error():
         )
 
 
+def test_sim_structures_plane():
+    """Make sure overlapping structures are cut by the later ones and merged by medium."""
+
+    medium_1 = Medium(permittivity=2)
+    medium_2 = Medium(permittivity=3)
+    structures = [
+        Structure(geometry=Box(center=(0, 0, 0), size=(2, 2, 1)), medium=medium_1),
+        Structure(geometry=Box(center=(1, 0, 0), size=(2, 2, 1)), medium=medium_2),
+        Structure(geometry=Box(center=(2, 0, 0), size=(2, 2, 1)), medium=Medium(permittivity=2)),
+        Structure(geometry=Box(center=(-3, 0, 0), size=(1, 1, 1)), medium=medium_2),
+    ]
+    sim = Simulation(size=(8, 4, 2), grid_size=(0.1, 0.1, 0.1), structures=structures, run_time=1)
+
+    medium_shapes = sim._filter_structures_plane(sim.structures, z=0)
+    areas = {}
+    for medium, shape in medium_shapes:
+        areas[medium] = areas.get(medium, 0) + shape.area
+    assert np.isclose(areas[medium_1], 2 + 4) and np.isclose(areas[medium_2], 2 + 1)
+    assert len(medium_shapes) == 4
+
+    # shapes are computed once per plane, and again when the simulation changes
+    assert sim._get_structures_plane(z=0) == medium_shapes
+    assert sim._get_structures_plane(z=0)[0][1] is sim._get_structures_plane(z=0)[0][1]
+    sim.structures = structures[:1]
+    assert len(sim._get_structures_plane(z=0)) == 1
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_sim_structures_plane_tree_indices(monkeypatch):
+    """Make sure the shapes are the same with an STRtree returning indices, as in shapely 2."""
+
+    class IndexSTRtree(STRtree):
+        """Returns the indices of the geometries found, like ``STRtree`` in shapely 2."""
+
+        def __init__(self, geoms):
+            super().__init__(geoms)
+            self.geom_indices = {id(geom): index for index, geom in enumerate(geoms)}
+
+        def query(self, geom):
+            found = super().query(geom)
+            return np.array([self.geom_indices[id(other)] for other in found], dtype=np.intp)
+
+    structures = [
+        Structure(geometry=Box(center=(x, 0, 0), size=(2, 2, 1)), medium=Medium(permittivity=eps))
+        for x, eps in ((0, 2), (1, 3), (2, 2), (-3, 3))
+    ]
+    sim = Simulation(size=(8, 4, 2), grid_size=(0.1, 0.1, 0.1), structures=structures, run_time=1)
+    medium_shapes = sim._filter_structures_plane(sim.structures, z=0)
+
+    monkeypatch.setattr(simulation_module, "STRtree", IndexSTRtree)
+    medium_shapes_indices = sim._filter_structures_plane(sim.structures, z=0)
+    assert len(medium_shapes_indices) == len(medium_shapes)
+    for (medium, shape), (medium_indices, shape_indices) in zip(
+        medium_shapes, medium_shapes_indices
+    ):
+        assert medium == medium_indices and shape.equals(shape_indices)
+
+
+def test_sim_plot_collections():
+    """Make sure structures and monitors are drawn with one collection per medium or style."""
+
+    structures = [
+        Structure(
+            geometry=Box(center=(i - 5, 0, 0), size=(0.5, 1, 1)),
+            medium=Medium(permittivity=2 + i % 2),
+        )
+        for i in range(10)
+    ]
+    monitors = [
+        FieldMonitor(center=(i - 5, 1, 0), size=(0.5, 0.5, 0), freqs=[1e14], name=f"mon{i}")
+        for i in range(10)
+    ]
+    sim = Simulation(
+        size=(12, 4, 2),
+        grid_size=(0.1, 0.1, 0.1),
+        structures=structures,
+        monitors=monitors,
+        run_time=1e-12,
+    )
+
+    ax = sim.plot_structures(z=0)
+    collections = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert len(collections) == 2
+    plt.close()
+
+    ax = sim.plot_monitors(z=0)
+    assert len(ax.collections) == 1
+    plt.close()
+
+    ax = sim.plot_eps(z=0, raster_points=50)
+    assert len(ax.images) == 1
+    plt.close()
+
+
 @pytest.mark.parametrize(
     "box_size,log_level",
     [((0.1, 0.1, 0.1), None), ((1, 0.1, 0.1), 30), ((0.1, 1, 0.1), 30), ((0.1, 0.1, 1), 30)],
@@ -360,6 +622,91 @@ def test_geometry_sizes():
         s = Simulation(size=(1, 1, 1), grid_size=-1.0, run_time=1e-12)
 
 
+def test_polyslab_group():
+
+    vertices_list = [[(0, 0), (1, 0), (1, 1), (0, 1)], [(2, 0), (3, 0), (2, 1)]]
+    group = PolySlabGroup.from_polygons(vertices_list, axis=2, slab_bounds=(0, 1))
+    polyslabs = [PolySlab(vertices=v, axis=2, slab_bounds=(0, 1)) for v in vertices_list]
+    assert group.offsets == [0, 4]
+    assert np.allclose(group.bounds, ((0, 0, 0), (3, 1, 1)))
+
+    # same points inside as the polyslabs, including on their faces
+    x, y, z = np.meshgrid(
+        np.linspace(-0.5, 3.5, 17), np.linspace(-0.5, 1.5, 9), (-0.5, 0, 0.5), indexing="ij"
+    )
+    inside = polyslabs[0].inside(x, y, z) | polyslabs[1].inside(x, y, z)
+    assert np.all(group.inside(x, y, z) == inside)
+    assert group.inside(0.5, 0.5, 0.5) and not group.inside(1.5, 0.5, 0.5)
+
+    # same cross sections as the polyslabs
+    for kwargs in (dict(x=0.5), dict(x=2.5), dict(y=0.25), dict(z=0.5)):
+        area = sum(shape.area for shape in group.intersections(**kwargs))
+        area_polyslabs = sum(shape.area for p in polyslabs for shape in p.intersections(**kwargs))
+        assert np.isclose(area, area_polyslabs)
+
+    # one structure, loaded back as a group
+    sim = Simulation(
+        size=(5, 3, 3),
+        grid_size=(0.1, 0.1, 0.1),
+        run_time=1e-12,
+        structures=[Structure(geometry=group, medium=Medium(permittivity=2))],
+    )
+    sim_loaded = Simulation.parse_raw(sim.json())
+    assert isinstance(sim_loaded.structures[0].geometry, PolySlabGroup)
+    assert sim_loaded == sim
+
+    # each polygon needs at least 3 vertices
+    with pytest.raises(SetupError):
+        PolySlabGroup(vertices=group.vertices, offsets=[0, 5], axis=2, slab_bounds=(0, 1))
+    with pytest.raises(SetupError):
+        PolySlabGroup(vertices=group.vertices, offsets=[1, 4], axis=2, slab_bounds=(0, 1))
+
+
+def test_polyslab_group_from_gds():
+    class GdsCell:
+        """Holds polygons like a ``gdspy.Cell``."""
+
+        def __init__(self, polygons):
+            self.polygons = polygons
+
+        def get_polygons(self, by_spec):
+            return self.polygons
+
+    # square with extra points along its edges, a duplicated vertex and a triangle on layer 2
+    xs = np.linspace(0, 1000, 5)
+    square = np.concatenate(
+        (
+            np.stack((xs, 0 * xs), axis=1),
+            np.stack((0 * xs[1:] + 1000, xs[1:]), axis=1),
+            np.stack((xs[::-1][1:], 0 * xs[1:] + 1000), axis=1),
+            np.stack((0 * xs[1:-1], xs[::-1][1:-1]), axis=1),
+            [(0, 0)],
+        )
+    )
+    far_square = square + 5000
+    triangle = np.array([(0, 0), (1000, 0), (0, 1000)])
+    cell = GdsCell({(1, 0): [square, far_square], (2, 0): [triangle]})
+
+    kwargs = dict(axis=2, slab_bounds=(0, 1), gds_layer=1, gds_scale=1e-3)
+    group = PolySlabGroup.from_gds(cell, **kwargs)
+    assert len(group.offsets) == 2 and len(group.vertices) == 2 * 16
+
+    # points on the edges are removed
+    group = PolySlabGroup.from_gds(cell, tolerance=1e-6, **kwargs)
+    assert len(group.vertices) == 2 * 4
+    assert np.isclose(sum(poly.area for poly in group.intersections(z=0.5)), 2)
+
+    # the second square is outside, the first is cut in half
+    group = PolySlabGroup.from_gds(cell, clip_box=Box(size=(1, 2, 2)), tolerance=1e-6, **kwargs)
+    assert len(group.offsets) == 1 and len(group.vertices) == 4
+    assert np.allclose(group.bounds, ((0, 0, 0), (0.5, 1, 1)))
+
+    with pytest.raises(SetupError):
+        PolySlabGroup.from_gds(cell, clip_box=Box(center=(-5, 0, 0), size=(1, 1, 1)), **kwargs)
+    with pytest.raises(Tidy3dKeyError):
+        PolySlabGroup.from_gds(cell, **{**kwargs, "gds_layer": 3})
+
+
 def test_pop_axis():
     b = Box(size=(1, 1, 1))
     for axis in range(3):
@@ -385,6 +732,22 @@ def test_medium():
         m = Medium(conductivity=-1.0)
 
 
+def test_medium_hash():
+    """the hash of a medium follows its fields, also when they are modified in place"""
+
+    medium = Medium(permittivity=2.0)
+    assert medium == Medium(permittivity=2.0)
+    medium.permittivity = 3.0
+    assert medium == Medium(permittivity=3.0)
+    assert medium != Medium(permittivity=2.0)
+
+    anisotropic = AnisotropicMedium(xx=medium, yy=medium, zz=medium)
+    anisotropic_copy = anisotropic.copy(deep=True)
+    assert anisotropic == anisotropic_copy
+    anisotropic.xx.permittivity = 4.0
+    assert anisotropic != anisotropic_copy
+
+
 def test_medium_conversions():
     n = 4.0
     k = 1.0
@@ -700,6 +1063,27 @@ def test_source_times():
     # c.amp_time(ts)
 
 
+def test_source_spectrum(monkeypatch):
+
+    # make sure the spectrum is computed over several chunks of times
+    monkeypatch.setattr("tidy3d.components.source.DFT_CHUNK_ELEMENTS", 10000)
+
+    ts = np.linspace(0, 30, 10001)
+    dt = ts[1] - ts[0]
+    freqs = np.linspace(0.5, 1.5, 101)
+
+    for source_time in (GaussianPulse(freq0=1, fwidth=0.1), ContinuousWave(freq0=1, fwidth=0.1)):
+
+        # spectrum from the full DFT matrix
+        time_amps = np.real(source_time.amp_time(ts))
+        dft_matrix = np.exp(2j * np.pi * freqs[:, None] * ts) / np.sqrt(2 * np.pi)
+        spectrum_full = dt * dft_matrix @ time_amps
+
+        # spectrum computed over chunks of times
+        spectrum = source_time.spectrum(ts, freqs, dt)
+        assert np.allclose(spectrum, spectrum_full)
+
+
 def test_FieldSource():
     g = GaussianPulse(freq0=1, fwidth=0.1)
     mode_spec = ModeSpec(num_modes=2)
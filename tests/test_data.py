@@ -0,0 +1,410 @@
+import copy
+import pickle
+import tracemalloc
+from time import time
+
+import h5py
+import numpy as np
+import pytest
+import xarray as xr
+
+import tidy3d as td
+from tidy3d import FieldData, ScalarFieldData, FieldMonitor
+from tidy3d.components.data import LazyValues
+from tidy3d.log import DataError
+from .utils import clear_tmp
+
+
+def make_field_data(num_freqs: int = 3, num_cells: int = 20) -> td.SimulationData:
+    """Random field data stored on the Yee grid of a volume monitor in a nonuniform simulation."""
+
+    monitor = FieldMonitor(size=(2, 2, 2), freqs=np.linspace(1e14, 2e14, num_freqs), name="field")
+    sim = td.Simulation(
+        size=(4, 4, 4),
+        grid_size=(4 / num_cells, list(np.linspace(0.1, 0.3, num_cells)), 4 / num_cells),
+        monitors=[monitor],
+        sources=[
+            td.VolumeSource(
+                size=(0, 0, 0),
+                source_time=td.GaussianPulse(freq0=1.5e14, fwidth=5e13),
+                polarization="Ex",
+            )
+        ],
+        run_time=1e-12,
+    )
+    sub_grid = sim.discretize(monitor)
+    yee_grid = sub_grid.yee.grid_dict
+
+    data_dict = {}
+    for field_name, coords in yee_grid.items():
+        x, y, z = coords.to_list
+        shape = (len(x), len(y), len(z), num_freqs)
+        values = (1 + 1j) * np.random.random(shape)
+        data_dict[field_name] = ScalarFieldData(x=x, y=y, z=z, f=monitor.freqs, values=values)
+
+    return td.SimulationData(simulation=sim, monitor_data={"field": FieldData(data_dict=data_dict)})
+
+
+def colocate_interp(field_data, x, y, z) -> xr.Dataset:
+    """Reference colocation using ``xarray.DataArray.interp`` along each axis."""
+    coord_val_map = {"x": x, "y": y, "z": z}
+    centered_data_dict = {}
+    for field_name, scalar_data in field_data.data_dict.items():
+        data_array = scalar_data.data
+        for coord_name in "xyz":
+            if len(data_array.coords[coord_name]) <= 1:
+                coord_kwargs = {coord_name: coord_val_map[coord_name]}
+                data_array = data_array.assign_coords(**coord_kwargs)
+                data_array = data_array.isel(**{coord_name: 0})
+            else:
+                data_array = data_array.interp(**{coord_name: coord_val_map[coord_name]})
+        centered_data_dict[field_name] = data_array
+    return xr.Dataset(centered_data_dict)
+
+
+def test_colocate_centers():
+    sim_data = make_field_data()
+    field_data = sim_data.monitor_data["field"]
+    centers = sim_data.simulation.discretize(sim_data.simulation.monitors[0]).centers
+
+    fields = sim_data.at_centers("field")
+    fields_interp = colocate_interp(field_data, centers.x, centers.y, centers.z)
+
+    for field_name in field_data.data_dict.keys():
+        assert fields[field_name].dims == fields_interp[field_name].dims
+        assert np.allclose(fields[field_name], fields_interp[field_name], equal_nan=True)
+
+
+def test_colocate_points():
+    sim_data = make_field_data()
+    field_data = sim_data.monitor_data["field"]
+
+    # arbitrary points, including out of bounds locations and a scalar coordinate
+    x = np.linspace(-1.5, 1.5, 7)
+    y = np.linspace(-0.7, 0.3, 5)
+    z = 0.1
+
+    fields = field_data.colocate(x, y, z)
+    fields_interp = colocate_interp(field_data, x, y, z)
+
+    for field_name in field_data.data_dict.keys():
+        assert fields[field_name].dims == fields_interp[field_name].dims
+        assert np.allclose(fields[field_name], fields_interp[field_name], equal_nan=True)
+
+
+def test_colocate_speed():
+
+    sim_data = make_field_data(num_freqs=10, num_cells=60)
+    field_data = sim_data.monitor_data["field"]
+    centers = sim_data.simulation.discretize(sim_data.simulation.monitors[0]).centers
+
+    time_start = time()
+    fields_interp = colocate_interp(field_data, centers.x, centers.y, centers.z)
+    time_interp = time() - time_start
+
+    time_start = time()
+    fields = field_data.colocate(centers.x, centers.y, centers.z)
+    time_colocate = time() - time_start
+
+    print(f"interp: {time_interp:.2e} seconds \t colocate: {time_colocate:.2e} seconds")
+    for field_name in field_data.data_dict.keys():
+        assert np.allclose(fields[field_name], fields_interp[field_name], equal_nan=True)
+
+
+def test_plot_field_slab():
+    sim_data = make_field_data()
+    freq = sim_data.simulation.monitors[0].freqs[1]
+    position = 0.23
+
+    # reference: colocate the whole volume, then interpolate at the plane
+    fields = sim_data.at_centers("field")
+    intensity = sum(abs(fields[field]) ** 2 for field in ("Ex", "Ey", "Ez"))
+    intensity = intensity.sel(f=freq).interp(y=position)
+
+    slab_data, slab_centers = sim_data._field_slab(
+        field_monitor_name="field",
+        field_names=("Ex", "Ey", "Ez"),
+        axis=1,
+        position=position,
+        freq=freq,
+    )
+    assert all(len(scalar_data.y) <= 3 for scalar_data in slab_data.data_dict.values())
+    fields_slab = slab_data.colocate(x=slab_centers.x, y=slab_centers.y, z=slab_centers.z)
+    intensity_slab = sum(abs(fields_slab[field]) ** 2 for field in ("Ex", "Ey", "Ez"))
+    intensity_slab = intensity_slab.sel(f=freq).interp(y=position)
+
+    assert np.allclose(intensity, intensity_slab, equal_nan=True)
+
+    sim_data.plot_field("field", "int", y=position, freq=freq)
+    sim_data.plot_field("field", "Ez", z=0, freq=freq, val="abs")
+
+
+def apply_syms_interp(field_data, new_grid, sym_center, symmetry):
+    """Reference symmetry expansion using ``xarray.DataArray.interp`` along each axis."""
+    component_sym_dict = {
+        "Ex": [-1, 1, 1],
+        "Ey": [1, -1, 1],
+        "Ez": [1, 1, -1],
+        "Hx": [1, -1, -1],
+        "Hy": [-1, 1, -1],
+        "Hz": [-1, -1, 1],
+    }
+    new_data_dict = {}
+    for field, scalar_data in field_data.data_dict.items():
+        new_data = scalar_data.data
+        yee_coords = new_grid.yee.grid_dict[field].to_list
+        zipped = zip("xyz", yee_coords, sym_center, symmetry)
+        for dim, (dim_name, coords, center, sym) in enumerate(zipped):
+            if sym == 0:
+                continue
+            flip_inds = np.where(coords < center)[0]
+            coords_interp = np.copy(coords)
+            coords_interp[flip_inds] = 2 * center - coords[flip_inds]
+            new_data = new_data.interp({dim_name: coords_interp}, kwargs={"fill_value": 0.0})
+            new_data = new_data.assign_coords({dim_name: coords})
+            new_data[{dim_name: flip_inds}] *= sym * component_sym_dict[field][dim]
+        new_data_dict[field] = type(scalar_data)(values=new_data.values, **new_data.coords)
+    return type(field_data)(data_dict=new_data_dict)
+
+
+def make_sym_field_data(offset: float = 0.0):
+    """Simulation with symmetries and random field data in the symmetry-reduced monitor region."""
+
+    monitor = FieldMonitor(size=(2, 2, 2), freqs=[1e14, 2e14], name="field")
+    sim = td.Simulation(
+        size=(4, 4, 4),
+        grid_size=(0.2, list(np.linspace(0.1, 0.3, 20)), 0.2),
+        monitors=[monitor],
+        symmetry=(1, -1, 0),
+        run_time=1e-12,
+    )
+    yee_grid = sim.discretize(sim.min_sym_box(monitor)).yee.grid_dict
+
+    data_dict = {}
+    for field_name, coords in yee_grid.items():
+        x, y, z = coords.to_list
+        values = (1 + 1j) * np.random.random((len(x), len(y), len(z), 2))
+        data_dict[field_name] = ScalarFieldData(
+            x=x + offset, y=y, z=z, f=monitor.freqs, values=values
+        )
+
+    return sim, FieldData(data_dict=data_dict)
+
+
+def test_apply_syms():
+
+    # mirrored grid, expanded by reflecting indices
+    sim, field_data = make_sym_field_data()
+    new_grid = sim.discretize(sim.monitors[0])
+    fields = field_data.apply_syms(new_grid, sim.center, sim.symmetry)
+    fields_interp = apply_syms_interp(field_data, new_grid, sim.center, sim.symmetry)
+    for field_name, scalar_data in fields.data_dict.items():
+        assert np.allclose(scalar_data.values, fields_interp.data_dict[field_name].values)
+
+    # data not on the mirrored grid, falls back to interpolation
+    sim, field_data = make_sym_field_data(offset=0.01)
+    fields = field_data.apply_syms(new_grid, sim.center, sim.symmetry)
+    fields_interp = apply_syms_interp(field_data, new_grid, sim.center, sim.symmetry)
+    for field_name, scalar_data in fields.data_dict.items():
+        assert np.allclose(scalar_data.values, fields_interp.data_dict[field_name].values)
+
+
+@clear_tmp
+def test_precision():
+    path = "tests/tmp/sim_data.hdf5"
+    sim_data = make_field_data(num_freqs=10, num_cells=40)
+    sim_data.to_file(path)
+
+    def field_bytes(sim_data):
+        field_data = sim_data.monitor_data["field"]
+        return sum(scalar_data.values.nbytes for scalar_data in field_data.data_dict.values())
+
+    # data stored in double precision, loaded in single precision
+    sim_data_double = td.SimulationData.from_file(path)
+    sim_data_single = td.SimulationData.from_file(path, precision="single")
+    for field_name, scalar_data in sim_data_single.monitor_data["field"].data_dict.items():
+        assert scalar_data.values.dtype == np.complex64
+        values_double = sim_data_double.monitor_data["field"].data_dict[field_name].values
+        assert np.allclose(scalar_data.values, values_double, rtol=1e-6)
+    assert 2 * field_bytes(sim_data_single) == field_bytes(sim_data_double)
+
+    print(
+        f"double: {field_bytes(sim_data_double):.1e} bytes \t "
+        f"single: {field_bytes(sim_data_single):.1e} bytes"
+    )
+
+    # data stored in single precision stays in single precision
+    path_single = "tests/tmp/sim_data_single.hdf5"
+    sim_data.to_file(path_single, precision="single")
+    sim_data_single = td.SimulationData.from_file(path_single)
+    assert field_bytes(sim_data_single) == field_bytes(sim_data_double) // 2
+    colocated = sim_data_single.at_centers("field")
+    assert all(colocated[field].dtype == np.complex64 for field in colocated)
+
+    # unless loaded in double precision
+    sim_data_double = td.SimulationData.from_file(path_single, precision="double")
+    assert field_bytes(sim_data_double) == 2 * field_bytes(sim_data_single)
+
+
+def test_normalize_spectrum_cache(monkeypatch):
+    sim_data = make_field_data()
+
+    num_calls = []
+    spectrum = td.GaussianPulse.spectrum
+
+    def spectrum_count(self, times, freqs, dt):
+        num_calls.append(1)
+        return spectrum(self, times, freqs, dt)
+
+    monkeypatch.setattr(td.GaussianPulse, "spectrum", spectrum_count)
+    sim_data.normalize()
+
+    # all of the field components share the same frequencies
+    assert len(num_calls) == 1
+
+
+@clear_tmp
+def test_normalize_inplace():
+    path = "tests/tmp/sim_data.hdf5"
+    sim_data = make_field_data(num_freqs=10, num_cells=40)
+    sim_data.to_file(path)
+    data_bytes = sum(
+        scalar_data.values.nbytes
+        for scalar_data in sim_data.monitor_data["field"].data_dict.values()
+    )
+
+    # normalizing while loading gives the same data as normalizing a copy after loading
+    sim_data_norm = td.SimulationData.from_file(path, normalize_index=None).normalize(0)
+    tracemalloc.start()
+    sim_data_load = td.SimulationData.from_file(path, normalize_index=0)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sim_data_load.normalize_index == 0
+    assert sim_data_load == sim_data_norm
+
+    print(f"data: {data_bytes:.1e} bytes \t peak while loading: {peak_bytes:.1e} bytes")
+
+
+@clear_tmp
+def test_lazy_load():
+    path = "tests/tmp/sim_data.hdf5"
+    sim_data = make_field_data(num_freqs=10, num_cells=40)
+    sim_data.to_file(path)
+    sim_data_norm = td.SimulationData.from_file(path, normalize_index=0)
+
+    # values are kept in the file, and normalized when they are read
+    sim_data_lazy = td.SimulationData.from_file(path, normalize_index=0, lazy=True)
+    field_data = sim_data_lazy.monitor_data["field"]
+    field_data_norm = sim_data_norm.monitor_data["field"]
+    for field_name, scalar_data in field_data.data_dict.items():
+        values_norm = field_data_norm.data_dict[field_name].values
+        assert isinstance(scalar_data.values, LazyValues)
+        assert np.allclose(scalar_data.values[:, 2, :, 3], values_norm[:, 2, :, 3])
+        assert np.allclose(scalar_data.data.values, values_norm)
+
+        # selecting a plane reads only that plane
+        isel_kwargs = dict(y=2, f=slice(None, None, 3))
+        plane_data = scalar_data.isel(**isel_kwargs)
+        plane_data_norm = field_data_norm.data_dict[field_name].isel(**isel_kwargs)
+        assert np.allclose(plane_data.values, plane_data_norm.values)
+        assert plane_data.values.shape == values_norm[:, 2:3, :, ::3].shape
+
+
+@clear_tmp
+def test_lazy_load_file():
+    path = "tests/tmp/sim_data.hdf5"
+    make_field_data(num_freqs=4, num_cells=10).to_file(path)
+    sim_data_norm = td.SimulationData.from_file(path, normalize_index=0)
+
+    with td.SimulationData.from_file(path, normalize_index=0, lazy=True) as sim_data_lazy:
+        field_data = sim_data_lazy.monitor_data["field"]
+        assert field_data.json() == sim_data_norm.monitor_data["field"].json()
+        assert len(sim_data_lazy.json()) == len(sim_data_norm.json())
+
+        # copies read the values from the file
+        for sim_data_copy in (
+            copy.deepcopy(sim_data_lazy),
+            sim_data_lazy.copy(deep=True),
+            pickle.loads(pickle.dumps(sim_data_lazy)),
+        ):
+            values = sim_data_copy.monitor_data["field"].data_dict["Ex"].values
+            assert isinstance(values, np.ndarray)
+            assert sim_data_copy == sim_data_norm
+
+    # the file is closed at the end of the with statement
+    with pytest.raises(ValueError):
+        np.array(field_data.data_dict["Ex"].values)
+    with h5py.File(path, "a"):
+        pass
+
+    # the file holding the values is replaced, and closed
+    sim_data_lazy = td.SimulationData.from_file(path, normalize_index=0, lazy=True)
+    sim_data_lazy.to_file(path)
+    assert not sim_data_lazy._lazy_values()
+    assert td.SimulationData.from_file(path) == sim_data_norm
+    with h5py.File(path, "a"):
+        pass
+
+    # other files are written to like before, keeping their contents
+    path_other = "tests/tmp/sim_data_other.hdf5"
+    with h5py.File(path_other, "w") as f_handle:
+        f_handle.create_dataset("extra", data=[1, 2, 3])
+    with td.SimulationData.from_file(path, lazy=True) as sim_data_lazy:
+        sim_data_lazy.to_file(path_other)
+        assert len(sim_data_lazy._lazy_values()) == 6
+    with h5py.File(path_other, "r") as f_handle:
+        assert list(f_handle["extra"]) == [1, 2, 3]
+    assert td.SimulationData.from_file(path_other) == sim_data_norm
+
+    # the file is also closed if loading fails
+    with pytest.raises(DataError):
+        td.SimulationData.from_file(path, normalize_index=1, lazy=True)
+    with h5py.File(path, "a"):
+        pass
+
+
+@clear_tmp
+def test_batch_data_cache():
+    task_paths = {}
+    for i in range(4):
+        task_paths[f"task{i}"] = f"tests/tmp/sim_data_{i}.hdf5"
+        sim_data = make_field_data(num_freqs=2, num_cells=10).copy(update=dict(log_string="log"))
+        sim_data.to_file(task_paths[f"task{i}"])
+    task_ids = {task_name: None for task_name in task_paths}
+
+    # prefetching gives the data in the same order as loading one by one
+    batch_data = td.web.container.BatchData(task_paths=task_paths, task_ids=task_ids)
+    items_prefetch = list(batch_data.items(num_prefetch=2))
+    batch_data = td.web.container.BatchData(task_paths=task_paths, task_ids=task_ids)
+    items = list(batch_data.items(num_prefetch=0))
+    assert [task_name for task_name, _ in items_prefetch] == list(task_paths)
+    for (_, sim_data_prefetch), (_, sim_data) in zip(items_prefetch, items):
+        assert sim_data_prefetch == sim_data
+
+    # only the two most recently used fit in the cache
+    nbytes = items[0][1].nbytes
+    batch_data = td.web.container.BatchData(
+        task_paths=task_paths, task_ids=task_ids, cache_size_bytes=2.5 * nbytes
+    )
+    sim_datas = [batch_data[task_name] for task_name in task_paths]
+    assert batch_data["task3"] is sim_datas[3]
+    assert batch_data["task2"] is sim_datas[2]
+    assert batch_data["task0"] is not sim_datas[0]
+
+
+@clear_tmp
+def test_batch_data_copy():
+    """BatchData can be copied and pickled, including the data it keeps in memory."""
+    task_paths = {"task0": "tests/tmp/sim_data_0.hdf5"}
+    sim_data = make_field_data(num_freqs=2, num_cells=10).copy(update=dict(log_string="log"))
+    sim_data.to_file(task_paths["task0"])
+    batch_data = td.web.container.BatchData(task_paths=task_paths, task_ids={"task0": None})
+    sim_data = batch_data["task0"]
+
+    for batch_data_copy in (
+        copy.deepcopy(batch_data),
+        batch_data.copy(deep=True),
+        pickle.loads(pickle.dumps(batch_data)),
+    ):
+        assert batch_data_copy == batch_data
+        assert batch_data_copy["task0"] == sim_data
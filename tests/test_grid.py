@@ -213,3 +213,38 @@ def test_sim_discretize_plane():
     assert np.all(subgrid.centers.x == np.array([-1.5, -0.5, 0.5, 1.5]))
     assert np.all(subgrid.centers.y == np.array([-1.5, -0.5, 0.5, 1.5]))
     assert np.all(subgrid.centers.z == np.array([0.5]))
+
+
+def test_time_mesh():
+
+    for run_time in (1e-13, 3e-13, 1e-12):
+        sim = td.Simulation(size=(4, 4, 4), grid_size=(0.1, 0.1, 0.1), run_time=run_time)
+        dt = sim.dt
+        times = np.arange(0.0, run_time + dt, dt)
+        time_mesh = sim.time_mesh
+
+        assert sim.num_time_steps == len(times)
+        assert np.array_equal(np.array(time_mesh), times)
+        assert np.array_equal(time_mesh[10:-10:3], times[10:-10:3])
+        assert np.array_equal(time_mesh[[0, 5, -1]], times[[0, 5, -1]])
+        assert time_mesh[-1] == times[-1]
+
+        values = np.concatenate((times[::7], times[::11] + dt / 3, [-1.0, 1.0]))
+        for side in ("left", "right"):
+            inds = time_mesh.searchsorted(values, side=side)
+            assert np.array_equal(inds, np.searchsorted(times, values, side=side))
+
+        monitors = [
+            td.FluxTimeMonitor(size=(1, 1, 0), name="all"),
+            td.FluxTimeMonitor(size=(1, 1, 0), start=times[10], stop=times[50], name="exact"),
+            td.FluxTimeMonitor(size=(1, 1, 0), start=dt / 2, stop=run_time / 2, name="between"),
+            td.FluxTimeMonitor(size=(1, 1, 0), start=times[20], stop=times[20], name="single"),
+            td.FluxTimeMonitor(size=(1, 1, 0), start=2 * run_time, name="after"),
+        ]
+        for monitor in monitors:
+            assert monitor.time_inds(time_mesh) == monitor.time_inds(times)
+
+        source_time = td.GaussianPulse(freq0=2e14, fwidth=1e14)
+        freqs = np.linspace(1e14, 3e14, 11)
+        spectrum = source_time.spectrum(time_mesh, freqs, dt)
+        assert np.allclose(spectrum, source_time.spectrum(times, freqs, dt))
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import numpy as np
 import pydantic
@@ -149,3 +151,72 @@ def test_dispersion_set_wvg_range():
     fitter.wvl_range = [wvl_min, wvl_max]
     assert len(fitter.freqs) < num_data
     medium, rms = fitter.fit(num_tries=2)
+
+
+def make_field_data_plotly(num_points: int = 10):
+    """Plotly component of random field data on a grid of ``num_points`` along each axis."""
+    plotly_data = pytest.importorskip("tidy3d.plugins.plotly.data")
+    coords = np.linspace(-1, 1, num_points)
+    scalar_data = ScalarFieldData(
+        x=coords,
+        y=coords,
+        z=coords,
+        f=[1e14, 2e14],
+        values=np.random.random((num_points,) * 3 + (2,)),
+    )
+    field_data = FieldData(data_dict={"Ex": scalar_data, "Ey": scalar_data})
+    return plotly_data.FieldDataPlotly(data=field_data, monitor_name="field")
+
+
+def test_plotly_figure_cache(monkeypatch):
+    """make sure the figures are found by the state they are made from"""
+    component = pytest.importorskip("tidy3d.plugins.plotly.component")
+    field_plotly = make_field_data_plotly()
+
+    field_plotly.cs_val = -0.1
+    fig = field_plotly.make_figure()
+    assert field_plotly.make_figure() is fig
+
+    # positions nearest to the same stored coordinate give the same figure
+    field_plotly.cs_val = -0.12
+    assert field_plotly.make_figure() is fig
+    field_plotly.cs_val = 1.0
+    fig_edge = field_plotly.make_figure()
+    assert fig_edge is not fig
+    field_plotly.field_val = "Ey"
+    assert field_plotly.make_figure() is not fig_edge
+    field_plotly.field_val = "Ex"
+    assert field_plotly.make_figure() is fig_edge
+
+    # the least recently used figures are dropped
+    monkeypatch.setattr(component, "FIGURE_CACHE_SIZE", 2)
+    num_made = []
+
+    def make_figure():
+        num_made.append(1)
+        return len(num_made)
+
+    field_plotly = make_field_data_plotly()
+    for key in ("a", "b", "a", "c", "a", "b"):
+        field_plotly.cached_figure(key, make_figure)
+    assert len(num_made) == 4
+    assert list(field_plotly._figure_cache) == ["a", "b"]
+
+    # components keeping figures can be copied
+    field_plotly_copy = field_plotly.copy(deep=True)
+    assert list(field_plotly_copy._figure_cache) == ["a", "b"]
+    assert copy.deepcopy(field_plotly) == field_plotly
+
+
+def test_plotly_heatmap_downsample(monkeypatch):
+    """make sure field heatmaps have at most MAX_HEATMAP_POINTS along each axis"""
+    plotly_data = pytest.importorskip("tidy3d.plugins.plotly.data")
+    field_plotly = make_field_data_plotly(num_points=10)
+
+    fig = field_plotly.plotly(field="Ex", val="abs", freq=100, z=0)
+    assert len(fig.data[0].x) == 10 and len(fig.data[0].y) == 10
+
+    monkeypatch.setattr(plotly_data, "MAX_HEATMAP_POINTS", 4)
+    fig = field_plotly.plotly(field="Ex", val="abs", freq=100, z=0)
+    assert np.allclose(fig.data[0].x, np.linspace(-1, 1, 10)[::3])
+    assert fig.data[0].z.shape == (4, 4)
@@ -262,3 +262,32 @@ def test_intersection_with_inside():
                     if shape.covers(Point(xp[i], yp[j])):
                         res_inter = True
                 assert res_inter == res_inside
+
+
+def test_cached_sections():
+    """Make sure the cross sections at many heights at once and the stored ones are the
+    same as computed one by one
+    """
+    vertices = convert_valid_polygon(np.random.random((10, 2)) * 10)
+    s = setup_polyslab(vertices, 0.0, 0.0, (0, 1))
+    _, max_dist = s._crossing_detection(s.base_polygon, -100)
+    s = setup_polyslab(vertices, 0.0, np.pi / 4, (0, max_dist * 0.95))
+
+    # all heights at once
+    dists = -np.linspace(0, s.length, 7) * s._tanq
+    vertices_heights = s._shift_vertices_heights(s.base_polygon, dists)
+    for dist, vertices_dist in zip(dists, vertices_heights):
+        assert np.allclose(vertices_dist, s._shift_vertices(s.base_polygon, dist)[0])
+
+    # inside on a grid is the same as point by point
+    xs = np.linspace(-1, 11, 13)
+    zs = np.linspace(-0.1, s.length + 0.1, 5)
+    x, y, z = np.meshgrid(xs, xs, zs, indexing="ij")
+    inside = s.inside(x, y, z)
+    for index in np.ndindex(x.shape):
+        assert inside[index] == s.inside(x[index], y[index], z[index])
+
+    # stored side cuts are not changed by the caller
+    shapes = s.intersections(x=5)
+    shapes.append(Point(0, 0))
+    assert len(s.intersections(x=5)) == len(shapes) - 1
@@ -0,0 +1,516 @@
+""" tests of the web interface that do not connect to the server, by replacing the requests """
+import asyncio
+import hashlib
+import os
+import shutil
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import tidy3d as td
+import tidy3d.web.asyncapi as asyncapi
+import tidy3d.web.httputils as http
+import tidy3d.web.s3utils as s3utils
+import tidy3d.web.webapi as web
+import tidy3d.web.container as container
+from tidy3d.web.config import DEFAULT_CONFIG
+from tidy3d.web.container import Batch, Job
+from tidy3d.web.task import Folder
+
+from .utils import SIM_MONITORS as SIM
+from .utils import clear_tmp
+
+
+def make_batch(num_tasks: int = 4, num_workers: int = 2) -> Batch:
+    """Batch with jobs that look like they were uploaded, with task_id ``'id{i}'``."""
+    simulations = {f"task{i}": SIM for i in range(num_tasks)}
+    batch = Batch(simulations=simulations, num_workers=num_workers)
+    batch.jobs = {
+        task_name: Job(simulation=SIM, task_name=task_name, task_id=f"id{i}")
+        for i, task_name in enumerate(simulations)
+    }
+    return batch
+
+
+def test_shared_session():
+    """All threads get the same session, which is only created once."""
+    sessions = []
+
+    def get_session():
+        sessions.append(http.get_session())
+
+    threads = [threading.Thread(target=get_session) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sessions) == 8
+    assert all(session is sessions[0] for session in sessions)
+    assert http.SESSION is sessions[0]
+
+
+def test_relogin_once(monkeypatch):
+    """When several requests find the credentials expired at once, only one logs in again."""
+    monkeypatch.setattr(DEFAULT_CONFIG, "auth", {"accessToken": "expired"})
+    num_logins = []
+
+    def get_credentials():
+        num_logins.append(1)
+        time.sleep(0.01)
+        DEFAULT_CONFIG.auth = {"accessToken": "new"}
+
+    monkeypatch.setattr(http, "get_credentials", get_credentials)
+
+    # all requests are made with the expired token before any of them logs in again
+    barrier = threading.Barrier(4)
+
+    @http.handle_response
+    def request():
+        token = http.get_headers()["Authorization"]
+        if token == "Bearer expired":
+            barrier.wait()
+            return SimpleNamespace(status_code=401)
+        return SimpleNamespace(status_code=200, json=lambda: {"data": token})
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(request())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["Bearer new"] * 4
+    assert len(num_logins) == 1
+
+
+def test_map_jobs():
+    """Every job is processed, by at most ``num_workers`` threads at once."""
+    batch = make_batch(num_tasks=6, num_workers=2)
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+    task_ids = []
+
+    def func(job):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+            task_ids.append(job.task_id)
+
+    batch._map_jobs(func)
+    assert sorted(task_ids) == [f"id{i}" for i in range(6)]
+    assert max_running[0] == 2
+
+
+def test_map_jobs_raises():
+    """An exception raised for one of the jobs is raised by ``_map_jobs``."""
+    batch = make_batch()
+
+    def func(job):
+        if job.task_id == "id2":
+            raise ValueError(job.task_id)
+
+    with pytest.raises(ValueError, match="id2"):
+        batch._map_jobs(func)
+
+
+def test_get_folder_statuses(monkeypatch):
+    """The statuses of all tasks in a folder are read from a single request."""
+    requests = []
+
+    def get(method):
+        requests.append(method)
+        return [{"taskId": "id0", "status": "running"}, {"taskId": "id1"}]
+
+    monkeypatch.setattr(web.http, "get", get)
+    statuses = web._get_folder_statuses(Folder(projectName="default", projectId="folder_id"))
+    assert statuses == {"id0": "running", "id1": None}
+    assert requests == ["tidy3d/projects/folder_id/tasks"]
+
+
+def test_batch_statuses(monkeypatch):
+    """Tasks not found in the folder are queried individually."""
+    batch = make_batch(num_tasks=3)
+    folder_statuses = {"id0": "success", "id1": "queued", "other": "error"}
+    monkeypatch.setattr(web, "_get_folder_statuses", lambda folder: folder_statuses)
+    monkeypatch.setattr(web, "get_info", lambda task_id: SimpleNamespace(status="draft"))
+    statuses = batch._get_statuses(folder=None)
+    assert statuses == {"task0": "success", "task1": "queued", "task2": "draft"}
+
+
+def test_next_refresh_time():
+    """The time between status queries grows geometrically up to the maximum."""
+    refresh_times = [web.REFRESH_TIME]
+    for _ in range(20):
+        refresh_times.append(web.next_refresh_time(refresh_times[-1]))
+    assert refresh_times[1] == web.REFRESH_TIME * web.REFRESH_BACKOFF
+    assert all(t1 >= t0 for t0, t1 in zip(refresh_times[:-1], refresh_times[1:]))
+    assert refresh_times[-1] == web.MAX_REFRESH_TIME
+
+
+def test_batch_monitor_backoff(monkeypatch):
+    """Monitoring a batch waits longer while the statuses do not change, and goes back to the
+    shortest wait as soon as they do."""
+    batch = make_batch(num_tasks=2)
+    statuses = [["queued", "queued"]] * 4 + [["running", "queued"]] * 2 + [["success"] * 2]
+    statuses = iter(statuses)
+    monkeypatch.setattr(web, "_query_or_create_folder", lambda folder_name: None)
+    monkeypatch.setattr(
+        web, "_get_folder_statuses", lambda folder: dict(zip(("id0", "id1"), next(statuses)))
+    )
+    sleep_times = []
+    monkeypatch.setattr(container.time, "sleep", sleep_times.append)
+
+    batch.monitor()
+
+    refresh_times = [web.REFRESH_TIME]
+    for _ in range(3):
+        refresh_times.append(web.next_refresh_time(refresh_times[-1]))
+    assert sleep_times == refresh_times + [
+        web.REFRESH_TIME,
+        web.next_refresh_time(web.REFRESH_TIME),
+    ]
+
+
+class FakeS3Client:
+    """Stands in for an s3 client holding a single object, records the byte ranges requested and
+    fails the requests for the ranges starting at ``fail_starts``."""
+
+    def __init__(self, data: bytes, fail_starts=()):
+        self.data = data
+        self.etag = f'"{hashlib.md5(data).hexdigest()}"'
+        self.fail_starts = set(fail_starts)
+        self.ranges = []
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.data), "ETag": self.etag}
+
+    def get_object(self, Bucket, Key, Range, IfMatch):
+        assert IfMatch == self.etag, "object changed"
+        start, end = (int(byte) for byte in Range[len("bytes=") :].split("-"))
+        if start in self.fail_starts:
+            raise ConnectionError(f"failed to download range {Range}")
+        self.ranges.append((start, end))
+        body = self.data[start : end + 1]
+        blocks = [body[i : i + 3] for i in range(0, len(body), 3)]
+        return {"Body": SimpleNamespace(iter_chunks=lambda size: iter(blocks))}
+
+
+@clear_tmp
+def test_download_resumable(monkeypatch):
+    """An interrupted download only fetches the missing ranges when it is resumed."""
+    monkeypatch.setattr(s3utils, "DOWNLOAD_CHUNK_SIZE", 10)
+    path = "tests/tmp/monitor_data.hdf5"
+    client = FakeS3Client(bytes(range(95)), fail_starts=(30, 70))
+
+    with pytest.raises(ConnectionError):
+        s3utils.download_resumable(client, "bucket", "key", path, 95, client.etag)
+    assert not os.path.exists(path)
+    assert os.path.exists(f"{path}.part")
+    ranges_done = set(client.ranges)
+    assert ranges_done and (30, 39) not in ranges_done
+
+    client.fail_starts = set()
+    client.ranges = []
+    downloaded = []
+    s3utils.download_resumable(
+        client, "bucket", "key", path, 95, client.etag, callback=downloaded.append
+    )
+    ranges_all = {(start, min(start + 9, 94)) for start in range(0, 95, 10)}
+    assert sorted(client.ranges) == sorted(ranges_all - ranges_done)
+    assert (30, 39) in client.ranges and (70, 79) in client.ranges
+    # the bytes downloaded before the interruption are reported first
+    assert downloaded[0] == sum(end - start + 1 for start, end in ranges_done)
+    assert sum(downloaded) == 95
+    with open(path, "rb") as f:
+        assert f.read() == client.data
+    assert not os.path.exists(f"{path}.part") and not os.path.exists(f"{path}.part.json")
+
+
+@clear_tmp
+def test_download_resumable_changed(monkeypatch):
+    """An interrupted download starts over if the object changed in the meantime."""
+    monkeypatch.setattr(s3utils, "DOWNLOAD_CHUNK_SIZE", 10)
+    path = "tests/tmp/monitor_data.hdf5"
+    client = FakeS3Client(bytes(range(50)), fail_starts=(20,))
+    with pytest.raises(ConnectionError):
+        s3utils.download_resumable(client, "bucket", "key", path, 50, client.etag)
+
+    client = FakeS3Client(bytes(range(100, 150)))
+    s3utils.download_resumable(client, "bucket", "key", path, 50, client.etag)
+    assert len(client.ranges) == 5
+    with open(path, "rb") as f:
+        assert f.read() == client.data
+
+
+@clear_tmp
+def test_download_skip(monkeypatch):
+    """A file that matches the object on s3 is not downloaded again."""
+    path = "tests/tmp/monitor_data.hdf5"
+    client = FakeS3Client(b"simulation data")
+    monkeypatch.setattr(web, "get_s3_user", lambda: (client, "bucket", "user_id"))
+
+    assert not s3utils.file_matches_object(path, len(client.data), client.etag)
+    assert web._download_s3_file("task_id", "monitor_data.hdf5", path) == len(client.data)
+    assert s3utils.file_matches_object(path, len(client.data), client.etag)
+    assert web._download_s3_file("task_id", "monitor_data.hdf5", path) is None
+    assert len(client.ranges) == 1
+
+    # same size but different contents, unless the object was uploaded in parts
+    with open(path, "wb") as f:
+        f.write(b"simulation date")
+    assert not s3utils.file_matches_object(path, len(client.data), client.etag)
+    assert s3utils.file_matches_object(path, len(client.data), '"0123-2"')
+    assert web._download_s3_file("task_id", "monitor_data.hdf5", path) == len(client.data)
+    with open(path, "rb") as f:
+        assert f.read() == client.data
+
+
+class FakeServer:
+    """Stands in for the server and the s3 storage, through the functions used by ``webapi``.
+    Each task goes through a few statuses as it is queried, and its results are a
+    :class:`.SimulationData` of the uploaded simulation with no monitor data."""
+
+    statuses = ("queued", "preprocess", "running", "postprocess", "success")
+
+    def __init__(self, monkeypatch):
+        self.tasks = {}
+        self.objects = {}
+        self.num_uploads = 0
+        self.lock = threading.Lock()
+        monkeypatch.setattr(web.http, "get", self.get)
+        monkeypatch.setattr(web.http, "post", self.post)
+        monkeypatch.setattr(web, "get_s3_user", lambda: (self, "bucket", "user_id"))
+        monkeypatch.setattr(web, "REFRESH_TIME", 0.001)
+
+    def get(self, method):
+        if method.startswith("tidy3d/project?"):
+            return {"projectName": "default", "projectId": "folder_id"}
+        if method == "tidy3d/projects/folder_id/tasks":
+            return [self.task_dict(task_id) for task_id in self.tasks]
+        task_id = method.split("/")[2]
+        return self.task_dict(task_id)
+
+    def post(self, method, data=None):
+        if method == "tidy3d/projects/folder_id/tasks":
+            with self.lock:
+                task_id = f"id{len(self.tasks)}"
+                self.tasks[task_id] = {"taskName": data["taskName"], "status": "draft"}
+            return {"taskId": task_id}
+        task_id = method.split("/")[2]
+        self.tasks[task_id]["status"] = self.statuses[0]
+        return {}
+
+    def task_dict(self, task_id):
+        """Info of a task, whose status advances every time it is queried."""
+        task = self.tasks[task_id]
+        status = task["status"]
+        if status in self.statuses[:-1]:
+            task["status"] = self.statuses[self.statuses.index(status) + 1]
+        return {"taskId": task_id, "taskName": task["taskName"], "status": status}
+
+    def put_object(self, Body, Bucket, Key):
+        with self.lock:
+            self.num_uploads += 1
+        simulation = td.Simulation.parse_raw(Body)
+        sim_data = td.SimulationData(simulation=simulation, monitor_data={}, log_string="log")
+        task_id = Key.split("/")[2]
+        path = f"tests/tmp/server_{task_id}.hdf5"
+        sim_data.to_file(path)
+        with open(path, "rb") as f:
+            self.objects[f"users/user_id/{task_id}/output/monitor_data.hdf5"] = f.read()
+        os.remove(path)
+        return {"ResponseMetadata": {"HTTPStatusCode": 200}}
+
+    def head_object(self, Bucket, Key):
+        data = self.objects[Key]
+        return {"ContentLength": len(data), "ETag": f'"{hashlib.md5(data).hexdigest()}"'}
+
+    def get_object(self, Bucket, Key, Range, IfMatch):
+        start, end = (int(byte) for byte in Range[len("bytes=") :].split("-"))
+        body = self.objects[Key][start : end + 1]
+        return {"Body": SimpleNamespace(iter_chunks=lambda size: iter([body]))}
+
+
+class SlowServer(FakeServer):
+    """:class:`FakeServer` taking ``latency`` seconds to answer each request and s3 upload, which
+    only counts the uploads."""
+
+    def __init__(self, monkeypatch, latency: float):
+        super().__init__(monkeypatch)
+        self.latency = latency
+
+    def get(self, method):
+        time.sleep(self.latency)
+        return super().get(method)
+
+    def post(self, method, data=None):
+        time.sleep(self.latency)
+        return super().post(method, data=data)
+
+    def put_object(self, Body, Bucket, Key):
+        time.sleep(self.latency)
+        with self.lock:
+            self.num_uploads += 1
+        return {"ResponseMetadata": {"HTTPStatusCode": 200}}
+
+
+def test_batch_upload_validates_once(monkeypatch):
+    """Each simulation of a batch is checked once when the batch is uploaded."""
+    server = SlowServer(monkeypatch, latency=0)
+    num_checks = []
+    validate_pre_upload = td.Simulation.validate_pre_upload
+
+    def count_checks(simulation):
+        num_checks.append(1)
+        validate_pre_upload(simulation)
+
+    monkeypatch.setattr(td.Simulation, "validate_pre_upload", count_checks)
+    batch = Batch(simulations={f"task{i}": SIM for i in range(5)}, num_workers=2)
+    batch.upload()
+    assert server.num_uploads == 5
+    assert len(num_checks) == 5
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TIDY3D_BENCHMARK"), reason="benchmark, set TIDY3D_BENCHMARK=1 to run it"
+)
+def test_batch_upload_benchmark(monkeypatch):
+    """Tasks uploaded per second by ``Batch.upload`` to a server with 20 ms of latency."""
+    num_tasks = 100
+    simulations = {f"task{i}": SIM for i in range(num_tasks)}
+    tasks_per_second = {}
+    for num_workers in (1, 8, 32):
+        server = SlowServer(monkeypatch, latency=0.02)
+        batch = Batch(simulations=simulations, num_workers=num_workers)
+        time_start = time.perf_counter()
+        batch.upload()
+        tasks_per_second[num_workers] = num_tasks / (time.perf_counter() - time_start)
+        assert server.num_uploads == num_tasks
+        print(f"num_workers={num_workers}: {tasks_per_second[num_workers]:.1f} tasks/s")
+
+    assert tasks_per_second[8] > 2 * tasks_per_second[1]
+
+
+def make_simulations(num_sims: int):
+    """Simulations that are all different, so they are stored separately in the cache."""
+    return {
+        f"task{i}": td.Simulation(size=(1, 1, 1 + i), grid_size=(0.1, 0.1, 0.1), run_time=1e-12)
+        for i in range(num_sims)
+    }
+
+
+def run_coroutine(coroutine):
+    """Run a coroutine in a new event loop, like asyncio.run, which needs python 3.7."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@clear_tmp
+def test_async_run(monkeypatch):
+    """Tasks run concurrently from one event loop, and are not run again if the cache is on."""
+    server = FakeServer(monkeypatch)
+    simulations = make_simulations(3)
+
+    async def run_all():
+        return await asyncio.gather(
+            *(
+                asyncapi.run(sim, task_name=task_name, path=f"tests/tmp/{task_name}.hdf5")
+                for task_name, sim in simulations.items()
+            )
+        )
+
+    sim_datas = run_coroutine(run_all())
+    assert [sim_data.simulation for sim_data in sim_datas] == list(simulations.values())
+    assert all(task["status"] == "success" for task in server.tasks.values())
+
+    cache = td.web.enable_cache(directory="tests/tmp/cache")
+    try:
+        run_coroutine(run_all())
+        assert server.num_uploads == 6
+        sim_datas = run_coroutine(run_all())
+        assert server.num_uploads == 6
+        assert cache.stats()["hits"] == 3
+        assert [sim_data.simulation for sim_data in sim_datas] == list(simulations.values())
+    finally:
+        td.web.disable_cache()
+        shutil.rmtree(cache.directory)
+
+
+@clear_tmp
+def test_batch_run_cache(monkeypatch):
+    """With the cache on, the data of all tasks of a batch is named after the tasks, and only the
+    tasks that were run have jobs and task ids."""
+    server = FakeServer(monkeypatch)
+    simulations = make_simulations(3)
+    path_dir = "tests/tmp"
+
+    cache = td.web.enable_cache(directory="tests/tmp/cache")
+    try:
+        Batch(simulations={"task1": simulations["task1"]}).run(path_dir=path_dir)
+        assert server.num_uploads == 1
+
+        batch = Batch(simulations=simulations, num_workers=2)
+        batch_data = batch.run(path_dir=path_dir)
+        assert server.num_uploads == 3
+        assert set(batch.jobs) == {"task0", "task2"}
+        assert batch_data.task_ids == {
+            "task0": batch.jobs["task0"].task_id,
+            "task1": None,
+            "task2": batch.jobs["task2"].task_id,
+        }
+        assert batch_data.task_paths == {
+            task_name: os.path.join(path_dir, f"{task_name}.hdf5") for task_name in simulations
+        }
+        for task_name, sim_data in batch_data.items():
+            assert sim_data.simulation == simulations[task_name]
+    finally:
+        td.web.disable_cache()
+        shutil.rmtree(cache.directory)
+
+
+@clear_tmp
+def test_async_batch_run(monkeypatch):
+    """An AsyncBatch runs only the tasks that are not in the cache."""
+    server = FakeServer(monkeypatch)
+    simulations = make_simulations(4)
+    path_dir = "tests/tmp"
+
+    batch = Batch(simulations=simulations, num_workers=2)
+    batch_data = run_coroutine(asyncapi.AsyncBatch(batch=batch).run(path_dir=path_dir))
+    assert server.num_uploads == 4
+    for task_name, sim_data in batch_data.items():
+        assert sim_data.simulation == simulations[task_name]
+
+    cache = td.web.enable_cache(directory="tests/tmp/cache")
+    try:
+        cache.put(simulations["task1"], path=batch_data.task_paths["task1"])
+        async_batch = asyncapi.AsyncBatch(batch=batch)
+        batch_data = run_coroutine(async_batch.run(path_dir=path_dir))
+        assert server.num_uploads == 7
+        assert batch_data.task_ids["task1"] is None
+        assert set(async_batch.batch.jobs) == {"task0", "task2", "task3"}
+        for task_name, job in async_batch.batch.jobs.items():
+            assert batch_data.task_ids[task_name] == job.task_id
+        assert batch_data.task_paths == {
+            task_name: os.path.join(path_dir, f"{task_name}.hdf5") for task_name in simulations
+        }
+        for task_name, sim_data in batch_data.items():
+            assert sim_data.simulation == simulations[task_name]
+
+        # all are in the cache now
+        batch_data = run_coroutine(asyncapi.AsyncBatch(batch=batch).run(path_dir=path_dir))
+        assert server.num_uploads == 7
+        assert all(task_id is None for task_id in batch_data.task_ids.values())
+    finally:
+        td.web.disable_cache()
+        shutil.rmtree(cache.directory)
@@ -1,4 +1,5 @@
 import os
+from functools import wraps
 
 from tidy3d import *
 import tidy3d as td
@@ -21,6 +22,7 @@ def clear_tmp(fn):
     if not os.path.exists(TMP_DIR):
         os.mkdir(TMP_DIR)
 
+    @wraps(fn)
     def new_fn(*args, **kwargs):
         clear_dir(TMP_DIR)
         return fn(*args, **kwargs)
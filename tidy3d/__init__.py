@@ -12,10 +12,10 @@ from .components import PMLParams, AbsorberParams
 from .components import DefaultPMLParameters, DefaultStablePMLParameters, DefaultAbsorberParameters
 
 # grid
-from .components import Grid, Coords
+from .components import Grid, Coords, TimeMesh
 
 # geometry
-from .components import Box, Sphere, Cylinder, PolySlab
+from .components import Box, Sphere, Cylinder, PolySlab, PolySlabGroup
 
 # medium
 from .components import Medium, PoleResidue, AnisotropicMedium, PEC, PECMedium
@@ -36,7 +36,7 @@ from .components import FieldMonitor, FieldTimeMonitor, FluxMonitor, FluxTimeMon
 from .components import ModeMonitor, ModeFieldMonitor
 
 # simulation
-from .components import Simulation
+from .components import Simulation, SimulationEstimate
 
 # data
 from .components import SimulationData, FieldData, FluxData, FluxTimeData
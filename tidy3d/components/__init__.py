@@ -6,10 +6,10 @@ from .pml import PMLParams, AbsorberParams
 from .pml import DefaultPMLParameters, DefaultStablePMLParameters, DefaultAbsorberParameters
 
 # grid
-from .grid import Grid, Coords
+from .grid import Grid, Coords, TimeMesh
 
 # geometry
-from .geometry import Box, Sphere, Cylinder, PolySlab
+from .geometry import Box, Sphere, Cylinder, PolySlab, PolySlabGroup
 from .geometry import Geometry
 
 # medium
@@ -32,7 +32,7 @@ from .monitor import Monitor, FluxMonitor, FluxTimeMonitor, ModeMonitor
 from .monitor import ModeFieldMonitor
 
 # simulation
-from .simulation import Simulation
+from .simulation import Simulation, SimulationEstimate
 
 # data
 from .data import SimulationData, FieldData, FluxData, ModeData, FluxTimeData
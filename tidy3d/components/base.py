@@ -1,6 +1,8 @@
 """global configuration / base class for pydantic models used to make simulation."""
 
 import json
+from functools import wraps
+from typing import Any, Callable, Dict, List
 
 import rich
 import pydantic
@@ -9,7 +11,7 @@ import numpy as np
 from pydantic.fields import ModelField
 
 from .types import ComplexNumber, NumpyArray, Literal
-from ..log import FileError
+from ..log import FileError, Tidy3dKeyError
 
 # default indentation (# spaces) in files
 INDENT = 4
@@ -32,6 +34,13 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         add_type_field(cls)
         cls.__doc__ = generate_docstring(cls)
 
+    # whether the model was made by ``construct_trusted`` or ``copy_trusted``, without validation
+    _trusted: bool = pydantic.PrivateAttr(False)
+
+    # values of the ``cached_property`` of the model, shared with the copies made by pydantic in
+    # validation, which have the same field values
+    _cached_properties: Dict[str, Any] = pydantic.PrivateAttr(default_factory=dict)
+
     class Config:  # pylint: disable=too-few-public-methods
         """Sets config for all :class:`Tidy3dBaseModel` objects.
 
@@ -61,6 +70,21 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             complex: lambda x: ComplexNumber(real=x.real, imag=x.imag),
         }
 
+    def __setattr__(self, name, value):
+        """Assign a field (with validation) and forget the cached properties of this model."""
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            # a new dict, as the old one may be shared with copies that keep the old field values
+            self._cached_properties = {}
+
+    def copy(self, **kwargs):
+        """Copy of the model, see ``pydantic.BaseModel.copy``. Copies with fields replaced by
+        ``update`` do not share the cached properties of the original."""
+        model = super().copy(**kwargs)
+        if kwargs.get("update"):
+            model._cached_properties = {}  # pylint:disable=protected-access
+        return model
+
     def help(self, methods: bool = False) -> None:
         """Prints message describing the fields and methods of a :class:`Tidy3dBaseModel`.
 
@@ -227,13 +251,17 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         """define == for checking whether two base models are equal unique indices based on hash."""
         return hash(self) == hash(other)
 
-    def _json_string(self, include_unset: bool = True) -> str:
+    def _json_string(self, include_unset: bool = True, indent: int = INDENT) -> str:
         """Returns string representation of a :class:`Tidy3dBaseModel`.
 
         Parameters
         ----------
         include_unset : bool = True
             Whether to include default fields in json string.
+        indent : int = 4
+            Number of spaces used to indent nested json objects and arrays.
+            If ``None``, the json string is written on a single line without any extra whitespace,
+            which is much smaller and faster to write for large objects.
 
         Returns
         -------
@@ -244,13 +272,198 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
         # put infinity and -infinity in quotes
         tmp_string = "<<TEMPORARY_INFINITY_STRING>>"
-        json_string = self.json(indent=INDENT, exclude_unset=exclude_unset)
+        separators = None if indent is not None else (",", ":")
+        json_string = self.json(indent=indent, separators=separators, exclude_unset=exclude_unset)
         json_string = json_string.replace("-Infinity", tmp_string)
         json_string = json_string.replace("Infinity", '"Infinity"')
         json_string = json_string.replace(tmp_string, '"-Infinity"')
 
         return json_string
 
+    @classmethod
+    def construct_trusted(cls, **kwargs):
+        """Make a :class:`Tidy3dBaseModel` without validating its fields, which is much faster for
+        generating many models. Validation is deferred to :meth:`validate_deferred`, which is called
+        before a :class:`.Simulation` is uploaded.
+
+        Parameters
+        ----------
+        **kwargs
+            Values of the fields, as they would be after validation (eg. :class:`Tidy3dBaseModel`
+            instances, not dictionaries). Missing fields take their default values.
+
+        Returns
+        -------
+        :class:`Tidy3dBaseModel`
+            An instance of the component class calling `construct_trusted`.
+
+        Example
+        -------
+        >>> box = Box.construct_trusted(center=(0.0, 0.0, 0.0), size=(1.0, 1.0, 1.0))
+        """
+        model = cls.construct(**kwargs)
+        model._trusted = True  # pylint:disable=protected-access
+        return model
+
+    def copy_trusted(self, update: Dict[str, Any]):
+        """Copy of a :class:`Tidy3dBaseModel` with some of its fields replaced, without validating
+        them. Fields that are not replaced are shared with the original.
+        Validation is deferred to :meth:`validate_deferred`.
+
+        Parameters
+        ----------
+        update : Dict[str, Any]
+            Mapping of field name to its new value, as it would be after validation.
+
+        Returns
+        -------
+        :class:`Tidy3dBaseModel`
+            Copy of the component with the fields in ``update`` replaced.
+
+        Example
+        -------
+        >>> sim_shifted = simulation.copy_trusted(update=dict(center=(1.0, 0.0, 0.0)))
+        """
+        model = self.copy(update=update)
+        model._trusted = True  # pylint:disable=protected-access
+        return model
+
+    def updated_copy(self, path: str = None, **kwargs):
+        """Copy of a :class:`Tidy3dBaseModel` with some fields replaced and validated.
+        The fields that are not replaced are shared with the original instead of being copied,
+        so that many variants of a large model take little time and memory.
+
+        Parameters
+        ----------
+        path : str = None
+            Path to the component to update, made of field names and indices into lists or
+            dictionaries separated by ``'/'``, eg. ``'structures/3/geometry'``.
+            The components along the path are copied, all other components are shared.
+            If ``None``, the fields of this component are updated.
+        **kwargs
+            New values of the fields of the component to update.
+
+        Returns
+        -------
+        :class:`Tidy3dBaseModel`
+            Copy of the component with the updated fields.
+
+        Note
+        ----
+        The components along the path are validated again, while the components they hold,
+        which are shared, are not.
+
+        Example
+        -------
+        >>> sim_source = simulation.updated_copy(sources=[source])
+        >>> sim_shifted = simulation.updated_copy(path="structures/0/geometry", center=(1, 0, 0))
+        """
+        if not path:
+            return self._validated_copy(update=kwargs)
+
+        field_name, _, sub_path = path.partition("/")
+        if field_name not in self.__fields__:
+            raise Tidy3dKeyError(f"'{type(self).__name__}' has no field '{field_name}'.")
+        value = getattr(self, field_name)
+
+        if isinstance(value, Tidy3dBaseModel):
+            new_value = value.updated_copy(path=sub_path, **kwargs)
+        elif isinstance(value, (list, tuple, dict)):
+            key, _, sub_path = sub_path.partition("/")
+            items = dict(value) if isinstance(value, dict) else list(value)
+            try:
+                key = key if isinstance(value, dict) else int(key)
+                items[key] = items[key].updated_copy(path=sub_path, **kwargs)
+            except (KeyError, IndexError, ValueError) as e:
+                raise Tidy3dKeyError(
+                    f"'{key}' not found in '{field_name}' of path '{path}'."
+                ) from e
+            new_value = items if isinstance(value, (list, dict)) else tuple(items)
+        else:
+            raise Tidy3dKeyError(f"Field '{field_name}' of path '{path}' is not a component.")
+
+        return self._validated_copy(update={field_name: new_value})
+
+    def _validated_copy(self, update: Dict[str, Any]):
+        """Copy with the fields in ``update`` replaced, validating all fields of this model.
+        Fields holding models are not validated again, so they are shared with the original."""
+        for field_name in update:
+            if field_name not in self.__fields__:
+                raise Tidy3dKeyError(f"'{type(self).__name__}' has no field '{field_name}'.")
+        return type(self)(**{**self.__dict__, **update})
+
+    @property
+    def is_trusted(self) -> bool:
+        """Whether this model or any model in its fields was made by :meth:`construct_trusted`
+        or :meth:`copy_trusted`, and so has not been validated yet."""
+        return self._trusted or any(_contains_trusted(value) for value in self.__dict__.values())
+
+    def validate_deferred(self):
+        """Validate a :class:`Tidy3dBaseModel` containing models made without validation by
+        :meth:`construct_trusted` or :meth:`copy_trusted`.
+
+        Returns
+        -------
+        :class:`Tidy3dBaseModel`
+            Validated model, equal to this one if it contains no trusted models.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If any field is invalid.
+        """
+        if not self.is_trusted:
+            return self
+        # validate the whole model from the json that would be written or uploaded
+        return self.parse_raw(self._json_string(indent=None))
+
+
+def cached_property(func: Callable) -> property:
+    """Property of a :class:`Tidy3dBaseModel` computed once per instance, for expensive
+    properties of components that are shared between many models (eg. geometry bounds).
+    The value is computed again after a field of the instance is assigned, but not after the
+    components it holds are modified in place, so it should only depend on the fields of the
+    instance that are not models themselves."""
+
+    @wraps(func)
+    def cached(self):
+        """Return the stored value, computing it first if needed."""
+        cache = self._cached_properties  # pylint:disable=protected-access
+        if func.__name__ not in cache:
+            cache[func.__name__] = func(self)
+        return cache[func.__name__]
+
+    return property(cached)
+
+
+def cache_states(value: Any) -> List[Dict[str, Any]]:
+    """The cached properties of each :class:`Tidy3dBaseModel` in ``value``, including the models
+    they hold. A model gets new cached properties when one of its fields is assigned, so values
+    computed from the models are still valid as long as these are the very same objects."""
+    if isinstance(value, Tidy3dBaseModel):
+        states = [value._cached_properties]  # pylint:disable=protected-access
+        return states + cache_states(list(value.__dict__.values()))
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        # skips the numbers, eg. of the vertices of many polygons, without a call for each
+        containers = (Tidy3dBaseModel, list, tuple, dict)
+        return [
+            state for item in value if isinstance(item, containers) for state in cache_states(item)
+        ]
+    return []
+
+
+def _contains_trusted(value: Any) -> bool:
+    """Whether ``value`` is, or holds, a :class:`Tidy3dBaseModel` that has not been validated."""
+    if isinstance(value, Tidy3dBaseModel):
+        return value.is_trusted
+    if isinstance(value, (list, tuple)):
+        return any(_contains_trusted(item) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_trusted(item) for item in value.values())
+    return False
+
 
 def add_type_field(cls):
     """Automatically place "type" field with model name in the model field dictionary."""
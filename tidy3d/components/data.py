@@ -2,8 +2,10 @@
 """Classes for Storing Monitor and Simulation Data."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Union, Optional, Tuple
 import logging
+import os
+import uuid
 
 import xarray as xr
 import numpy as np
@@ -11,14 +13,18 @@ import h5py
 import pydantic as pd
 
 from .types import Numpy, Direction, Array, numpy_encoding, Literal, Ax, Coordinate, Symmetry, Axis
+from .types import Precision, SINGLE_PRECISION_DTYPES, DOUBLE_PRECISION_DTYPES
 from .base import Tidy3dBaseModel
 from .simulation import Simulation
-from .grid import YeeGrid
+from .grid import YeeGrid, Coords
 from .viz import add_ax_if_none, equal_aspect
 from ..log import DataError, log
 
 # TODO: add warning if fields didnt fully decay
 
+# relative tolerance for matching reflected coordinates to the grid in ``apply_syms``
+GRID_INDS_RTOL = 1e-10
+
 
 # mapping of data coordinates to units for assigning .attrs to the xarray objects
 DIM_ATTRS = {
@@ -48,6 +54,69 @@ class Tidy3dDataArray(xr.DataArray):
         return abs(self)
 
 
+class LazyValues:
+    """Values of monitor data kept in an hdf5 file, which stays open while they are used. Only the
+    values selected by indexing with integers and slices (eg. ``values[:, :, 3, 0]``) are read,
+    in ``dtype``. Divisions by arrays broadcasting against the values, such as the normalization
+    by the source spectrum, are applied to the values when they are read."""
+
+    def __init__(self, dataset: h5py.Dataset, dtype: np.dtype = None):
+        """Values stored in the hdf5 ``dataset``, read with ``dtype`` (defaults to the stored)."""
+        self.dataset = dataset
+        self.dtype = np.dtype(dataset.dtype if dtype is None else dtype)
+        self.shape = dataset.shape
+        self.divisor = None
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the values."""
+        return len(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of all of the values once read."""
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def __itruediv__(self, divisor: Numpy) -> "LazyValues":
+        """Divide the values by ``divisor`` when they are read."""
+        divisor = np.asarray(divisor)
+        divisor = divisor.reshape((1,) * (self.ndim - divisor.ndim) + divisor.shape)
+        self.divisor = divisor if self.divisor is None else self.divisor * divisor
+        return self
+
+    def __getitem__(self, key) -> Numpy:
+        """Read the values selected by ``key``, made of integers and slices."""
+        key = key if isinstance(key, tuple) else (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+        values = np.asarray(self.dataset[key], dtype=self.dtype)
+        if self.divisor is not None:
+            # select the same entries of the divisor, along the axes it is not broadcast
+            divisor_key = tuple(
+                ind if size > 1 else (slice(None) if isinstance(ind, slice) else 0)
+                for ind, size in zip(key, self.divisor.shape)
+            )
+            values /= self.divisor[divisor_key]
+        return values
+
+    def __array__(self, dtype=None) -> Numpy:
+        """Read all of the values."""
+        values = self[()]
+        return values if dtype is None else values.astype(dtype)
+
+    def __deepcopy__(self, memo) -> Numpy:
+        """Deep copies read all of the values, so they do not depend on the file."""
+        return np.array(self)
+
+    def __reduce__(self):
+        """The values are read when pickled, and unpickled as an array."""
+        return np.asarray, (np.array(self),)
+
+    def close(self) -> None:
+        """Close the file holding the values, which can then no longer be read."""
+        if self.dataset.id.valid:
+            self.dataset.file.close()
+
+
 """ Base data classes """
 
 
@@ -63,19 +132,32 @@ class Tidy3dData(Tidy3dBaseModel):
         arbitrary_types_allowed = True  # allow types like `Array[float]`
         json_encoders = {  # how to write certain types to json files
             np.ndarray: numpy_encoding,  # use custom encoding defined in .types
+            LazyValues: np.array,  # read from the file, then encoded as np.ndarray
             np.int64: lambda x: int(x),  # pylint: disable=unnecessary-lambda
             Tidy3dDataArray: lambda x: None,  # dont write
             xr.Dataset: lambda x: None,  # dont write
         }
 
     @abstractmethod
-    def add_to_group(self, hdf5_grp):
+    def add_to_group(self, hdf5_grp, precision: Precision = None):
         """Add data contents to an hdf5 group."""
 
     @classmethod
     @abstractmethod
-    def load_from_group(cls, hdf5_grp):
-        """Load data contents from an hdf5 group."""
+    def load_from_group(cls, hdf5_grp, precision: Precision = None, lazy: bool = False):
+        """Load data contents from an hdf5 group. If ``lazy``, the values are kept in the file
+        as :class:`LazyValues`, and the data is made without validation."""
+
+    @staticmethod
+    def precision_dtype(dtype: np.dtype, precision: Precision = None) -> np.dtype:
+        """The dtype to store floating point data of ``dtype`` with the given ``precision``.
+        If ``precision`` is ``None`` or the data is not floating point, ``dtype`` is unchanged."""
+        dtype = np.dtype(dtype)
+        if precision is None or dtype.kind not in SINGLE_PRECISION_DTYPES:
+            return dtype
+        if precision == "single":
+            return SINGLE_PRECISION_DTYPES[dtype.kind]
+        return DOUBLE_PRECISION_DTYPES[dtype.kind]
 
     @staticmethod
     def save_string(hdf5_grp, string_key: str, string_value: str) -> None:
@@ -160,6 +242,17 @@ class MonitorData(Tidy3dData, ABC):
 
         return data_array
 
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the values and coordinates of the data."""
+        coords_nbytes = sum(np.asarray(getattr(self, dim)).nbytes for dim in self._dims)
+        return self.values.nbytes + coords_nbytes
+
+    def close(self) -> None:
+        """Close the file holding the values, if they were loaded with ``lazy=True``."""
+        if isinstance(self.values, LazyValues):
+            self.values.close()
+
     def __eq__(self, other) -> bool:
         """Check equality against another MonitorData instance.
 
@@ -176,27 +269,78 @@ class MonitorData(Tidy3dData, ABC):
         assert isinstance(other, MonitorData), "can only check eqality on two monitor data objects"
         return np.all(self.values == other.values)
 
-    def add_to_group(self, hdf5_grp) -> None:
-        """Add data contents to an hdf5 group."""
+    def isel(self, **isel_kwargs) -> "MonitorData":
+        """Select a subset of the data by integer indices, keeping all of the dimensions.
+
+        Parameters
+        ----------
+        **isel_kwargs
+            Mapping of dimension name to the integer indices (or slice) to keep along that
+            dimension.
+
+        Returns
+        -------
+        :class:`MonitorData`
+            A new instance of the same type, storing only the selected data.
+        """
+        # evenly spaced indices are selected with slices, so that only the selected values are
+        # read if they are kept in a file, the other indices are taken afterwards
+        key = []
+        take_inds = {}
+        new_coords = {}
+        for axis, dim in enumerate(self._dims):
+            coords = getattr(self, dim)
+            inds = np.atleast_1d(np.arange(self.values.shape[axis])[isel_kwargs.get(dim, ...)])
+            step = inds[1] - inds[0] if len(inds) > 1 else 1
+            if len(inds) > 0 and step > 0 and np.all(np.diff(inds) == step):
+                key.append(slice(inds[0], inds[-1] + 1, step))
+            else:
+                key.append(slice(None))
+                take_inds[axis] = inds
+            if isinstance(coords, list):
+                coords = [coords[ind] for ind in inds]
+            else:
+                coords = coords[inds]
+            new_coords[dim] = coords
+        values = np.array(self.values[tuple(key)])
+        for axis, inds in take_inds.items():
+            values = np.take(values, inds, axis=axis)
+        return type(self)(values=values, data_attrs=self.data_attrs, **new_coords)
+
+    def add_to_group(self, hdf5_grp, precision: Precision = None) -> None:
+        """Add data contents to an hdf5 group.
+        If ``precision`` is supplied, the values are written in single or double precision."""
 
         # save the type information of MonitorData to the group
         Tidy3dData.save_string(hdf5_grp, "type", self.type)
-        for data_name, data_value in self.dict().items():
 
-            # for each data member in self._dims (+ values), add to group.
-            if data_name in self._dims or data_name in ("values",):
-                hdf5_grp.create_dataset(data_name, data=data_value)
+        # for each data member in self._dims (+ values), add to group.
+        for data_name in self._dims:
+            hdf5_grp.create_dataset(data_name, data=getattr(self, data_name))
+        values_dtype = self.precision_dtype(self.values.dtype, precision)
+        hdf5_grp.create_dataset("values", data=self.values, dtype=values_dtype)
 
     @classmethod
-    def load_from_group(cls, hdf5_grp):
-        """Load Monitor data instance from an hdf5 group."""
+    def load_from_group(cls, hdf5_grp, precision: Precision = None, lazy: bool = False):
+        """Load Monitor data instance from an hdf5 group.
+        If ``precision`` is supplied, the values are read in single or double precision,
+        otherwise they keep the precision stored in the file.
+        If ``lazy``, the values are kept in the file as :class:`LazyValues`."""
 
         # kwargs that gets passed to MonitorData.__init__() to make new MonitorData
         kwargs = {}
 
         # construct kwarg dict from hdf5 data group for monitor
         for data_name, data_value in hdf5_grp.items():
-            kwargs[data_name] = np.array(data_value)
+            if data_name == "values":
+                # convert while reading to avoid holding a copy in the stored precision
+                values_dtype = cls.precision_dtype(data_value.dtype, precision)
+                if lazy:
+                    kwargs[data_name] = LazyValues(data_value, dtype=values_dtype)
+                else:
+                    kwargs[data_name] = data_value.astype(values_dtype)[()]
+            else:
+                kwargs[data_name] = np.array(data_value)
 
         # handle data stored as np.array() of bytes instead of strings
         for str_kwarg in ("direction",):
@@ -206,6 +350,8 @@ class MonitorData(Tidy3dData, ABC):
         # ignore the "type" dataset as it's used for finding type for loading
         kwargs.pop("type")
 
+        if lazy:
+            return cls.construct_trusted(**kwargs)
         return cls(**kwargs)
 
 
@@ -237,6 +383,16 @@ class CollectionData(Tidy3dData):
         data_arrays = {name: arr.data for name, arr in self.data_dict.items()}
         return data_arrays
 
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the values and coordinates of all of the data."""
+        return sum(data.nbytes for data in self.data_dict.values())
+
+    def close(self) -> None:
+        """Close the file holding the values, if they were loaded with ``lazy=True``."""
+        for data in self.data_dict.values():
+            data.close()
+
     def __eq__(self, other):
         """Check for equality against other :class:`AbstractFieldData` object."""
 
@@ -269,7 +425,7 @@ class CollectionData(Tidy3dData):
             raise DataError(f"field_name '{field_name}' not found")
         return monitor_data.data
 
-    def add_to_group(self, hdf5_grp) -> None:
+    def add_to_group(self, hdf5_grp, precision: Precision = None) -> None:
         """Add data from a :class:`AbstractFieldData` to an hdf5 group ."""
 
         # put collection's type information into the group
@@ -278,10 +434,10 @@ class CollectionData(Tidy3dData):
 
             # create a new group for each member of collection and add its data
             data_grp = hdf5_grp.create_group(data_name)
-            data_value.add_to_group(data_grp)
+            data_value.add_to_group(data_grp, precision=precision)
 
     @classmethod
-    def load_from_group(cls, hdf5_grp):
+    def load_from_group(cls, hdf5_grp, precision: Precision = None, lazy: bool = False):
         """Load a :class:`AbstractFieldData` from hdf5 group containing data."""
         data_dict = {}
         for data_name, data_value in hdf5_grp.items():
@@ -292,8 +448,12 @@ class CollectionData(Tidy3dData):
 
             # get the type from MonitorData.type and add instance to dict
             _data_type = DATA_TYPE_MAP[Tidy3dData.load_string(data_value, "type")]
-            data_dict[data_name] = _data_type.load_from_group(data_value)
+            data_dict[data_name] = _data_type.load_from_group(
+                data_value, precision=precision, lazy=lazy
+            )
 
+        if lazy:
+            return cls.construct_trusted(data_dict=data_dict)
         return cls(data_dict=data_dict)
 
     def ensure_member_exists(self, member_name: str):
@@ -358,6 +518,63 @@ class AbstractFieldData(CollectionData, ABC):
             return scalar_data.data
         return None
 
+    @staticmethod
+    def _interp_weights(coords: Numpy, coords_interp: Numpy) -> Tuple[Numpy, Numpy]:
+        """Indices and weights for linear interpolation from ``coords`` to ``coords_interp``.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Sorted 1D coordinates of the data, with at least two points.
+        coords_interp : np.ndarray
+            1D coordinates to interpolate to.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Indices ``i`` into ``coords`` of the left neighbor of each point and the
+            normalized distances ``w`` from it, such that the interpolated value is
+            ``(1 - w) * values[i] + w * values[i + 1]``.
+            Points outside of ``coords`` get a weight of ``nan``, like ``xarray.DataArray.interp``.
+        """
+        inds = np.searchsorted(coords, coords_interp, side="right") - 1
+        inds = np.clip(inds, 0, len(coords) - 2)
+        steps = coords[inds + 1] - coords[inds]
+        weights = (coords_interp - coords[inds]) / steps
+        out_of_bounds = (coords_interp < coords[0]) | (coords_interp > coords[-1])
+        weights[out_of_bounds] = np.nan
+        return inds, weights
+
+    @staticmethod
+    def _bracket_inds(coords: Numpy, bounds: Tuple[float, float]) -> Numpy:
+        """Indices of the ``coords`` needed to linearly interpolate anywhere within ``bounds``,
+        i.e. the coordinates inside the bounds plus their nearest neighbors on either side.
+        At least two indices are returned if ``coords`` has more than one element."""
+        if len(coords) <= 1:
+            return np.arange(len(coords))
+        bound_min, bound_max = bounds
+        ind_min = np.searchsorted(coords, bound_min, side="right") - 1
+        ind_min = np.clip(ind_min, 0, len(coords) - 2)
+        ind_max = np.searchsorted(coords, bound_max, side="left")
+        ind_max = np.clip(ind_max, ind_min + 1, len(coords) - 1)
+        return np.arange(ind_min, ind_max + 1)
+
+    @staticmethod
+    def _interp_axis(values: Numpy, axis: int, inds: Numpy, weights: Numpy) -> Numpy:
+        """Linearly interpolate ``values`` along ``axis`` using the output of ``_interp_weights``.
+        On the Yee grid, this is the (nonuniform) two-point average between staggered locations.
+        """
+        weights_shape = [1] * values.ndim
+        weights_shape[axis] = len(weights)
+        weights = weights.reshape(weights_shape)
+        values_left = np.take(values, inds, axis=axis)
+        values_right = np.take(values, inds + 1, axis=axis)
+        values_right -= values_left
+        values_right *= weights
+        values_left += values_right
+        return values_left
+
+    # pylint:disable=too-many-locals
     def colocate(self, x, y, z) -> xr.Dataset:
         """colocate all of the data at a set of x, y, z coordinates.
 
@@ -383,27 +600,96 @@ class AbstractFieldData(CollectionData, ABC):
         Be sure to apply this method to your field data in those cases.
         """
         coord_val_map = {"x": x, "y": y, "z": z}
+
+        # interpolation weights are shared between field components with the same coordinates
+        weights_cache = {}
+
         centered_data_dict = {}
         for field_name, field_data in self.data_dict.items():
-            centered_data_array = field_data.data
+            values = field_data.values
+            dims = list(field_data._dims)  # pylint:disable=protected-access
+            coords = {dim: getattr(field_data, dim) for dim in dims}
+            scalar_coords = {}
+
             for coord_name in "xyz":
-                if len(centered_data_array.coords[coord_name]) <= 1:
-                    # centered_data_array = centered_data_array.isel(**{coord_name:0})
-                    coord_val = coord_val_map[coord_name]
-                    coord_kwargs = {coord_name: coord_val}
-                    centered_data_array = centered_data_array.assign_coords(**coord_kwargs)
-                    centered_data_array = centered_data_array.isel(**{coord_name: 0})
+                axis = dims.index(coord_name)
+                coord_data = coords[coord_name]
+                coord_vals = np.array(coord_val_map[coord_name], dtype=float)
+
+                # a single data point along this axis, just assign the new coordinate and drop it
+                if len(coord_data) <= 1:
+                    values = np.take(values, 0, axis=axis)
+                    scalar_coords[coord_name] = coord_vals.ravel()[0]
+                    dims.pop(axis)
+                    coords.pop(coord_name)
+                    continue
+
+                coord_vals_1d = np.atleast_1d(coord_vals)
+
+                # nothing to do if the component is already located at the requested positions
+                if not np.array_equal(coord_data, coord_vals_1d):
+                    cache_key = (coord_data.tobytes(), coord_vals_1d.tobytes())
+                    if cache_key not in weights_cache:
+                        weights_cache[cache_key] = self._interp_weights(coord_data, coord_vals_1d)
+                    inds, weights = weights_cache[cache_key]
+                    values = self._interp_axis(values, axis, inds, weights)
+
+                # a scalar location removes the dimension, like ``xarray.DataArray.interp``
+                if coord_vals.ndim == 0:
+                    values = np.take(values, 0, axis=axis)
+                    scalar_coords[coord_name] = float(coord_vals)
+                    dims.pop(axis)
+                    coords.pop(coord_name)
                 else:
-                    coord_vals = coord_val_map[coord_name]
-                    centered_data_array = centered_data_array.interp(**{coord_name: coord_vals})
+                    coords[coord_name] = coord_vals_1d
+
+            centered_data_array = Tidy3dDataArray(values, coords=coords, dims=dims)
+            centered_data_array = centered_data_array.assign_coords(scalar_coords)
+            if field_data.data_attrs:
+                centered_data_array.attrs = field_data.data_attrs
+            for name, coord in centered_data_array.coords.items():  # pylint:disable=no-member
+                coord[name].attrs = DIM_ATTRS.get(name)
             centered_data_dict[field_name] = centered_data_array
-        # import pdb; pdb.set_trace()
+
         return xr.Dataset(centered_data_dict)
 
+    @staticmethod
+    def _grid_inds(coords: Numpy, coords_interp: Numpy) -> Optional[Numpy]:
+        """Indices into ``coords`` of each point in ``coords_interp`` if they all lie on ``coords``.
+        Points outside of the bounds of ``coords`` get an index of ``-1``. If any point inside the
+        bounds does not coincide with one of ``coords``, returns ``None``."""
+
+        if len(coords) == 0:
+            return None
+
+        # find the closest coordinate to each point
+        inds_right = np.clip(np.searchsorted(coords, coords_interp), 0, len(coords) - 1)
+        inds_left = np.clip(inds_right - 1, 0, len(coords) - 1)
+        dist_right = np.abs(coords[inds_right] - coords_interp)
+        dist_left = np.abs(coords[inds_left] - coords_interp)
+        inds = np.where(dist_left < dist_right, inds_left, inds_right)
+        dist = np.minimum(dist_left, dist_right)
+
+        # only allow differences due to floating point errors in the grid construction
+        tol = GRID_INDS_RTOL * (1.0 + np.max(np.abs(coords)))
+        out_of_bounds = (coords_interp < coords[0] - tol) | (coords_interp > coords[-1] + tol)
+        if np.any((dist > tol) & ~out_of_bounds):
+            return None
+
+        inds[out_of_bounds] = -1
+        return inds
+
     # pylint:disable=too-many-locals
     def apply_syms(self, new_grid: YeeGrid, sym_center: Coordinate, symmetry: Symmetry):
         """Create a new AbstractFieldData subclass by interpolating on the supplied ``new_grid``,
-        using symmetries as defined by ``sym_center`` and ``symmetry``."""
+        using symmetries as defined by ``sym_center`` and ``symmetry``.
+
+        Note
+        ----
+        The simulation grid is mirrored about the symmetry center, so the new values can usually
+        be gathered from the stored data by reflecting indices. Interpolation is only used if the
+        reflected ``new_grid`` locations do not coincide with the data coordinates.
+        """
 
         new_data_dict = {}
         yee_grid_dict = new_grid.yee.grid_dict
@@ -418,7 +704,9 @@ class AbstractFieldData(CollectionData, ABC):
         }
 
         for field, scalar_data in self.data_dict.items():
-            new_data = scalar_data.data
+            values = scalar_data.values
+            dims = scalar_data._dims  # pylint:disable=protected-access
+            data_coords = {dim: getattr(scalar_data, dim) for dim in dims}
 
             # Get new grid locations
             yee_coords = yee_grid_dict[field].to_list
@@ -437,15 +725,30 @@ class AbstractFieldData(CollectionData, ABC):
                 coords_interp = np.copy(coords)
                 coords_interp[flip_inds] = 2 * center - coords[flip_inds]
 
-                # Interpolate. There generally shouldn't be values out of bounds except potentially
-                # when handling modes, in which case we set such values to zero.
-                new_data = new_data.interp({dim_name: coords_interp}, kwargs={"fill_value": 0.0})
-                new_data = new_data.assign_coords({dim_name: coords})
+                # The correct +/-1 for the field component
+                signs = np.ones(len(coords))
+                signs[flip_inds] = sym * component_sym_dict[field][dim]
+                signs_shape = [1] * values.ndim
+                signs_shape[dim] = len(coords)
+
+                grid_inds = self._grid_inds(np.array(data_coords[dim_name]), coords_interp)
+                if grid_inds is not None:
+                    # Reflect by indexing. Values out of bounds (only when handling modes) are zero.
+                    signs[grid_inds < 0] = 0.0
+                    values = np.take(values, np.maximum(grid_inds, 0), axis=dim)
+                else:
+                    # Interpolate. There generally shouldn't be values out of bounds except
+                    # potentially when handling modes, in which case we set such values to zero.
+                    data_array = xr.DataArray(values, coords=data_coords, dims=dims)
+                    data_array = data_array.interp(
+                        {dim_name: coords_interp}, kwargs={"fill_value": 0.0}
+                    )
+                    values = data_array.values
 
-                # Apply the correct +/-1 for the field component
-                new_data[{dim_name: flip_inds}] *= sym * component_sym_dict[field][dim]
+                values *= signs.reshape(signs_shape)
+                data_coords[dim_name] = coords
 
-            new_data_dict[field] = type(scalar_data)(values=new_data.values, **new_data.coords)
+            new_data_dict[field] = type(scalar_data)(values=values, **data_coords)
 
         return type(self)(data_dict=new_data_dict)
 
@@ -519,7 +822,9 @@ class ScalarFieldData(AbstractScalarFieldData, FreqData):
 
     def normalize(self, source_freq_amps: Array[complex]) -> None:
         """normalize the values by the amplitude of the source."""
-        self.values /= source_freq_amps  # pylint: disable=no-member
+        # modify the array in place, assigning to ``self.values`` would validate (copy) it
+        values = self.values
+        values /= source_freq_amps
 
 
 class ScalarFieldTimeData(AbstractScalarFieldData, TimeData):
@@ -626,7 +931,8 @@ class FluxData(AbstractFluxData, FreqData):
 
     def normalize(self, source_freq_amps: Array[complex]) -> None:
         """normalize the values by the amplitude of the source."""
-        self.values /= abs(source_freq_amps) ** 2  # pylint: disable=no-member
+        values = self.values
+        values /= abs(source_freq_amps) ** 2
 
 
 class FluxTimeData(AbstractFluxData, TimeData):
@@ -691,7 +997,8 @@ class ModeAmpsData(AbstractModeData):
 
     def normalize(self, source_freq_amps: Array[complex]) -> None:
         """normalize the values by the amplitude of the source."""
-        self.values /= source_freq_amps[None, :, None]  # pylint: disable=no-member
+        values = self.values
+        values /= source_freq_amps[None, :, None]
 
 
 class ModeIndexData(AbstractModeData):
@@ -847,6 +1154,13 @@ DATA_TYPE_MAP = {
 class AbstractSimulationData(Tidy3dBaseModel, ABC):
     """Abstract class to store a simulation and some data associated with it."""
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """Configuration for all simulation data objects."""
+
+        json_encoders = {
+            LazyValues: np.array,  # read from the file, then encoded as np.ndarray
+        }
+
     simulation: Simulation
 
     @equal_aspect
@@ -897,7 +1211,7 @@ class AbstractSimulationData(Tidy3dBaseModel, ABC):
         axis_label = "xyz"[axis]
         interp_kwarg = {axis_label: position}
 
-        if len(field_data.coords[axis_label]) > 1:
+        if field_data.coords[axis_label].size > 1:
             try:
                 field_data = field_data.interp(**interp_kwarg)
 
@@ -979,6 +1293,25 @@ class SimulationData(AbstractSimulationData):
         """What is the index of the source that normalized this data. If ``None``, unnormalized."""
         return self._normalize_index
 
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the values and coordinates of the data of all monitors."""
+        return sum(data.nbytes for data in self.monitor_data.values())
+
+    def close(self) -> None:
+        """Close the file holding the monitor data values, if they were loaded with
+        ``lazy=True``. They can no longer be read afterwards."""
+        for data in self.monitor_data.values():
+            data.close()
+
+    def __enter__(self) -> "SimulationData":
+        """Use the data in a ``with`` statement, which closes its file at the end."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the file holding the monitor data values."""
+        self.close()
+
     @property
     def log(self) -> str:
         """Returns the server-side log as a string."""
@@ -1119,34 +1452,8 @@ class SimulationData(AbstractSimulationData):
         # get the monitor data
         monitor_data = self.monitor_data.get(field_monitor_name)
         self.ensure_field_monitor(monitor_data)
-        if isinstance(monitor_data, ModeFieldData):
-            if mode_index is None:
-                raise DataError("'mode_index' must be supplied to plot a ModeFieldMonitor.")
-            monitor_data = monitor_data.sel_mode_index(mode_index=mode_index)
-
-        # get the field data component
-        if field_name == "int":
-            monitor_data = self.at_centers(field_monitor_name)
-            xr_data = 0.0
-            for field in ("Ex", "Ey", "Ez"):
-                field_data = monitor_data[field]
-                xr_data += abs(field_data) ** 2
-            val = "abs"
-        else:
-            monitor_data.ensure_member_exists(field_name)
-            xr_data = monitor_data.data_dict.get(field_name).data
-
-        # select the frequency or time value
-        if "f" in xr_data.coords:
-            if freq is None:
-                raise DataError("'freq' must be supplied to plot a FieldMonitor.")
-            field_data = xr_data.sel(f=freq, method="nearest")
-        elif "t" in xr_data.coords:
-            if time is None:
-                raise DataError("'time' must be supplied to plot a FieldTimeMonitor.")
-            field_data = xr_data.sel(t=time, method="nearest")
-        else:
-            raise DataError("Field data has neither time nor frequency data, something went wrong.")
+        if isinstance(monitor_data, ModeFieldData) and mode_index is None:
+            raise DataError("'mode_index' must be supplied to plot a ModeFieldMonitor.")
 
         if x is None and y is None and z is None:
             """If a planar monitor, infer x/y/z based on the plane position and normal."""
@@ -1162,6 +1469,38 @@ class SimulationData(AbstractSimulationData):
         else:
             axis, position = self.simulation.parse_xyz_kwargs(x=x, y=y, z=z)
 
+        # get the field data components, only keeping the data around the plotting plane
+        field_names = ("Ex", "Ey", "Ez") if field_name == "int" else (field_name,)
+        for name in field_names:
+            monitor_data.ensure_member_exists(name)
+        slab_data, slab_centers = self._field_slab(
+            field_monitor_name=field_monitor_name,
+            field_names=field_names,
+            axis=axis,
+            position=position,
+            freq=freq,
+            time=time,
+            mode_index=mode_index,
+        )
+
+        if field_name == "int":
+            slab_data = slab_data.colocate(x=slab_centers.x, y=slab_centers.y, z=slab_centers.z)
+            xr_data = 0.0
+            for field in field_names:
+                field_data = slab_data[field]
+                xr_data += abs(field_data) ** 2
+            val = "abs"
+        else:
+            xr_data = slab_data.data_dict.get(field_name).data
+
+        # select the frequency or time value and mode index
+        if "f" in xr_data.coords:
+            field_data = xr_data.sel(f=freq, method="nearest")
+        else:
+            field_data = xr_data.sel(t=time, method="nearest")
+        if "mode_index" in field_data.coords:
+            field_data = field_data.sel(mode_index=mode_index, drop=True)
+
         return self.plot_field_array(
             field_data=field_data,
             axis=axis,
@@ -1173,6 +1512,70 @@ class SimulationData(AbstractSimulationData):
             ax=ax,
         )
 
+    # pylint:disable=too-many-arguments, too-many-locals, protected-access
+    def _field_slab(
+        self,
+        field_monitor_name: str,
+        field_names: List[str],
+        axis: Axis,
+        position: float,
+        freq: float = None,
+        time: float = None,
+        mode_index: int = None,
+    ) -> Tuple[AbstractFieldData, Coords]:
+        """Select the data of a field monitor needed to plot ``field_names`` in a plane.
+        Only the Yee layers around ``position`` and the frequency, time, or mode index closest to
+        those requested are kept, so that any further interpolation is done on a thin slab.
+
+        Returns
+        -------
+        Tuple[:class:`AbstractFieldData`, :class:`Coords`]
+            The field data in the slab and the locations of the Yee cell centers in the slab.
+        """
+
+        monitor_data = self.monitor_data.get(field_monitor_name)
+        monitor = self.simulation.get_monitor_by_name(field_monitor_name)
+        centers = self.simulation.discretize(monitor).centers.to_list
+        axis_label = "xyz"[axis]
+
+        # keep the two cell centers around the plane and the yee layers needed to colocate there
+        center_inds = AbstractFieldData._bracket_inds(centers[axis], (position, position))
+        centers[axis] = centers[axis][center_inds]
+        bounds = (centers[axis][0], centers[axis][-1])
+
+        data_dict = {}
+        for field_name in field_names:
+            scalar_data = monitor_data.data_dict[field_name]
+            isel_kwargs = {
+                axis_label: AbstractFieldData._bracket_inds(
+                    getattr(scalar_data, axis_label), bounds
+                )
+            }
+
+            if isinstance(scalar_data, FreqData):
+                if freq is None:
+                    raise DataError("'freq' must be supplied to plot a FieldMonitor.")
+                isel_kwargs["f"] = np.argmin(np.abs(scalar_data.f - freq))
+            elif isinstance(scalar_data, TimeData):
+                if time is None:
+                    raise DataError("'time' must be supplied to plot a FieldTimeMonitor.")
+                isel_kwargs["t"] = np.argmin(np.abs(scalar_data.t - time))
+            else:
+                raise DataError(
+                    "Field data has neither time nor frequency data, something went wrong."
+                )
+
+            if isinstance(scalar_data, AbstractModeData):
+                mode_inds = np.where(scalar_data.mode_index == mode_index)[0]
+                if len(mode_inds) == 0:
+                    raise DataError("Requested 'mode_index' not stored in ModeFieldData.")
+                isel_kwargs["mode_index"] = mode_inds[0]
+
+            data_dict[field_name] = scalar_data.isel(**isel_kwargs)
+
+        slab_data = type(monitor_data)(data_dict=data_dict)
+        return slab_data, Coords(**dict(zip("xyz", centers)))
+
     def normalize(self, normalize_index: Optional[int] = 0):
         """Return a copy of the :class:`.SimulationData` object with data normalized by source.
 
@@ -1190,10 +1593,18 @@ class SimulationData(AbstractSimulationData):
         """
 
         sim_data_norm = self.copy(deep=True)
+        sim_data_norm._normalize_inplace(normalize_index)
+        return sim_data_norm
+
+    def _normalize_inplace(self, normalize_index: Optional[int] = 0) -> None:
+        """Normalize the data of this :class:`.SimulationData` object by the source spectrum,
+        modifying the monitor data values in place without making any copies.
+        See :meth:`.SimulationData.normalize` for details.
+        """
 
-        # if no normalize index, just return the new copy right away.
+        # if no normalize index, nothing to do.
         if normalize_index is None:
-            return sim_data_norm
+            return
 
         # if data alreadty normalized
         if self.normalized:
@@ -1206,8 +1617,8 @@ class SimulationData(AbstractSimulationData):
                     f"and can't be normalized again with `normalize_index` of {normalize_index}."
                 )
 
-            # otherwise, just return the data
-            return sim_data_norm
+            # otherwise, the data is already normalized
+            return
 
         # from here on, normalze_index is not None and the data has not been normalized
 
@@ -1217,7 +1628,7 @@ class SimulationData(AbstractSimulationData):
                 f"normalize_index={normalize_index} supplied but no sources found, "
                 "not normalizing."
             )
-            return sim_data_norm
+            return
 
         # try to get the source info
         try:
@@ -1226,20 +1637,26 @@ class SimulationData(AbstractSimulationData):
         except IndexError as e:
             raise DataError(f"Could not locate source at normalize_index={normalize_index}.") from e
 
-        times = self.simulation.tmesh
-        dt = self.simulation.dt
+        times = self.simulation.time_mesh
+        dt = times.dt
+
+        # source spectrum for each distinct set of monitor frequencies
+        spectrum_cache = {}
 
         def normalize_data(monitor_data):
             """normalize a monitor data instance using the source time parameters."""
-            freqs = monitor_data.f
-            source_freq_amps = source_time.spectrum(times, freqs, dt)
-            # We remove the user-defined phase from the normalization. Otherwise, with a single
-            # source, we would get the exact same fields regardless of the source_time phase.
-            # Instead we would like the field phase to be determined by the source_time phase.
-            source_freq_amps *= np.exp(-1j * source_time.phase)
-            monitor_data.normalize(source_freq_amps)
-
-        for monitor_data in sim_data_norm.monitor_data.values():
+            freqs = np.array(monitor_data.f)
+            cache_key = freqs.tobytes()
+            if cache_key not in spectrum_cache:
+                source_freq_amps = source_time.spectrum(times, freqs, dt)
+                # We remove the user-defined phase from the normalization. Otherwise, with a single
+                # source, we would get the exact same fields regardless of the source_time phase.
+                # Instead we would like the field phase to be determined by the source_time phase.
+                source_freq_amps *= np.exp(-1j * source_time.phase)
+                spectrum_cache[cache_key] = source_freq_amps
+            monitor_data.normalize(spectrum_cache[cache_key])
+
+        for monitor_data in self.monitor_data.values():
 
             if isinstance(monitor_data, (FieldData, FluxData, ModeData)):
 
@@ -1250,43 +1667,96 @@ class SimulationData(AbstractSimulationData):
                 else:
                     normalize_data(monitor_data)
 
-        sim_data_norm._normalize_index = normalize_index  # pylint:disable=protected-access
-        return sim_data_norm
+        self._normalize_index = normalize_index
 
-    def to_file(self, fname: str) -> None:
+    def to_file(self, fname: str, precision: Precision = None) -> None:
         """Export :class:`SimulationData` to single hdf5 file including monitor data.
 
         Parameters
         ----------
         fname : str
             Path to .hdf5 data file (including filename).
-        """
-
-        with h5py.File(fname, "a") as f_handle:
-
-            # save json string as a dataset
-            Tidy3dData.save_string(f_handle, "sim_json", self.simulation.json())
+        precision : Literal['single', 'double'] = None
+            If specified, the monitor data values are written in single (``float32`` and
+            ``complex64``) or double (``float64`` and ``complex128``) precision.
+            Otherwise, they are written in the precision they are stored in.
 
-            # save log string as a dataset
-            if self.log_string:
-                Tidy3dData.save_string(f_handle, "log_string", self.log_string)
-
-            # save diverged and normalized flags as attributes
-            f_handle.attrs["diverged"] = self.diverged
-            if self._normalize_index:
-                f_handle.attrs["normalize_index"] = self._normalize_index
+        Note
+        ----
+        If ``fname`` is the file that the values of data loaded with ``lazy=True`` are read from,
+        a new file is written and replaces it, after closing it. The values of this data can then
+        no longer be read, the file must be loaded again.
+        """
 
-            # make a group for monitor_data
-            mon_data_grp = f_handle.create_group("monitor_data")
-            for mon_name, mon_data in self.monitor_data.items():
+        # values of data loaded with ``lazy=True`` that are read from the file at fname
+        lazy_values = [
+            values
+            for values in self._lazy_values()
+            if os.path.realpath(values.dataset.file.filename) == os.path.realpath(fname)
+        ]
+        if not lazy_values:
+            with h5py.File(fname, "a") as f_handle:
+                self._add_to_file(f_handle, precision=precision)
+            return
+
+        # the values are read from the file while the new one is written next to it, which then
+        # replaces it once it is closed, as an open file can not be replaced on all platforms
+        directory, name = os.path.split(os.path.abspath(fname))
+        tmp_fname = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with h5py.File(tmp_fname, "w") as f_handle:
+                self._add_to_file(f_handle, precision=precision)
+            for values in lazy_values:
+                values.close()
+            os.replace(tmp_fname, fname)
+        finally:
+            if os.path.exists(tmp_fname):
+                os.remove(tmp_fname)
+
+    def _add_to_file(self, f_handle: h5py.File, precision: Precision = None) -> None:
+        """Write the simulation and the monitor data to an open hdf5 file, see :meth:`to_file`."""
+
+        # save json string as a dataset
+        Tidy3dData.save_string(f_handle, "sim_json", self.simulation.json())
+
+        # save log string as a dataset
+        if self.log_string:
+            Tidy3dData.save_string(f_handle, "log_string", self.log_string)
+
+        # save diverged and normalized flags as attributes
+        f_handle.attrs["diverged"] = self.diverged
+        if self._normalize_index is not None:
+            f_handle.attrs["normalize_index"] = self._normalize_index
+
+        # make a group for monitor_data
+        mon_data_grp = f_handle.create_group("monitor_data")
+        for mon_name, mon_data in self.monitor_data.items():
 
-                # for each monitor, make new group with the same name
-                mon_grp = mon_data_grp.create_group(mon_name)
-                mon_data.add_to_group(mon_grp)
+            # for each monitor, make new group with the same name
+            mon_grp = mon_data_grp.create_group(mon_name)
+            mon_data.add_to_group(mon_grp, precision=precision)
+
+    def _lazy_values(self) -> List[LazyValues]:
+        """Values of the monitor data loaded with ``lazy=True`` whose file is still open."""
+        monitor_datas = []
+        for mon_data in self.monitor_data.values():
+            if isinstance(mon_data, CollectionData):
+                monitor_datas += list(mon_data.data_dict.values())
+            else:
+                monitor_datas.append(mon_data)
+        return [
+            mon_data.values
+            for mon_data in monitor_datas
+            if isinstance(mon_data.values, LazyValues) and mon_data.values.dataset.id.valid
+        ]
 
     @classmethod
     def from_file(
-        cls, fname: str, normalize_index: Optional[int] = 0
+        cls,
+        fname: str,
+        normalize_index: Optional[int] = 0,
+        precision: Precision = None,
+        lazy: bool = False,
     ):  # pylint:disable=arguments-differ
         """Load :class:`SimulationData` from .hdf5 file.
 
@@ -1294,6 +1764,18 @@ class SimulationData(AbstractSimulationData):
         ----------
         fname : str
             Path to .hdf5 data file (including filename).
+        normalize_index : int = 0
+            If specified, normalizes the frequency-domain data by the amplitude spectrum of the
+            source corresponding to ``simulation.sources[normalize_index]``.
+        precision : Literal['single', 'double'] = None
+            If specified, the monitor data values are loaded in single (``float32`` and
+            ``complex64``) or double (``float64`` and ``complex128``) precision.
+            Otherwise, they are loaded in the precision stored in the file.
+        lazy : bool = False
+            If ``True``, the monitor data values are not read, but kept in the file, and only the
+            values selected from them are read, see :class:`LazyValues`. The monitor data is then
+            not validated. The file stays open until :meth:`close` is called, which is done at
+            the end of ``with SimulationData.from_file(fname, lazy=True) as sim_data:``.
 
         Returns
         -------
@@ -1301,8 +1783,10 @@ class SimulationData(AbstractSimulationData):
             A :class:`SimulationData` instance.
         """
 
-        # read from file at fname
-        with h5py.File(fname, "r") as f_handle:
+        # read from file at fname, the lazily loaded values keep the file open
+        f_handle = h5py.File(fname, "r")
+        keep_open = False
+        try:
 
             # construct the original simulation from the json string
             sim_json = Tidy3dData.load_string(f_handle, "sim_json")
@@ -1326,27 +1810,48 @@ class SimulationData(AbstractSimulationData):
 
                 # load this MonitorData instance, add to monitor_data dict
                 _data_type = DATA_TYPE_MAP[Tidy3dData.load_string(monitor_data, "type")]
-                monitor_data_instance = _data_type.load_from_group(monitor_data)
+                monitor_data_instance = _data_type.load_from_group(
+                    monitor_data, precision=precision, lazy=lazy
+                )
                 monitor_data_dict[monitor_name] = monitor_data_instance
 
-        # create a SimulationData object
-        sim_data = cls(
-            simulation=simulation,
-            monitor_data=monitor_data_dict,
-            log_string=log_string,
-            diverged=diverged,
-        )
+            # create a SimulationData object
+            sim_data = cls(
+                simulation=simulation,
+                monitor_data=monitor_data_dict,
+                log_string=log_string,
+                diverged=diverged,
+            )
+
+            # make sure to tag the SimulationData with the normalize_index stored from file
+            sim_data._normalize_index = normalize_index_file
+
+            sim_data = cls._normalize_loaded(sim_data, normalize_index, normalize_index_file)
+            keep_open = lazy
 
-        # make sure to tag the SimulationData with the normalize_index stored from file
-        sim_data._normalize_index = normalize_index_file
+        # the file is only left open for the lazily loaded values, if the data is returned
+        finally:
+            if not keep_open:
+                f_handle.close()
+
+        return sim_data
+
+    @staticmethod
+    def _normalize_loaded(
+        sim_data: "SimulationData", normalize_index: Optional[int], normalize_index_file: int
+    ) -> "SimulationData":
+        """Normalize data just loaded from a file, whose data was normalized with
+        ``normalize_index_file`` (``None`` if not normalized) when it was written."""
 
         # if normalize_index supplied as None, just return the sim_data right away (norm or not)
         if normalize_index is None:
             return sim_data
 
-        # if the data in the file has not been normalized, normalize with supplied index
+        # if the data in the file has not been normalized, normalize with supplied index.
+        # the data was just loaded so it can be normalized in place without another copy.
         if normalize_index_file is None:
-            return sim_data.normalize(normalize_index=normalize_index)
+            sim_data._normalize_inplace(normalize_index=normalize_index)
+            return sim_data
 
         # from here on, normalze_index and normalize_index_file are present
 
@@ -2,27 +2,82 @@
 """Defines spatial extent of objects."""
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Union, Any, Callable
+from typing import List, Tuple, Union, Any, Callable, Dict
 
 import pydantic
 import numpy as np
 
 from shapely.geometry import Point, Polygon, box, MultiPolygon
+from shapely.ops import unary_union
+from shapely import vectorized
 from descartes import PolygonPatch
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
 
-from .base import Tidy3dBaseModel
+from .base import Tidy3dBaseModel, cached_property
 from .types import Bound, Size, Coordinate, Axis, Coordinate2D, tidynumpy, Array
 from .types import Vertices, Ax, Shapely
 from .viz import add_ax_if_none, equal_aspect
 from .viz import PLOT_BUFFER, ARROW_LENGTH_FACTOR, ARROW_WIDTH_FACTOR, MAX_ARROW_WIDTH_FACTOR
 from .viz import PlotParams, plot_params_geometry
-from ..log import Tidy3dKeyError, SetupError, ValidationError
+from ..log import Tidy3dKeyError, SetupError, ValidationError, log
 from ..constants import MICROMETER, LARGE_NUMBER, RADIAN
 
 # for sampling polygon in slanted polyslab along  z-direction for
 # validating polygon to be non_intersecting.
 _N_SAMPLE_POLYGON_INTERSECT = 100
 
+# maximum number of cross sections stored by each PolySlab, the stored ones are dropped beyond it
+_MAX_CACHED_SECTIONS = 1000
+
+
+def _store_section(sections: Dict, key: Any, section: Any) -> None:
+    """Store a cross section, dropping the stored ones if there are too many."""
+    if len(sections) >= _MAX_CACHED_SECTIONS:
+        sections.clear()
+    sections[key] = section
+
+
+def _shape_path(shape: Shapely) -> Path:
+    """Matplotlib path of the polygons in a shape, with holes, ``None`` if there are none.
+    Inf vertices are replaced by large numbers as in :meth:`Geometry.evaluate_inf_shape`."""
+    vertices = []
+    codes = []
+    for polygon in getattr(shape, "geoms", [shape]):
+        if not isinstance(polygon, Polygon) or polygon.is_empty:
+            continue
+        for ring_index, ring in enumerate([polygon.exterior, *polygon.interiors]):
+            ring_vertices = np.array(ring.coords)[:, :2]
+            ring_vertices[np.isinf(ring_vertices)] = (
+                np.sign(ring_vertices[np.isinf(ring_vertices)]) * LARGE_NUMBER
+            )
+            # exterior counterclockwise and holes clockwise, so the holes are not filled
+            xs, ys = ring_vertices.T
+            signed_area = np.dot(xs[:-1], ys[1:]) - np.dot(xs[1:], ys[:-1])
+            if (signed_area < 0) == (ring_index == 0):
+                ring_vertices = ring_vertices[::-1]
+            ring_codes = np.full(len(ring_vertices), Path.LINETO)
+            ring_codes[0] = Path.MOVETO
+            ring_codes[-1] = Path.CLOSEPOLY
+            vertices.append(ring_vertices)
+            codes.append(ring_codes)
+    if not vertices:
+        return None
+    return Path(np.concatenate(vertices), np.concatenate(codes))
+
+
+def _covers_points(shape: Shapely, xs: np.ndarray, ys: np.ndarray, shape_dilated=None):
+    """Whether each point ``(xs, ys)`` is inside or on the edges of ``shape``. Uses the prepared
+    geometries of ``shapely.vectorized``, testing the points on the edges only close to them
+    (inside of ``shape_dilated``, by default ``shape`` dilated by a small fraction of its extent)
+    as ``touches`` is not prepared."""
+    if shape_dilated is None:
+        shape_dilated = shape.buffer(1e-8 * (1.0 + np.max(np.abs(shape.bounds))))
+    covers = vectorized.contains(shape, xs, ys)
+    near_edges = ~covers & vectorized.contains(shape_dilated, xs, ys)
+    covers[near_edges] = vectorized.touches(shape, xs[near_edges], ys[near_edges])
+    return covers
+
 
 class Geometry(Tidy3dBaseModel, ABC):
     """Abstract base class, defines where something exists in space."""
@@ -134,7 +189,7 @@ class Geometry(Tidy3dBaseModel, ABC):
         intersections = self.intersections(x=x, y=y, z=z)
         return bool(intersections)
 
-    @property
+    @cached_property
     def bounds(self) -> Bound:  # pylint:disable=too-many-locals
         """Returns bounding box min and max coordinates..
 
@@ -230,9 +285,8 @@ class Geometry(Tidy3dBaseModel, ABC):
 
         plot_params = self.plot_params.include_kwargs(**patch_kwargs)
 
-        # for each intersection, plot the shape
-        for shape in shapes_intersect:
-            ax = self.plot_shape(shape, plot_params=plot_params, ax=ax)
+        # plot all intersections as one collection
+        ax = self.plot_shapes(shapes_intersect, plot_params=plot_params, ax=ax)
 
         # clean up the axis display
         ax = self.add_ax_labels_lims(axis=axis, ax=ax)
@@ -247,6 +301,19 @@ class Geometry(Tidy3dBaseModel, ABC):
         ax.add_artist(patch)
         return ax
 
+    def plot_shapes(self, shapes: List[Shapely], plot_params: PlotParams, ax: Ax) -> Ax:
+        """Plots shapes sharing the same plot parameters as a single matplotlib collection, so
+        that the number of artists does not grow with the number of shapes."""
+        paths = [_shape_path(shape) for shape in shapes]
+        paths = [path for path in paths if path is not None]
+        if not paths:
+            return ax
+        collection_kwargs = plot_params.to_kwargs()
+        if not collection_kwargs.pop("fill"):
+            collection_kwargs["facecolor"] = "none"
+        ax.add_collection(PathCollection(paths, **collection_kwargs), autolim=False)
+        return ax
+
     @classmethod
     def strip_coords(
         cls, shape: Shapely
@@ -384,9 +451,10 @@ class Geometry(Tidy3dBaseModel, ABC):
 
     @classmethod
     def evaluate_inf_shape(cls, shape: Shapely) -> Shapely:
-        """Returns a copy of shape with inf vertices replaced by large numbers if polygon."""
+        """Returns a copy of shape with inf vertices replaced by large numbers if polygon,
+        or the shape itself if it has no inf vertices."""
 
-        if not isinstance(shape, Polygon):
+        if not isinstance(shape, Polygon) or np.all(np.isfinite(shape.bounds)):
             return shape
 
         return cls.map_to_coords(cls._evaluate_inf, shape)
@@ -616,7 +684,7 @@ class Planar(Geometry, ABC):
             `Shapely's Documentaton <https://shapely.readthedocs.io/en/stable/project.html>`_.
         """
 
-    @property
+    @cached_property
     def bounds(self):
         """Returns bounding box for planar geometry, may implement for subclasses.
 
@@ -791,7 +859,7 @@ class Box(Geometry):
         dist_z = np.abs(z - z0)
         return (dist_x <= Lx / 2) * (dist_y <= Ly / 2) * (dist_z <= Lz / 2)
 
-    @property
+    @cached_property
     def bounds(self) -> Bound:
         """Returns bounding box min and max coordinates.
 
@@ -973,7 +1041,7 @@ class Sphere(Circular):
             return []
         return [Point(x0, y0).buffer(0.5 * intersect_dist)]
 
-    @property
+    @cached_property
     def bounds(self):
         """Returns bounding box min and max coordinates.
 
@@ -1076,7 +1144,7 @@ class Cylinder(Circular, Planar):
         inside_height = dist_z <= (self.length / 2)
         return inside_radius * inside_height
 
-    @property
+    @cached_property
     def bounds(self):
         """Returns bounding box min and max coordinates.
 
@@ -1372,7 +1440,7 @@ class PolySlab(Planar):
         """
         return np.tan(self.sidewall_angle)
 
-    @property
+    @cached_property
     def base_polygon(self) -> tidynumpy:
         """The polygon at the base after potential dilation operation.
 
@@ -1384,7 +1452,7 @@ class PolySlab(Planar):
 
         return self._shift_vertices(self._proper_vertices(self.vertices), self.dilation)[0]
 
-    @property
+    @cached_property
     def top_polygon(self) -> tidynumpy:
         """The polygon at the top after potential dilation and sidewall operation.
 
@@ -1429,43 +1497,26 @@ class PolySlab(Planar):
         z_local = z - z0 + self.length / 2  # distance to the base
         dist = -z_local * self._tanq
 
-        def contains_pointwise(face_polygon):
-            def fun_contain(xy_point):
-                point = Point(xy_point)
-                return face_polygon.covers(point)
-
-            return fun_contain
-
         if isinstance(x, np.ndarray):
             inside_polygon = np.zeros_like(inside_height)
-            xs_slab = x[inside_height]
-            ys_slab = y[inside_height]
 
             # vertical sidewall
             if np.isclose(self.sidewall_angle, 0):
-                face_polygon = Polygon(self.base_polygon)
-                fun_contain = contains_pointwise(face_polygon)
-                contains_vectorized = np.vectorize(fun_contain, signature="(n)->()")
-                points_stacked = np.stack((xs_slab, ys_slab), axis=1)
-                inside_polygon_slab = contains_vectorized(points_stacked)
-                inside_polygon[inside_height] = inside_polygon_slab
-            # slanted sidewall, offsetting vertices at each z
+                [face_polygon] = self._face_polygons([0.0])
+                inside_polygon[inside_height] = _covers_points(
+                    face_polygon, x[inside_height], y[inside_height]
+                )
+            # slanted sidewall, offsetting vertices at all z at once
             else:
-                for z_i in range(z.shape[2]):
-                    if not inside_height[0, 0, z_i]:
-                        continue
-                    vertices_z = self._shift_vertices(self.base_polygon, dist[0, 0, z_i])[0]
-                    face_polygon = Polygon(vertices_z)
-                    fun_contain = contains_pointwise(face_polygon)
-                    contains_vectorized = np.vectorize(fun_contain, signature="(n)->()")
-                    points_stacked = np.stack((x[:, :, 0].flatten(), y[:, :, 0].flatten()), axis=1)
-                    inside_polygon_slab = contains_vectorized(points_stacked)
-                    inside_polygon[:, :, z_i] = inside_polygon_slab.reshape(x.shape[:2])
+                z_indices = np.flatnonzero(inside_height[0, 0, :])
+                face_polygons = self._face_polygons(dist[0, 0, z_indices])
+                for z_i, face_polygon in zip(z_indices, face_polygons):
+                    inside_polygon[:, :, z_i] = _covers_points(
+                        face_polygon, x[:, :, z_i], y[:, :, z_i]
+                    )
         else:
-            vertices_z = self._shift_vertices(self.base_polygon, dist)[0]
-            face_polygon = Polygon(vertices_z)
-            point = Point(x, y)
-            inside_polygon = face_polygon.covers(point)
+            [face_polygon] = self._face_polygons([dist])
+            inside_polygon = face_polygon.covers(Point(x, y))
         return inside_height * inside_polygon
 
     def _intersections_normal(self, z: float):
@@ -1486,8 +1537,7 @@ class PolySlab(Planar):
         z0, _ = self.pop_axis(self.center, axis=self.axis)
         z_local = z - z0 + self.length / 2  # distance to the base
         dist = -z_local * self._tanq
-        vertices_z = self._shift_vertices(self.base_polygon, dist)[0]
-        return [Polygon(vertices_z)]
+        return self._face_polygons([dist])
 
     def _intersections_side(self, position, axis) -> list:  # pylint:disable=too-many-locals
         """Find shapely geometries intersecting planar geometry with axis orthogonal to slab.
@@ -1523,18 +1573,22 @@ class PolySlab(Planar):
             `Shapely's Documentaton <https://shapely.readthedocs.io/en/stable/project.html>`_.
         """
 
+        cache_key = (axis, position)
+        if cache_key in self._side_sections:
+            return list(self._side_sections[cache_key])
+
         # find out all z_i where the plane will intersect the vertex
         z0, _ = self.pop_axis(self.center, axis=self.axis)
         z_base = z0 - self.length / 2
         height_list = self._find_intersecting_height(position, axis)
         polys = []
 
-        # looping through z_i to assemble the polygons
+        # looping through z_i to assemble the polygons, offsetting the vertices at all z_i at once
         height = 0.0
         height_list = np.append(height_list, self.length)
-        for h_local in height_list:
-            dist = -height * self._tanq
-            vertices = self._shift_vertices(self.base_polygon, dist)[0]
+        heights = np.append(0.0, np.cumsum(height_list)[:-1])
+        vertices_heights = self._shift_vertices_heights(self.base_polygon, -heights * self._tanq)
+        for h_local, vertices in zip(height_list, vertices_heights):
             z_min, z_max = z_base + height, z_base + height + h_local
             # for vertical sidewall, no need for complications
             if np.isclose(self.sidewall_angle, 0):
@@ -1590,7 +1644,31 @@ class PolySlab(Planar):
 
             height += h_local
 
-        return polys
+        _store_section(self._side_sections, cache_key, polys)
+        return list(polys)
+
+    @cached_property
+    def _face_sections(self) -> Dict[float, Polygon]:
+        """Cross sections normal to the axis computed so far, keyed by offset from the base."""
+        return {}
+
+    @cached_property
+    def _side_sections(self) -> Dict[Tuple[Axis, float], list]:
+        """Cross sections along the axis computed so far, keyed by ``(axis, position)``."""
+        return {}
+
+    def _face_polygons(self, dists: List[float]) -> List[Polygon]:
+        """Cross sections normal to the axis with the base polygon offset by each of ``dists``,
+        offsetting the vertices at once for the cross sections not computed before."""
+        dists = [float(dist) for dist in dists]
+        polygons = {dist: self._face_sections.get(dist) for dist in dists}
+        missing = [dist for dist, polygon in polygons.items() if polygon is None]
+        if missing:
+            vertices_dists = self._shift_vertices_heights(self.base_polygon, np.array(missing))
+            for dist, vertices in zip(missing, vertices_dists):
+                polygons[dist] = Polygon(vertices)
+                _store_section(self._face_sections, dist, polygons[dist])
+        return [polygons[dist] for dist in dists]
 
     def _find_intersecting_height(self, position: float, axis: int) -> np.ndarray:
         """Found a list of height where the plane will intersect with the vertices;
@@ -1932,6 +2010,27 @@ class PolySlab(Planar):
         """Converts a list of tuples (vertices) to a numpy array."""
         return np.array(vertices_tuple)
 
+    @staticmethod
+    def _shift_vertices_heights(vertices: np.ndarray, dists: np.ndarray) -> np.ndarray:
+        """Shifts the vertices of a polygon outward uniformly by each of ``dists``, which is
+        linear in the distance so that all shifts are computed at once.
+
+        Parameters
+        ----------
+        vertices : np.ndarray
+            Shape (N, 2) defining the polygon vertices in the xy-plane.
+        dists : np.ndarray
+            Shape (M,) distances to offset.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (M, N, 2) polygon vertices for each distance.
+        """
+        vertices_unit_shift = PolySlab._shift_vertices(vertices, 1.0)[0]
+        shift = vertices_unit_shift - vertices
+        return vertices[None, :, :] + np.asarray(dists, dtype=float)[:, None, None] * shift
+
     @staticmethod
     def _shift_vertices(  # pylint:disable=too-many-locals
         vertices: np.ndarray, dist
@@ -1994,6 +2093,492 @@ class PolySlab(Planar):
         return np.swapaxes(vs_orig + shift_total, -2, -1), parallel_shift, (shift_x, shift_y)
 
 
+class PolySlabGroup(Planar):
+    """Many polygons with vertical sidewalls extruded between the same slab bounds, stored as one
+    array of vertices. Used in a single :class:`.Structure`, it is a compact replacement for one
+    :class:`PolySlab` structure per polygon (eg. imported from a GDS layer).
+
+    Example
+    -------
+    >>> vertices = np.array([(0,0), (1,0), (1,1), (2,0), (3,0), (3,1), (2,1)])
+    >>> group = PolySlabGroup(vertices=vertices, offsets=[0, 3], axis=2, slab_bounds=(-1, 1))
+    """
+
+    slab_bounds: Tuple[float, float] = pydantic.Field(
+        ...,
+        title="Slab Bounds",
+        description="Minimum and maximum positions of the slabs along axis dimension.",
+        units=MICROMETER,
+    )
+
+    vertices: tidynumpy = pydantic.Field(
+        ...,
+        title="Vertices",
+        description="Array of shape (N, 2) holding the (d1, d2) positions of the vertices of all "
+        "polygons one after the other, along dimensions parallel to slab normal axis.",
+        units=MICROMETER,
+    )
+
+    offsets: List[pydantic.NonNegativeInt] = pydantic.Field(
+        ...,
+        title="Offsets",
+        description="Index into ``vertices`` of the first vertex of each polygon.",
+    )
+
+    @pydantic.validator("slab_bounds", always=True)
+    def set_length(cls, val, values):
+        """sets the .length field using zmin, zmax"""
+        zmin, zmax = val
+        values["length"] = zmax - zmin
+        return val
+
+    @pydantic.validator("vertices", always=True)
+    def correct_shape(cls, val):
+        """makes sure vertices is a float array of shape (N, 2)."""
+        val_np = np.array(val, dtype=float)
+        if val_np.ndim != 2 or val_np.shape[1] != 2:
+            raise SetupError(
+                "PolySlabGroup.vertices must be a 2 dimensional array shaped (N, 2).  "
+                f"Given array with shape of {val_np.shape}."
+            )
+        return val_np
+
+    @pydantic.validator("offsets", always=True)
+    def correct_offsets(cls, val, values):
+        """makes sure the polygons start at the first vertex and have at least 3 vertices each."""
+        vertices = values.get("vertices")
+        if vertices is None:
+            return val
+        num_vertices = np.diff(np.append(val, len(vertices)))
+        if len(val) == 0 or val[0] != 0 or np.any(num_vertices < 3):
+            raise SetupError(
+                "PolySlabGroup.offsets must start at 0 and give at least 3 vertices "
+                f"to each polygon, given {len(val)} offsets for {len(vertices)} vertices."
+            )
+        return val
+
+    @pydantic.validator("offsets", always=True)
+    def set_center(cls, val, values):
+        """sets the .center field using zmin, zmax, and the bounding box of the vertices"""
+        vertices = values.get("vertices")
+        if vertices is None:
+            return val
+        zmin, zmax = values.get("slab_bounds")
+        if np.isneginf(zmin) and np.isposinf(zmax):
+            z0 = 0.0
+        else:
+            z0 = (zmin + zmax) / 2.0
+        x0, y0 = (np.min(vertices, axis=0) + np.max(vertices, axis=0)) / 2.0
+        values["center"] = cls.unpop_axis(z0, (x0, y0), axis=values.get("axis"))
+        return val
+
+    @classmethod
+    def from_polygons(
+        cls, polygons: List[Vertices], axis: Axis, slab_bounds: Tuple[float, float]
+    ) -> "PolySlabGroup":
+        """Make a :class:`PolySlabGroup` from the vertices of each polygon.
+
+        Parameters
+        ----------
+        polygons : List[Vertices]
+            Vertices of each polygon, each of shape (N_i, 2).
+        axis : int
+            Integer index into the polygon's slab axis. (0,1,2) -> (x,y,z).
+        slab_bounds: Tuple[float, float]
+            Minimum and maximum positions of the slabs along ``axis``.
+
+        Returns
+        -------
+        :class:`PolySlabGroup`
+            Group holding all polygons.
+        """
+        polygons = [np.array(vertices, dtype=float).reshape((-1, 2)) for vertices in polygons]
+        offsets = np.cumsum([0] + [len(vertices) for vertices in polygons[:-1]])
+        return cls(
+            vertices=np.concatenate(polygons),
+            offsets=offsets.tolist(),
+            axis=axis,
+            slab_bounds=slab_bounds,
+        )
+
+    @classmethod
+    def from_gds(  # pylint:disable=too-many-arguments, too-many-locals
+        cls,
+        gds_cell,
+        axis: Axis,
+        slab_bounds: Tuple[float, float],
+        gds_layer: int,
+        gds_dtype: int = None,
+        gds_scale: pydantic.PositiveFloat = 1.0,
+        tolerance: pydantic.NonNegativeFloat = 0.0,
+        clip_box: Box = None,
+    ) -> "PolySlabGroup":
+        """Import all polygons of a layer of a ``gdspy.Cell`` into one :class:`PolySlabGroup`.
+        The polygons are processed together as one array of vertices, and the number of polygons
+        and vertices before and after processing is logged.
+
+        Parameters
+        ----------
+        gds_cell : gdspy.Cell
+            ``gdspy.Cell`` containing 2D geometric data.
+        axis : int
+            Integer index into the polygon's slab axis. (0,1,2) -> (x,y,z).
+        slab_bounds: Tuple[float, float]
+            Minimum and maximum positions of the slabs along ``axis``.
+        gds_layer : int
+            Layer index in the ``gds_cell``.
+        gds_dtype : int = None
+            Data-type index in the ``gds_cell``.
+            If ``None``, imports all data for this layer.
+        gds_scale : float = 1.0
+            Length scale used in GDS file in units of MICROMETER.
+            For example, if gds file uses nanometers, set ``gds_scale=1e-3``.
+            Must be positive.
+        tolerance : float = 0.0
+            If positive, vertices closer than ``tolerance`` (in MICROMETER) to the edge joining
+            their neighbours are removed, see :meth:`simplify_vertices`.
+        clip_box : :class:`Box` = None
+            If given, the polygons are clipped to the bounds of ``clip_box`` in the plane
+            (eg. the :class:`.Simulation`), polygons outside of it are dropped.
+
+        Returns
+        -------
+        :class:`PolySlabGroup`
+            Group holding all polygons of the layer.
+        """
+
+        vert_dict = gds_cell.get_polygons(by_spec=True)
+        all_vertices = []
+        for (gds_layer_file, gds_dtype_file), vertices in vert_dict.items():
+            if gds_layer_file == gds_layer:
+                if gds_dtype is None or gds_dtype == gds_dtype_file:
+                    all_vertices += vertices
+
+        if len(all_vertices) == 0:
+            raise Tidy3dKeyError(
+                f"Couldn't load gds_cell, no vertices found at gds_layer={gds_layer} "
+                f"with specified gds_dtype={gds_dtype}."
+            )
+
+        offsets = np.cumsum([0] + [len(vertices) for vertices in all_vertices[:-1]])
+        vertices = gds_scale * np.concatenate(all_vertices).astype(float)
+        num_polygons_file, num_vertices_file = len(offsets), len(vertices)
+
+        if clip_box is not None:
+            _, clip_min = cls.pop_axis(clip_box.bounds[0], axis=axis)
+            _, clip_max = cls.pop_axis(clip_box.bounds[1], axis=axis)
+            vertices, offsets = cls.clip_vertices(vertices, offsets, clip_min, clip_max)
+        if len(offsets) == 0:
+            raise SetupError(
+                f"No polygons of gds_layer={gds_layer} with gds_dtype={gds_dtype} "
+                "are left inside of 'clip_box'."
+            )
+
+        keep = np.any(vertices != vertices[cls._next_vertex_index(offsets, len(vertices))], axis=1)
+        vertices, offsets = cls._remove_vertices(vertices, offsets, keep)
+        if tolerance > 0:
+            vertices, offsets = cls.simplify_vertices(vertices, offsets, tolerance)
+
+        log.info(
+            f"Imported {num_polygons_file} polygons with {num_vertices_file} vertices from "
+            f"gds_layer={gds_layer} as one PolySlabGroup with {len(offsets)} polygons and "
+            f"{len(vertices)} vertices ({len(vertices) / num_vertices_file:.1%} of the vertices)."
+        )
+        return cls(vertices=vertices, offsets=offsets.tolist(), axis=axis, slab_bounds=slab_bounds)
+
+    @staticmethod
+    def _polygon_index(offsets: np.ndarray, num_vertices: int) -> np.ndarray:
+        """Index of the polygon of each vertex."""
+        return np.repeat(np.arange(len(offsets)), np.diff(np.append(offsets, num_vertices)))
+
+    @staticmethod
+    def _next_vertex_index(offsets: np.ndarray, num_vertices: int) -> np.ndarray:
+        """Index of the next vertex of each vertex, going back to the first one in each polygon."""
+        offsets = np.array(offsets, dtype=int)
+        next_index = np.arange(1, num_vertices + 1)
+        next_index[np.append(offsets[1:], num_vertices) - 1] = offsets
+        return next_index
+
+    @staticmethod
+    def _remove_vertices(
+        vertices: np.ndarray, offsets: np.ndarray, keep: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Keep the vertices where ``keep`` is True, dropping the polygons left with less than 3
+        vertices. Returns the new vertices and offsets."""
+        polygon_index = PolySlabGroup._polygon_index(offsets, len(vertices))
+        num_kept = np.bincount(polygon_index[keep], minlength=len(offsets))
+        keep = keep & (num_kept >= 3)[polygon_index]
+        num_kept = num_kept[num_kept >= 3]
+        offsets = np.cumsum(np.append(0, num_kept[:-1])).astype(int)
+        return vertices[keep], offsets
+
+    @staticmethod
+    def clip_vertices(
+        vertices: np.ndarray, offsets: np.ndarray, clip_min: Coordinate2D, clip_max: Coordinate2D
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Clip polygons to a rectangle in their plane. Only the polygons crossing the edges of
+        the rectangle are clipped one by one, the others are kept or dropped at once.
+
+        Parameters
+        ----------
+        vertices : np.ndarray
+            Shape (N, 2) array of the vertices of all polygons.
+        offsets : np.ndarray
+            Index of the first vertex of each polygon.
+        clip_min : Tuple[float, float]
+            Minimum coordinates of the rectangle.
+        clip_max : Tuple[float, float]
+            Maximum coordinates of the rectangle.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Vertices and offsets of the clipped polygons.
+        """
+        offsets = np.array(offsets, dtype=int)
+        inside, outside = PolySlabGroup._polygons_in_rect(vertices, offsets, clip_min, clip_max)
+
+        polygon_index = PolySlabGroup._polygon_index(offsets, len(vertices))
+        clipped = [vertices[inside[polygon_index]]]
+        ends = np.append(offsets[1:], len(vertices))
+        num_vertices = list((ends - offsets)[inside])
+        clip_rect = box(*clip_min, *clip_max)
+        for index in np.flatnonzero(~inside & ~outside):
+            polygon_vertices = vertices[offsets[index] : ends[index]]
+            for clipped_vertices in PolySlabGroup._clip_polygon(polygon_vertices, clip_rect):
+                clipped.append(clipped_vertices)
+                num_vertices.append(len(clipped_vertices))
+
+        offsets = np.cumsum([0] + num_vertices[:-1]).astype(int)
+        return np.concatenate(clipped).reshape((-1, 2)), offsets[: len(num_vertices)]
+
+    @staticmethod
+    def _polygons_in_rect(
+        vertices: np.ndarray, offsets: np.ndarray, clip_min: Coordinate2D, clip_max: Coordinate2D
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Whether each polygon is entirely inside, and whether it is entirely outside, of a
+        rectangle, from the bounding box of the polygon."""
+        polygon_min = np.minimum.reduceat(vertices, offsets, axis=0)
+        polygon_max = np.maximum.reduceat(vertices, offsets, axis=0)
+        inside = np.all(polygon_min >= clip_min, axis=1) & np.all(polygon_max <= clip_max, axis=1)
+        outside = np.any(polygon_min >= clip_max, axis=1) | np.any(polygon_max <= clip_min, axis=1)
+        return inside, outside
+
+    @staticmethod
+    def _clip_polygon(vertices: np.ndarray, clip_rect: Polygon) -> List[np.ndarray]:
+        """Vertices of each of the polygons left when clipping a polygon to a rectangle."""
+        shape = Polygon(vertices).intersection(clip_rect)
+        return [
+            np.array(poly.exterior.coords)[:-1]  # pylint:disable=no-member
+            for poly in getattr(shape, "geoms", [shape])
+            if isinstance(poly, Polygon) and poly.area > 0
+        ]
+
+    @staticmethod
+    def simplify_vertices(  # pylint:disable=too-many-locals
+        vertices: np.ndarray, offsets: np.ndarray, tolerance: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Remove the vertices closer than ``tolerance`` to the edge joining their neighbours,
+        keeping at least 3 vertices in each polygon. Each pass removes every other vertex at most,
+        for all polygons at once, until no vertex can be removed.
+
+        Parameters
+        ----------
+        vertices : np.ndarray
+            Shape (N, 2) array of the vertices of all polygons.
+        offsets : np.ndarray
+            Index of the first vertex of each polygon.
+        tolerance : float
+            Largest distance from a removed vertex to the edge replacing it.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Vertices and offsets of the simplified polygons.
+        """
+        offsets = np.array(offsets, dtype=int)
+        passes_without_removal = 0
+        parity = 0
+        while passes_without_removal < 2:
+            num_vertices = np.diff(np.append(offsets, len(vertices)))
+            polygon_index = PolySlabGroup._polygon_index(offsets, len(vertices))
+            next_index = PolySlabGroup._next_vertex_index(offsets, len(vertices))
+            prev_index = np.empty_like(next_index)
+            prev_index[next_index] = np.arange(len(vertices))
+
+            # distance of each vertex to the edge joining its neighbours
+            edge = vertices[next_index] - vertices[prev_index]
+            to_vertex = vertices - vertices[prev_index]
+            edge_length = np.linalg.norm(edge, axis=1)
+            cross = np.abs(edge[:, 0] * to_vertex[:, 1] - edge[:, 1] * to_vertex[:, 0])
+            dist = np.where(
+                edge_length > 0,
+                cross / np.where(edge_length > 0, edge_length, 1),
+                np.linalg.norm(to_vertex, axis=1),
+            )
+
+            # never remove two neighbouring vertices, including the last and first ones
+            local_index = np.arange(len(vertices)) - offsets[polygon_index]
+            remove = (dist <= tolerance) & (local_index % 2 == parity)
+            remove &= ~((parity == 0) & (local_index == num_vertices[polygon_index] - 1))
+
+            # keep at least 3 vertices in each polygon
+            num_removed = np.cumsum(remove)
+            num_removed_before = np.append(0, num_removed)[offsets][polygon_index]
+            remove &= num_removed - num_removed_before <= num_vertices[polygon_index] - 3
+
+            if np.any(remove):
+                vertices, offsets = PolySlabGroup._remove_vertices(vertices, offsets, ~remove)
+                passes_without_removal = 0
+            else:
+                passes_without_removal += 1
+            parity = 1 - parity
+        return vertices, offsets
+
+    @property
+    def polygons(self) -> List[np.ndarray]:
+        """The vertices of each polygon.
+
+        Returns
+        -------
+        List[np.ndarray]
+            Array of shape (N_i, 2) for each polygon, views into ``vertices``.
+        """
+        return np.split(self.vertices, self.offsets[1:])
+
+    @cached_property
+    def _shapely_polygons(self) -> List[Polygon]:
+        """The shapely polygon of each polygon in the group."""
+        return [Polygon(vertices) for vertices in self.polygons]
+
+    @cached_property
+    def _shapely_union(self) -> Shapely:
+        """Union of all polygons, as some may overlap."""
+        return unary_union(self._shapely_polygons)
+
+    @cached_property
+    def _shapely_union_dilated(self) -> Shapely:
+        """Union of all polygons, dilated by a small fraction of their extent."""
+        scale = np.max(np.abs(self.vertices))
+        return self._shapely_union.buffer(1e-8 * (1.0 + scale))
+
+    def inside(self, x, y, z) -> bool:
+        """Returns True if point ``(x,y,z)`` inside volume of geometry.
+
+        Parameters
+        ----------
+        x : float
+            Position of point in x direction.
+        y : float
+            Position of point in y direction.
+        z : float
+            Position of point in z direction.
+
+        Returns
+        -------
+        bool
+            Whether point ``(x,y,z)`` is inside geometry.
+        """
+        z0, _ = self.pop_axis(self.center, axis=self.axis)
+        z, (x, y) = self.pop_axis((x, y, z), axis=self.axis)
+        inside_height = np.abs(z - z0) <= (self.length / 2)
+
+        # avoid going into face checking if no points are inside slab bounds
+        if not np.any(inside_height):
+            return inside_height
+
+        if isinstance(x, np.ndarray) or isinstance(y, np.ndarray):
+            x, y, inside_height = np.broadcast_arrays(x, y, inside_height)
+            xs_slab = x[inside_height]
+            ys_slab = y[inside_height]
+            inside_polygon = np.zeros(inside_height.shape, dtype=bool)
+            inside_polygon[inside_height] = _covers_points(
+                self._shapely_union, xs_slab, ys_slab, self._shapely_union_dilated
+            )
+        else:
+            inside_polygon = self._shapely_union.covers(Point(x, y))
+        return inside_height * inside_polygon
+
+    def _intersections_normal(self, z: float):
+        """Find shapely geometries intersecting planar geometry with axis normal to slab.
+
+        Parameters
+        ----------
+        z : float
+            Position along the axis normal to slab.
+
+        Returns
+        -------
+        List[shapely.geometry.base.BaseGeometry]
+            List of 2D shapes that intersect plane.
+            For more details refer to
+            `Shapely's Documentaton <https://shapely.readthedocs.io/en/stable/project.html>`_.
+        """
+        return list(self._shapely_polygons)
+
+    def _intersections_side(self, position, axis) -> list:  # pylint:disable=too-many-locals
+        """Find shapely geometries intersecting planar geometry with axis orthogonal to slab.
+        The edges of all polygons crossing the plane are found at once.
+
+        Parameters
+        ----------
+        position : float
+            Position along ``axis``.
+        axis : int
+            Integer index into 'xyz' (0,1,2).
+
+        Returns
+        -------
+        List[shapely.geometry.base.BaseGeometry]
+            List of 2D shapes that intersect plane.
+            For more details refer to
+            `Shapely's Documentaton <https://shapely.readthedocs.io/en/stable/project.html>`_.
+        """
+
+        # the coordinate along ``axis`` is the first one, after flipping the vertices if needed
+        _, plane_axes = self.pop_axis((0, 1, 2), axis=self.axis)
+        vertices_axis = self.vertices
+        if plane_axes.index(axis) == 1:
+            vertices_axis = vertices_axis[:, ::-1]
+
+        polygon_index = self._polygon_index(self.offsets, len(vertices_axis))
+        next_index = self._next_vertex_index(self.offsets, len(vertices_axis))
+
+        x_b, y_b = vertices_axis.T
+        x_f, y_f = vertices_axis[next_index].T
+        crossing = ((x_f <= position) & (x_b > position)) | ((x_b <= position) & (x_f > position))
+        x_b, y_b, x_f, y_f = x_b[crossing], y_b[crossing], x_f[crossing], y_f[crossing]
+        ints_y = y_b + (y_f - y_b) / (x_f - x_b) * (position - x_b)
+
+        # each polygon crosses the plane an even number of times, so sorted by polygon and y
+        # the intersections pair up into the intervals inside of the polygons
+        ints_y = ints_y[np.lexsort((ints_y, polygon_index[crossing]))]
+
+        z_min, z_max = self.slab_bounds
+        polys = []
+        for y_min, y_max in ints_y.reshape((-1, 2)):
+            minx, miny = self._order_by_axis(plane_val=y_min, axis_val=z_min, axis=axis)
+            maxx, maxy = self._order_by_axis(plane_val=y_max, axis_val=z_max, axis=axis)
+            polys.append(box(minx=minx, miny=miny, maxx=maxx, maxy=maxy))
+        return polys
+
+    @cached_property
+    def bounds(self):
+        """Returns bounding box min and max coordinates.
+
+        Returns
+        -------
+        Tuple[float, float, float], Tuple[float, float, float]
+            Min and max bounds packaged as ``(minx, miny, minz), (maxx, maxy, maxz)``.
+        """
+        z_min, z_max = self.slab_bounds
+        xmin, ymin = np.min(self.vertices, axis=0)
+        xmax, ymax = np.max(self.vertices, axis=0)
+        bounds_min = self.unpop_axis(z_min, (xmin, ymin), axis=self.axis)
+        bounds_max = self.unpop_axis(z_max, (xmax, ymax), axis=self.axis)
+        return bounds_min, bounds_max
+
+
 # geometries that can be used to define structures.
-GeometryFields = (Box, Sphere, Cylinder, PolySlab)
+GeometryFields = (Box, Sphere, Cylinder, PolySlabGroup, PolySlab)
 GeometryType = Union[GeometryFields]
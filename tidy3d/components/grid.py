@@ -5,8 +5,9 @@ import numpy as np  # pylint:disable=unused-import
 import pydantic
 
 from .base import Tidy3dBaseModel, TYPE_TAG_STR
-from .types import Array, Axis
+from .types import Array, Axis, Literal
 from .geometry import Box
+from ..constants import SECOND
 from ..log import SetupError
 
 # data type of one dimensional coordinate array.
@@ -356,3 +357,90 @@ class Grid(Tidy3dBaseModel):
             inds_list.append((ind_min, ind_max))
 
         return inds_list
+
+
+class TimeMesh(Tidy3dBaseModel):
+    """Uniformly spaced time stepping points ``start + i * dt`` for ``i`` in ``range(num_steps)``.
+    Supports ``len()``, indexing and slicing like a numpy array, without storing all of the times.
+
+    Example
+    -------
+    >>> tmesh = TimeMesh(dt=1e-17, num_steps=100001)
+    >>> num_steps = len(tmesh)
+    >>> times = tmesh[1000:2000]
+    >>> ind = tmesh.searchsorted(5e-13)
+    """
+
+    start: float = pydantic.Field(
+        0.0, title="Start Time", description="Time of the first time step.", units=SECOND
+    )
+
+    dt: pydantic.PositiveFloat = pydantic.Field(
+        ..., title="Time Step", description="Time between consecutive time steps.", units=SECOND
+    )
+
+    num_steps: pydantic.NonNegativeInt = pydantic.Field(
+        ..., title="Number of Time Steps", description="Number of time stepping points."
+    )
+
+    @property
+    def size(self) -> int:
+        """Number of time stepping points."""
+        return self.num_steps
+
+    def __len__(self) -> int:
+        """Number of time stepping points."""
+        return self.num_steps
+
+    def times(self, inds: Array[int]) -> Array[float]:
+        """Times at the supplied (non-negative) time step indices."""
+        return self.start + np.asarray(inds) * self.dt
+
+    @property
+    def values(self) -> Array[float]:
+        """All of the times, as a numpy array."""
+        return self.times(np.arange(self.num_steps))
+
+    def __array__(self, dtype=None) -> Array[float]:
+        """Materialize the times when converted to a numpy array."""
+        return np.asarray(self.values, dtype=dtype)
+
+    def __getitem__(self, key):
+        """Time at an integer index, or numpy array of the times at a slice or array of indices."""
+        if isinstance(key, slice):
+            inds = range(self.num_steps)[key]
+            return self.times(np.arange(inds.start, inds.stop, inds.step))
+        if np.ndim(key) == 0:
+            ind = range(self.num_steps)[int(key)]
+            return float(self.times(ind))
+        inds = np.asarray(key)
+        inds = np.where(inds < 0, inds + self.num_steps, inds)
+        if np.any(inds < 0) or np.any(inds >= self.num_steps):
+            raise IndexError("TimeMesh index out of range.")
+        return self.times(inds)
+
+    def searchsorted(self, value: float, side: Literal["left", "right"] = "left"):
+        """Indices where ``value`` would be inserted to keep the times sorted,
+        like ``numpy.searchsorted``, computed in constant time."""
+
+        value = np.asarray(value, dtype=float)
+
+        # index of the last time before ``value`` from the uniform spacing
+        inds = np.floor((value - self.start) / self.dt)
+        inds = np.clip(inds, -1, self.num_steps - 1).astype(np.int64)
+
+        # correct for floating point errors by comparing with the times themselves
+        def before(inds):
+            """Whether the times at ``inds`` are on the left of the inserted ``value``."""
+            times = self.times(inds)
+            return times <= value if side == "right" else times < value
+
+        step_up = (inds + 1 < self.num_steps) & before(np.minimum(inds + 1, self.num_steps - 1))
+        inds = np.where(step_up, inds + 1, inds)
+        step_down = (inds >= 0) & ~before(np.maximum(inds, 0))
+        inds = np.where(step_down, inds - 1, inds)
+
+        inds = inds + 1
+        if inds.ndim == 0:
+            return int(inds)
+        return inds
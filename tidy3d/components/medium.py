@@ -7,7 +7,7 @@ from typing import List, Tuple, Union, Callable
 import pydantic as pd
 import numpy as np
 
-from .base import Tidy3dBaseModel
+from .base import Tidy3dBaseModel, cached_property
 from .types import PoleAndResidue, Ax, FreqBound
 from .viz import add_ax_if_none
 from .validators import validate_name_str
@@ -54,6 +54,16 @@ class AbstractMedium(ABC, Tidy3dBaseModel):
 
     _name_validator = validate_name_str()
 
+    def __hash__(self) -> int:
+        """Hash of the json string of the medium, computed once per instance, as the mediums of
+        many structures are hashed to find the distinct ones."""
+        return self._json_hash
+
+    @cached_property
+    def _json_hash(self) -> int:
+        """Hash of the json string of the medium."""
+        return super().__hash__()
+
     @abstractmethod
     def eps_model(self, frequency: float) -> complex:
         """Complex-valued permittivity as a function of frequency.
@@ -313,6 +323,11 @@ class AnisotropicMedium(AbstractMedium):
         description="Medium describing the zz-component of the diagonal permittivity tensor.",
     )
 
+    def __hash__(self) -> int:
+        """Hash of the json string of the medium, not stored as the component mediums may be
+        modified in place."""
+        return Tidy3dBaseModel.__hash__(self)
+
     @ensure_freq_in_range
     def eps_model(self, frequency: float) -> complex:
         """Complex-valued permittivity as a function of frequency."""
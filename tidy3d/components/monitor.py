@@ -7,6 +7,7 @@ import numpy as np
 
 from .types import Literal, Ax, EMField, ArrayLike, Array
 from .geometry import Box
+from .grid import TimeMesh
 from .validators import assert_plane
 from .mode import ModeSpec
 from .viz import PlotParams, plot_params_monitor, ARROW_COLOR_MONITOR, ARROW_ALPHA
@@ -45,14 +46,14 @@ class Monitor(Box, ABC):
         return Box(center=self.center, size=self.size)
 
     @abstractmethod
-    def storage_size(self, num_cells: int, tmesh: Array) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         """Size of monitor storage given the number of points after discretization.
 
         Parameters
         ----------
         num_cells : int
             Number of grid cells within the monitor after discretization by a :class:`Simulation`.
-        tmesh : Array
+        tmesh : Union[:class:`TimeMesh`, Array]
             The discretized time mesh of a :class:`Simulation`.
 
         Returns
@@ -105,7 +106,7 @@ class TimeMonitor(Monitor, ABC):
             raise SetupError("Monitor start time is greater than stop time.")
         return val
 
-    def time_inds(self, tmesh: Array) -> Tuple[int, int]:
+    def time_inds(self, tmesh: Union[TimeMesh, Array]) -> Tuple[int, int]:
         """Compute the starting and stopping index of the monitor in a given discrete time mesh."""
 
         tind_beg, tind_end = (0, 0)
@@ -119,12 +120,10 @@ class TimeMonitor(Monitor, ABC):
             tind_end = int(tmesh.size)
             t_stop = tmesh[-1]
         else:
-            tend = np.nonzero(tmesh <= t_stop)[0]
-            if tend.size > 0:
-                tind_end = int(tend[-1] + 1)
+            tind_end = int(tmesh.searchsorted(t_stop, side="right"))
 
         # Step to compare to in order to handle t_start = t_stop
-        if np.array(tmesh).size < 2:
+        if tmesh.size < 2:
             dt = 1e-20
         else:
             dt = tmesh[1] - tmesh[0]
@@ -133,15 +132,11 @@ class TimeMonitor(Monitor, ABC):
         if np.abs(self.start - t_stop) < dt:
             tind_beg = max(tind_end - 1, 0)
         else:
-            tbeg = np.nonzero(tmesh[0:tind_end] >= self.start)[0]
-            if tbeg.size > 0:
-                tind_beg = tbeg[0]
-            else:
-                tind_beg = tind_end
+            tind_beg = min(int(tmesh.searchsorted(self.start, side="left")), tind_end)
 
         return (tind_beg, tind_end)
 
-    def num_steps(self, tmesh: Array) -> int:
+    def num_steps(self, tmesh: Union[TimeMesh, Array]) -> int:
         """Compute number of time steps for a time monitor."""
 
         tind_beg, tind_end = self.time_inds(tmesh)
@@ -222,7 +217,7 @@ class FieldMonitor(AbstractFieldMonitor, FreqMonitor):
 
     _data_type: Literal["FieldData"] = pydantic.Field("FieldData")
 
-    def storage_size(self, num_cells: int, tmesh: Array) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # stores 1 complex number per grid cell, per frequency, per field
         return BYTES_COMPLEX * num_cells * len(self.freqs) * len(self.fields)
 
@@ -287,10 +282,7 @@ class FieldMonitor(AbstractFieldMonitor, FreqMonitor):
         # Create "surface" monitors
         monitors = []
         for center, size, name in zip(surface_centers, surface_sizes, surface_names):
-            mon_new = self.copy(deep=True)
-            mon_new.center = center
-            mon_new.size = size
-            mon_new.name = name
+            mon_new = self.updated_copy(center=center, size=size, name=name)
             monitors.append(mon_new)
 
         return monitors
@@ -313,7 +305,7 @@ class FieldTimeMonitor(AbstractFieldMonitor, TimeMonitor):
 
     _data_type: Literal["FieldTimeData"] = pydantic.Field("FieldTimeData")
 
-    def storage_size(self, num_cells: int, tmesh: Array) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # stores 1 real number per grid cell, per time step, per field
         num_steps = self.num_steps(tmesh)
         return BYTES_REAL * num_steps * num_cells * len(self.fields)
@@ -333,7 +325,7 @@ class FluxMonitor(AbstractFluxMonitor, FreqMonitor):
 
     _data_type: Literal["FluxData"] = pydantic.Field("FluxData")
 
-    def storage_size(self, num_cells: int, tmesh: Array) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # stores 1 real number per frequency
         return BYTES_REAL * len(self.freqs)
 
@@ -354,7 +346,7 @@ class FluxTimeMonitor(AbstractFluxMonitor, TimeMonitor):
 
     _data_type: Literal["FluxTimeData"] = pydantic.Field("FluxTimeData")
 
-    def storage_size(self, num_cells: int, tmesh: Array) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # stores 1 real number per time tep
         num_steps = self.num_steps(tmesh)
         return BYTES_REAL * num_steps
@@ -376,7 +368,7 @@ class ModeMonitor(AbstractModeMonitor):
 
     _data_type: Literal["ModeData"] = pydantic.Field("ModeData")
 
-    def storage_size(self, num_cells: int, tmesh: int) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # stores 3 complex numbers per frequency, per mode.
         return 3 * BYTES_COMPLEX * len(self.freqs) * self.mode_spec.num_modes
 
@@ -398,7 +390,7 @@ class ModeFieldMonitor(AbstractModeMonitor):
 
     _data_type: Literal["ModeFieldData"] = pydantic.Field("ModeFieldData")
 
-    def storage_size(self, num_cells: int, tmesh: int) -> int:
+    def storage_size(self, num_cells: int, tmesh: Union[TimeMesh, Array]) -> int:
         # fields store 6 complex numbers per grid cell, per frequency, per mode.
         field_size = 6 * BYTES_COMPLEX * num_cells * len(self.freqs) * self.mode_spec.num_modes
         return field_size
@@ -1,5 +1,6 @@
 # pylint: disable=too-many-lines, too-many-arguments
 """ Container holding all information about simulation and its components"""
+import warnings
 from typing import Dict, Tuple, List, Set
 from functools import lru_cache
 
@@ -9,12 +10,17 @@ import xarray as xr
 import matplotlib.pylab as plt
 import matplotlib as mpl
 from mpl_toolkits.axes_grid1 import make_axes_locatable
+from shapely.geometry import box as shapely_box
+from shapely.ops import unary_union
+from shapely.strtree import STRtree
 
+from .base import Tidy3dBaseModel, cache_states, cached_property
 from .validators import assert_unique_names, assert_objects_in_sim_bounds
-from .validators import validate_mode_objects_symmetry
+from .validators import validate_mode_objects_symmetry, timed_validator
+from .validators import get_bounds_array
 from .geometry import Box
 from .types import Symmetry, Ax, Shapely, FreqBound, GridSize, Axis
-from .grid import Coords1D, Grid, Coords
+from .grid import Coords1D, Grid, Coords, TimeMesh
 from .medium import Medium, MediumType, AbstractMedium, PECMedium
 from .structure import Structure
 from .source import SourceType, PlaneWave
@@ -42,6 +48,71 @@ MAX_GRID_CELLS = 20e9
 MAX_CELLS_TIMES_STEPS = 1e17
 MAX_MONITOR_DATA_SIZE_BYTES = 10e9
 
+# maximum number of planes whose structure shapes are stored for plotting
+MAX_CACHED_PLANES = 100
+
+# bytes held by the solver per grid cell: 6 field components and 2 update coefficients for each,
+# all stored in single precision
+SOLVER_BYTES_PER_CELL = 6 * 3 * 4
+
+
+def _medium_indices(structures: List[Structure]) -> Dict[AbstractMedium, int]:
+    """Index of the first structure using each distinct medium, in order."""
+    medium_indices = {}
+    for index, structure in enumerate(structures):
+        medium_indices.setdefault(structure.medium, index)
+    return medium_indices
+
+
+def _source_central_freqs(sources: List[SourceType]) -> np.ndarray:
+    """Center of the frequency range of each source."""
+    freq_ranges = np.array([source.source_time.frequency_range() for source in sources])
+    return np.mean(freq_ranges.reshape(-1, 2), axis=1)
+
+
+class SimulationEstimate(Tidy3dBaseModel):
+    """Size and cost of a :class:`Simulation`, computed from its grid without running it.
+
+    Example
+    -------
+    >>> sim = Simulation(size=(1, 1, 1), grid_size=(0.1, 0.1, 0.1), run_time=1e-12)
+    >>> estimate = sim.estimate()
+    >>> total_bytes = estimate.monitor_storage_total
+    """
+
+    num_cells: pydantic.NonNegativeInt = pydantic.Field(
+        ...,
+        title="Number of Cells",
+        description="Number of cells in the simulation grid, including the PML layers.",
+    )
+
+    num_cells_solver: pydantic.NonNegativeInt = pydantic.Field(
+        ...,
+        title="Number of Solver Cells",
+        description="Number of cells updated by the solver after reduction by the symmetries.",
+    )
+
+    num_time_steps: pydantic.NonNegativeInt = pydantic.Field(
+        ..., title="Number of Time Steps", description="Number of time steps in the simulation."
+    )
+
+    monitor_storage: Dict[str, pydantic.NonNegativeInt] = pydantic.Field(
+        ...,
+        title="Monitor Storage",
+        description="Mapping of monitor name to the estimated number of bytes of data it stores.",
+    )
+
+    solver_memory: pydantic.NonNegativeInt = pydantic.Field(
+        ...,
+        title="Solver Memory",
+        description="Estimated number of bytes of memory used by the solver.",
+    )
+
+    @property
+    def monitor_storage_total(self) -> int:
+        """Estimated number of bytes of data stored by all monitors."""
+        return sum(self.monitor_storage.values())
+
 
 class Simulation(Box):  # pylint:disable=too-many-public-methods
     """Contains all information about Tidy3d simulation.
@@ -217,13 +288,14 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
     # _plane_waves_in_homo = validate_plane_wave_intersections()
 
     @pydantic.validator("structures", always=True)
+    @timed_validator()
     def _validate_num_mediums(cls, val):
         """Error if too many mediums present."""
 
         if val is None:
             return val
 
-        mediums = {structure.medium for structure in val}
+        mediums = _medium_indices(val).keys()
         if len(mediums) > MAX_NUM_MEDIUMS:
             raise SetupError(
                 f"Tidy3d only supports {MAX_NUM_MEDIUMS} distinct mediums."
@@ -233,6 +305,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         return val
 
     @pydantic.validator("structures", always=True)
+    @timed_validator()
     def _structures_not_at_edges(cls, val, values):
         """Warn if any structures lie at the simulation boundaries."""
 
@@ -240,26 +313,21 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             return val
 
         sim_box = Box(size=values.get("size"), center=values.get("center"))
-        sim_bound_min, sim_bound_max = sim_box.bounds
-        sim_bounds = list(sim_bound_min) + list(sim_bound_max)
-
-        for istruct, structure in enumerate(val):
-            struct_bound_min, struct_bound_max = structure.geometry.bounds
-            struct_bounds = list(struct_bound_min) + list(struct_bound_max)
-
-            for sim_val, struct_val in zip(sim_bounds, struct_bounds):
+        sim_bounds = np.array(sim_box.bounds)
 
-                if np.isclose(sim_val, struct_val):
-                    log.warning(
-                        f"Structure at structures[{istruct}] has bounds that extend exactly to "
-                        "simulation edges. This can cause unexpected behavior. "
-                        "If intending to extend the structure to infinity along one dimension, "
-                        "use td.inf as a size variable instead to make this explicit."
-                    )
+        at_edges = np.any(np.isclose(get_bounds_array(val), sim_bounds), axis=(1, 2))
+        for istruct in np.flatnonzero(at_edges):
+            log.warning(
+                f"Structure at structures[{istruct}] has bounds that extend exactly to "
+                "simulation edges. This can cause unexpected behavior. "
+                "If intending to extend the structure to infinity along one dimension, "
+                "use td.inf as a size variable instead to make this explicit."
+            )
 
         return val
 
     @pydantic.validator("pml_layers", always=True)
+    @timed_validator()
     def _structures_not_close_pml(cls, val, values):  # pylint:disable=too-many-locals
         """Warn if any structures lie at the simulation boundaries."""
 
@@ -267,54 +335,35 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             return val
 
         sim_box = Box(size=values.get("size"), center=values.get("center"))
-        sim_bound_min, sim_bound_max = sim_box.bounds
+        sim_bound_min, sim_bound_max = np.array(sim_box.bounds)
 
         structures = values.get("structures")
         sources = values.get("sources")
         if (not structures) or (not sources):
             return val
 
-        def warn(istruct, side):
-            """Warning message for a structure too close to PML."""
-            log.warning(
-                f"Structure at structures[{istruct}] was detected as being less "
-                f"than half of a central wavelength from a PML on side {side}. "
-                "To avoid inaccurate results, please increase gap between "
-                "any structures and PML or fully extend structure through the pml."
-            )
+        # a structure closer than half of the longest central wavelength is too close
+        lambda0 = C_0 / np.min(_source_central_freqs(sources))
+        has_pml = np.array([pml.num_layers > 0 and not isinstance(pml, Absorber) for pml in val])
 
-        for istruct, structure in enumerate(structures):
-            struct_bound_min, struct_bound_max = structure.geometry.bounds
-
-            for source in sources:
-                fmin_src, fmax_src = source.source_time.frequency_range()
-                f_average = (fmin_src + fmax_src) / 2.0
-                lambda0 = C_0 / f_average
-
-                zipped = zip(["x", "y", "z"], sim_bound_min, struct_bound_min, val)
-                for axis, sim_val, struct_val, pml in zipped:
-                    if (
-                        pml.num_layers > 0
-                        and struct_val > sim_val
-                        and not isinstance(pml, Absorber)
-                    ):
-                        if abs(sim_val - struct_val) < lambda0 / 2:
-                            warn(istruct, axis + "-min")
-
-                zipped = zip(["x", "y", "z"], sim_bound_max, struct_bound_max, val)
-                for axis, sim_val, struct_val, pml in zipped:
-                    if (
-                        pml.num_layers > 0
-                        and struct_val < sim_val
-                        and not isinstance(pml, Absorber)
-                    ):
-                        if abs(sim_val - struct_val) < lambda0 / 2:
-                            warn(istruct, axis + "-max")
+        bounds = get_bounds_array(structures)
+        dist_min = bounds[:, 0] - sim_bound_min
+        dist_max = sim_bound_max - bounds[:, 1]
+        for side, dist in (("min", dist_min), ("max", dist_max)):
+            too_close = has_pml & (dist > 0) & (dist < lambda0 / 2)
+            for istruct, axis in zip(*np.nonzero(too_close)):
+                log.warning(
+                    f"Structure at structures[{istruct}] was detected as being less "
+                    f"than half of a central wavelength from a PML on side {'xyz'[axis]}-{side}. "
+                    "To avoid inaccurate results, please increase gap between "
+                    "any structures and PML or fully extend structure through the pml."
+                )
 
         return val
 
     @pydantic.validator("monitors", always=True)
-    def _warn_monitor_mediums_frequency_range(cls, val, values):
+    @timed_validator()
+    def _warn_monitor_mediums_frequency_range(cls, val, values):  # pylint:disable=too-many-locals
         """Warn user if any DFT monitors have frequencies outside of medium frequency range."""
 
         if val is None:
@@ -323,36 +372,40 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         structures = values.get("structures")
         structures = [] if not structures else structures
         medium_bg = values.get("medium")
-        mediums = [medium_bg] + [structure.medium for structure in structures]
+
+        # frequency ranges of the distinct mediums having one, and the first structure using each
+        medium_indices = [(medium_bg, -1)] + list(_medium_indices(structures).items())
+        medium_indices = [
+            (medium, index) for medium, index in medium_indices if medium.frequency_range
+        ]
+        if not medium_indices:
+            return val
+        freq_ranges = np.array([medium.frequency_range for medium, _ in medium_indices])
 
         for monitor_index, monitor in enumerate(val):
-            if not isinstance(monitor, FreqMonitor):
+            if not isinstance(monitor, FreqMonitor) or len(monitor.freqs) == 0:
                 continue
 
             freqs = np.array(monitor.freqs)
-            for medium_index, medium in enumerate(mediums):
-
-                # skip mediums that have no freq range (all freqs valid)
-                if medium.frequency_range is None:
-                    continue
-
-                # make sure medium frequency range includes all monitor frequencies
-                fmin_med, fmax_med = medium.frequency_range
-                if np.any(freqs < fmin_med) or np.any(freqs > fmax_med):
-                    if medium_index == 0:
-                        medium_str = "The simulation background medium"
-                    else:
-                        medium_str = f"The medium associated with structures[{medium_index-1}]"
+            not_covered = (np.min(freqs) < freq_ranges[:, 0]) | (np.max(freqs) > freq_ranges[:, 1])
+            for range_index in np.flatnonzero(not_covered):
+                fmin_med, fmax_med = freq_ranges[range_index]
+                medium_index = medium_indices[range_index][1]
+                if medium_index == -1:
+                    medium_str = "The simulation background medium"
+                else:
+                    medium_str = f"The medium associated with structures[{medium_index}]"
 
-                    log.warning(
-                        medium_str + f"has a frequency range: ({fmin_med:2e}, {fmax_med:2e}) (Hz)"
-                        "that does not fully cover the frequencies contained in "
-                        f"monitors[{monitor_index}]. "
-                        "This can cause innacuracies in the recorded results."
-                    )
+                log.warning(
+                    medium_str + f" has a frequency range: ({fmin_med:2e}, {fmax_med:2e}) (Hz) "
+                    "that does not fully cover the frequencies contained in "
+                    f"monitors[{monitor_index}]. "
+                    "This can cause innacuracies in the recorded results."
+                )
         return val
 
     @pydantic.validator("monitors", always=True)
+    @timed_validator()
     def _warn_monitor_simulation_frequency_range(cls, val, values):
         """Warn if any DFT monitors have frequencies outside of the simulation frequency range."""
 
@@ -382,49 +435,58 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         return val
 
     @pydantic.validator("sources", always=True)
+    @timed_validator()
     def _warn_grid_size_too_small(cls, val, values):  # pylint:disable=too-many-locals
         """Warn user if any grid size is too large compared to minimum wavelength in material."""
 
-        if val is None:
+        if not val:
             return val
 
         structures = values.get("structures")
         structures = [] if not structures else structures
         medium_bg = values.get("medium")
         grid_size = values.get("grid_size")
-        mediums = [medium_bg] + [structure.medium for structure in structures]
 
-        for source_index, source in enumerate(val):
-            fmin_src, fmax_src = source.source_time.frequency_range()
-            f_average = (fmin_src + fmax_src) / 2.0
+        # uniform grid steps, the nonuniform ones are not checked
+        # TODO: warn about nonuniform grid
+        uniform_axes = [axis for axis, dl in enumerate(grid_size) if isinstance(dl, float)]
+        if not uniform_axes:
+            return val
+        grid_steps = np.array([grid_size[axis] for axis in uniform_axes])
 
-            for medium_index, medium in enumerate(mediums):
+        # min wavelength in PEC is meaningless and we'll get divide by inf errors
+        medium_indices = [(medium_bg, -1)] + list(_medium_indices(structures).items())
+        medium_indices = [
+            (medium, index) for medium, index in medium_indices if not isinstance(medium, PECMedium)
+        ]
 
-                # min wavelength in PEC is meaningless and we'll get divide by inf errors
-                if isinstance(medium, PECMedium):
-                    continue
+        for source_index, f_average in enumerate(_source_central_freqs(val)):
+            for medium, medium_index in medium_indices:
 
                 eps_material = medium.eps_model(f_average)
                 n_material, _ = medium.eps_complex_to_nk(eps_material)
                 lambda_min = C_0 / f_average / n_material
 
-                for grid_index, dl in enumerate(grid_size):
-                    if isinstance(dl, float):
-                        if dl > lambda_min / MIN_GRIDS_PER_WVL:
-                            log.warning(
-                                f"The grid step in {'xyz'[grid_index]} has a value of {dl:.4f} (um)"
-                                ", which was detected as being large when compared to the "
-                                f"central wavelength of sources[{source_index}] "
-                                f"within the simulation medium "
-                                f"associated with structures[{medium_index + 1}], given by "
-                                f"{lambda_min:.4f} (um). "
-                                "To avoid inaccuracies, it is reccomended the grid size is reduced."
-                            )
-                    # TODO: warn about nonuniform grid
+                if medium_index == -1:
+                    medium_str = "the simulation background medium"
+                else:
+                    medium_str = f"the medium associated with structures[{medium_index}]"
+
+                too_large = grid_steps > lambda_min / MIN_GRIDS_PER_WVL
+                for axis, dl in zip(np.array(uniform_axes)[too_large], grid_steps[too_large]):
+                    log.warning(
+                        f"The grid step in {'xyz'[axis]} has a value of {dl:.4f} (um)"
+                        ", which was detected as being large when compared to the "
+                        f"central wavelength of sources[{source_index}] "
+                        f"within {medium_str}, given by "
+                        f"{lambda_min:.4f} (um). "
+                        "To avoid inaccuracies, it is reccomended the grid size is reduced."
+                    )
 
         return val
 
     @pydantic.validator("sources", always=True)
+    @timed_validator()
     def _plane_wave_homogeneous(cls, val, values):
         """Error if plane wave intersects"""
 
@@ -468,22 +530,27 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
     """ Pre submit validation (before web.upload()) """
 
     def validate_pre_upload(self) -> None:
-        """Validate the fully initialized simulation is ok for upload to our servers."""
-        self._validate_size()
-        self._validate_monitor_size()
+        """Validate the fully initialized simulation is ok for upload to our servers.
+        Parts made by trusted construction are fully validated first."""
+        estimate = self.validate_deferred().estimate()
+        self._validate_size(estimate)
+        self._validate_monitor_size(estimate)
         # self._validate_run_time()
 
-    def _validate_size(self) -> None:
+    def _validate_size(self, estimate: SimulationEstimate = None) -> None:
         """Ensures the simulation is within size limits before simulation is uploaded."""
 
-        num_cells = self.num_cells
+        if estimate is None:
+            estimate = self.estimate()
+
+        num_cells = estimate.num_cells
         if num_cells > MAX_GRID_CELLS:
             raise SetupError(
                 f"Simulation has {num_cells:.2e} computational cells, "
                 f"a maximum of {MAX_GRID_CELLS:.2e} are allowed."
             )
 
-        num_time_steps = self.num_time_steps
+        num_time_steps = estimate.num_time_steps
         if num_time_steps > MAX_TIME_STEPS:
             raise SetupError(
                 f"Simulation has {num_time_steps:.2e} time steps, "
@@ -497,19 +564,13 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
                 f"a maximum of {MAX_CELLS_TIMES_STEPS:.2e} are allowed."
             )
 
-    def _validate_monitor_size(self) -> None:
+    def _validate_monitor_size(self, estimate: SimulationEstimate = None) -> None:
         """Ensures the monitors arent storing too much data before simulation is uploaded."""
 
-        tmesh = self.tmesh
-
-        total_size_bytes = 0
-        for monitor in self.monitors:
-            monitor_grid = self.discretize(monitor)
-            num_cells = np.prod(monitor_grid.num_cells)
-            monitor_size = monitor.storage_size(num_cells=num_cells, tmesh=tmesh)
-
-            total_size_bytes += monitor_size
+        if estimate is None:
+            estimate = self.estimate()
 
+        total_size_bytes = estimate.monitor_storage_total
         if total_size_bytes > MAX_MONITOR_DATA_SIZE_BYTES:
             raise SetupError(
                 f"Simulation's monitors have {total_size_bytes:.2e} bytes of estimated storage, "
@@ -527,6 +588,52 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
 
     """ Accounting """
 
+    def estimate(self) -> SimulationEstimate:
+        """Estimate the size of the simulation and of its monitor data before running it.
+
+        Returns
+        -------
+        :class:`SimulationEstimate`
+            Number of cells and time steps, monitor storage and solver memory.
+
+        Note
+        ----
+        Only the grid boundaries are computed, so this is cheap compared to running or plotting
+        the simulation and can be used to check many simulations before uploading them.
+        Monitor data is stored only in the region not covered by the symmetries.
+        """
+
+        grid = self.grid
+        tmesh = self._make_time_mesh(self._grid_dt(grid))
+
+        num_cells_axes = grid.num_cells
+        num_cells_solver = 1
+        for num_cells_axis, sym in zip(num_cells_axes, self.symmetry):
+            # the grid is mirrored about the center, so only half of it is simulated
+            num_cells_solver *= num_cells_axis if sym == 0 else (num_cells_axis + 1) // 2
+
+        bounds_pml = self._grid_bounds_pml(grid)
+        monitor_storage = {}
+        for monitor in self.monitors:
+            box = self._min_sym_box(monitor, bounds_pml)
+            disc_inds = grid.discretize_inds(box)
+            num_cells = np.prod(
+                [ind_max - ind_min for ind_min, ind_max in disc_inds], dtype=np.int64
+            )
+            monitor_storage[monitor.name] = int(
+                monitor.storage_size(num_cells=num_cells, tmesh=tmesh)
+            )
+
+        solver_memory = SOLVER_BYTES_PER_CELL * num_cells_solver + sum(monitor_storage.values())
+
+        return SimulationEstimate(
+            num_cells=np.prod(num_cells_axes, dtype=np.int64),
+            num_cells_solver=num_cells_solver,
+            num_time_steps=len(tmesh),
+            monitor_storage=monitor_storage,
+            solver_memory=solver_memory,
+        )
+
     @property
     @lru_cache()
     def mediums(self) -> Set[MediumType]:
@@ -605,6 +712,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         z: float = None,
         freq: float = None,
         alpha: float = None,
+        raster_points: int = None,
         ax: Ax = None,
     ) -> Ax:
         """Plot each of simulation's components on a plane defined by one nonzero x,y,z coordinate.
@@ -624,6 +732,9 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         alpha : float = None
             Opacity of the structures being plotted.
             Defaults to the structure default alpha.
+        raster_points : int = None
+            If given, the permittivity is drawn as one image with this number of points along the
+            longest side of the plane, see :meth:`plot_structures_eps`.
         ax : matplotlib.axes._subplots.Axes = None
             Matplotlib axes to plot on, if not specified, one is created.
 
@@ -633,7 +744,9 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             The supplied or created matplotlib axes.
         """
 
-        ax = self.plot_structures_eps(freq=freq, cbar=True, alpha=alpha, ax=ax, x=x, y=y, z=z)
+        ax = self.plot_structures_eps(
+            freq=freq, cbar=True, alpha=alpha, raster_points=raster_points, ax=ax, x=x, y=y, z=z
+        )
         ax = self.plot_sources(ax=ax, x=x, y=y, z=z)
         ax = self.plot_monitors(ax=ax, x=x, y=y, z=z)
         ax = self.plot_symmetries(ax=ax, x=x, y=y, z=z)
@@ -665,14 +778,14 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             The supplied or created matplotlib axes.
         """
 
-        medium_shapes = self._filter_structures_plane(self.structures, x=x, y=y, z=z)
+        medium_shapes = self._get_structures_plane(x=x, y=y, z=z)
         medium_map = self.medium_map
 
-        for (medium, shape) in medium_shapes:
+        for (medium, shapes) in self._group_shapes_by_medium(medium_shapes):
             if medium != self.medium:
                 mat_index = medium_map[medium]
-                ax = self._plot_shape_structure(
-                    medium=medium, mat_index=mat_index, shape=shape, ax=ax
+                ax = self._plot_shapes_structure(
+                    medium=medium, mat_index=mat_index, shapes=shapes, ax=ax
                 )
 
         ax = self._set_plot_bounds(ax=ax, x=x, y=y, z=z)
@@ -684,10 +797,24 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
 
         return ax
 
-    def _plot_shape_structure(self, medium: Medium, mat_index: int, shape: Shapely, ax: Ax) -> Ax:
-        """Plot a structure's cross section shape for a given medium."""
+    @staticmethod
+    def _group_shapes_by_medium(
+        medium_shapes: List[Tuple[Medium, Shapely]]
+    ) -> List[Tuple[Medium, List[Shapely]]]:
+        """Shapes of each medium, in the order the mediums first appear. The shapes of a medium
+        given by :meth:`_filter_structures_plane` share the same medium object, which is used
+        instead of comparing the mediums."""
+        shapes_by_medium = {}
+        for medium, shape in medium_shapes:
+            shapes_by_medium.setdefault(id(medium), (medium, []))[1].append(shape)
+        return list(shapes_by_medium.values())
+
+    def _plot_shapes_structure(
+        self, medium: Medium, mat_index: int, shapes: List[Shapely], ax: Ax
+    ) -> Ax:
+        """Plot the cross section shapes of the structures of a given medium."""
         plot_params_struct = self._get_structure_plot_params(medium=medium, mat_index=mat_index)
-        ax = self.plot_shape(shape=shape, plot_params=plot_params_struct, ax=ax)
+        ax = self.plot_shapes(shapes=shapes, plot_params=plot_params_struct, ax=ax)
         return ax
 
     def _get_structure_plot_params(self, mat_index: int, medium: Medium) -> PlotParams:
@@ -732,6 +859,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         alpha: float = None,
         cbar: bool = True,
         reverse: bool = False,
+        raster_points: int = None,
         ax: Ax = None,
     ) -> Ax:
         """Plot each of simulation's structures on a plane defined by one nonzero x,y,z coordinate.
@@ -756,6 +884,10 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         alpha : float = None
             Opacity of the structures being plotted.
             Defaults to the structure default alpha.
+        raster_points : int = None
+            If given, the permittivity is evaluated on a grid with this number of points along
+            the longest side of the plane and drawn as one image, instead of drawing the shapes
+            of the structures.
         ax : matplotlib.axes._subplots.Axes = None
             Matplotlib axes to plot on, if not specified, one is created.
 
@@ -766,19 +898,33 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         """
 
         eps_min, eps_max = self.eps_bounds(freq=freq)
-        medium_shapes = self._filter_structures_plane(self.structures, x=x, y=y, z=z)
-        for (medium, shape) in medium_shapes:
-            if medium != self.medium:
-                ax = self._plot_shape_structure_eps(
-                    freq=freq,
-                    alpha=alpha,
-                    medium=medium,
-                    eps_min=eps_min,
-                    eps_max=eps_max,
-                    reverse=reverse,
-                    shape=shape,
-                    ax=ax,
-                )
+        if raster_points is not None:
+            ax = self._plot_structures_eps_raster(
+                x=x,
+                y=y,
+                z=z,
+                freq=freq,
+                alpha=alpha,
+                eps_min=eps_min,
+                eps_max=eps_max,
+                reverse=reverse,
+                raster_points=raster_points,
+                ax=ax,
+            )
+        else:
+            medium_shapes = self._get_structures_plane(x=x, y=y, z=z)
+            for (medium, shapes) in self._group_shapes_by_medium(medium_shapes):
+                if medium != self.medium:
+                    ax = self._plot_shapes_structure_eps(
+                        freq=freq,
+                        alpha=alpha,
+                        medium=medium,
+                        eps_min=eps_min,
+                        eps_max=eps_max,
+                        reverse=reverse,
+                        shapes=shapes,
+                        ax=ax,
+                    )
 
         if cbar:
             self._add_cbar(eps_min=eps_min, eps_max=eps_max, ax=ax)
@@ -837,22 +983,61 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
 
         return plot_params
 
-    def _plot_shape_structure_eps(
+    def _plot_shapes_structure_eps(
         self,
         freq: float,
         medium: Medium,
-        shape: Shapely,
+        shapes: List[Shapely],
         eps_min: float,
         eps_max: float,
         ax: Ax,
         reverse: bool = False,
         alpha: float = None,
     ) -> Ax:
-        """Plot a structure's cross section shape for a given medium, grayscale for permittivity."""
+        """Plot the cross section shapes of the structures of a given medium, grayscale for
+        permittivity."""
         plot_params = self._get_structure_eps_plot_params(
             medium=medium, freq=freq, eps_min=eps_min, eps_max=eps_max, alpha=alpha, reverse=reverse
         )
-        ax = self.plot_shape(shape=shape, plot_params=plot_params, ax=ax)
+        ax = self.plot_shapes(shapes=shapes, plot_params=plot_params, ax=ax)
+        return ax
+
+    def _plot_structures_eps_raster(  # pylint:disable=too-many-locals
+        self,
+        freq: float,
+        eps_min: float,
+        eps_max: float,
+        raster_points: int,
+        ax: Ax,
+        x: float = None,
+        y: float = None,
+        z: float = None,
+        reverse: bool = False,
+        alpha: float = None,
+    ) -> Ax:
+        """Plot the permittivity on a plane as an image, evaluated on a grid of ``raster_points``
+        along the longest side of the plane."""
+        axis, position = self.parse_xyz_kwargs(x=x, y=y, z=z)
+        _, plane_min = self.pop_axis(self.bounds_pml[0], axis=axis)
+        _, plane_max = self.pop_axis(self.bounds_pml[1], axis=axis)
+        step = max(np.array(plane_max) - np.array(plane_min)) / raster_points
+        plane_coords = [
+            np.arange(coord_min + step / 2, coord_max, step)
+            for coord_min, coord_max in zip(plane_min, plane_max)
+        ]
+        coords = Coords(**dict(zip("xyz", self.unpop_axis([position], plane_coords, axis=axis))))
+        eps_plane = self._epsilon_on_coords(coords=coords, freq=freq).values.real
+        eps_plane = np.squeeze(eps_plane, axis=axis)
+        ax.imshow(
+            eps_plane.T,
+            origin="lower",
+            extent=(plane_min[0], plane_max[0], plane_min[1], plane_max[1]),
+            cmap="gist_gray" if reverse else "gist_yarg",
+            vmin=eps_min,
+            vmax=eps_max,
+            alpha=alpha,
+            interpolation="nearest",
+        )
         return ax
 
     @equal_aspect
@@ -902,8 +1087,23 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         matplotlib.axes._subplots.Axes
             The supplied or created matplotlib axes.
         """
+        # monitors adding more than their shapes (eg. mode monitor arrows) plot themselves, the
+        # shapes of the others are plotted as one collection per plot parameters
+        shapes_by_params = {}
         for monitor in self.monitors:
-            ax = monitor.plot(x=x, y=y, z=z, ax=ax)
+            if type(monitor).plot is not Monitor.plot:
+                ax = monitor.plot(x=x, y=y, z=z, ax=ax)
+            elif monitor.intersects_plane(x=x, y=y, z=z):
+                plot_params = monitor.plot_params
+                shapes_by_params.setdefault(id(plot_params), (plot_params, []))[1].extend(
+                    monitor.intersections(x=x, y=y, z=z)
+                )
+        for plot_params, shapes in shapes_by_params.values():
+            ax = self.plot_shapes(shapes=shapes, plot_params=plot_params, ax=ax)
+
+        axis, position = self.parse_xyz_kwargs(x=x, y=y, z=z)
+        ax = self.add_ax_labels_lims(axis=axis, ax=ax)
+        ax.set_title(f"cross section at {'xyz'[axis]}={position:.2f}")
         ax = self._set_plot_bounds(ax=ax, x=x, y=y, z=z)
         return ax
 
@@ -928,9 +1128,13 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         List[Tuple[float, float]]
             List containing the absorber thickness (micron) in - and + boundaries.
         """
+        return self._grid_pml_thicknesses(self.grid)
+
+    def _grid_pml_thicknesses(self, grid: Grid) -> List[Tuple[float, float]]:
+        """Thicknesses (um) of absorbers given the simulation ``grid``."""
         num_layers = self.num_pml_layers
         pml_thicknesses = []
-        for num_layer, boundaries in zip(num_layers, self.grid.boundaries.to_list):
+        for num_layer, boundaries in zip(num_layers, grid.boundaries.to_list):
             thick_l = boundaries[num_layer[0]] - boundaries[0]
             thick_r = boundaries[-1] - boundaries[-1 - num_layer[1]]
             pml_thicknesses.append((thick_l, thick_r))
@@ -939,7 +1143,13 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
     @property
     def bounds_pml(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
         """Simulation bounds including the PML regions."""
-        pml_thick = self.pml_thicknesses
+        return self._grid_bounds_pml(self.grid)
+
+    def _grid_bounds_pml(
+        self, grid: Grid
+    ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """Simulation bounds including the PML regions given the simulation ``grid``."""
+        pml_thick = self._grid_pml_thicknesses(grid)
         bounds_in = self.bounds
         bounds_min = tuple((bmin - pml[0] for bmin, pml in zip(bounds_in[0], pml_thick)))
         bounds_max = tuple((bmax + pml[1] for bmax, pml in zip(bounds_in[1], pml_thick)))
@@ -1157,6 +1367,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         """
 
         shapes = []
+        shape_mediums = []
         for structure in structures:
 
             # dont bother with geometries that dont intersect plane
@@ -1169,45 +1380,77 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             # Append each of them and their medium information to the list of shapes
             for shape in shapes_plane:
                 shape = Box.evaluate_inf_shape(shape)
-                shapes.append((structure.medium, shape, shape.bounds))
-
-        background_shapes = []
-        for medium, shape, bounds in shapes:
-
-            minx, miny, maxx, maxy = bounds
-
-            # loop through background_shapes (note: all background are non-intersecting or merged)
-            for index, (_medium, _shape, _bounds) in enumerate(background_shapes):
-
-                _minx, _miny, _maxx, _maxy = _bounds
-
-                # do a bounding box check to see if any intersection to do anything about
-                if minx > _maxx or _minx > maxx or miny > _maxy or _miny > maxy:
-                    continue
-
-                # look more closely to see if intersected.
-                if not shape.intersects(_shape):
-                    continue
-
-                diff_shape = _shape - shape
-
-                # different medium, remove intersection from background shape
-                if medium != _medium:
-                    background_shapes[index] = (_medium, diff_shape, diff_shape.bounds)
-
-                # same medium, add diff shape to this shape and mark background shape for removal
-                else:
-                    shape = shape | diff_shape
-                    background_shapes[index] = None
-
-            # after doing this with all background shapes, add this shape to the background
-            background_shapes.append((medium, shape, shape.bounds))
-
-            # remove any existing background shapes that have been marked as 'None'
-            background_shapes = [b for b in background_shapes if b is not None]
-
-        # filter out any remaining None or empty shapes (shapes with area completely removed)
-        return [(medium, shape) for (medium, shape, _) in background_shapes if shape]
+                if not shape.is_empty:
+                    shapes.append(shape)
+                    shape_mediums.append(structure.medium)
+
+        # index of the medium of each shape into the distinct mediums
+        mediums = {}
+        medium_indices = [mediums.setdefault(medium, len(mediums)) for medium in shape_mediums]
+
+        # the tree holds the bounding boxes, new objects, to find the index of the shapes returned
+        bounding_boxes = [shapely_box(*shape.bounds) for shape in shapes]
+        box_indices = {id(bounding_box): index for index, bounding_box in enumerate(bounding_boxes)}
+        with warnings.catch_warnings():
+            # shapely 1.8 warns that the tree will return indices instead of geometries in 2.0
+            warnings.simplefilter("ignore", category=FutureWarning)
+            tree = STRtree(bounding_boxes)
+
+        # remove from each shape the later shapes overlapping it, and group the rest by medium,
+        # only the shapes that may touch others of the same medium need to be merged
+        shapes_separate = [[] for _ in mediums]
+        shapes_to_merge = [[] for _ in mediums]
+        for index, (shape, medium_index) in enumerate(zip(shapes, medium_indices)):
+            # shapely 2 returns the indices of the boxes found, shapely 1 the boxes themselves
+            overlap_indices = [
+                int(found) if isinstance(found, (int, np.integer)) else box_indices[id(found)]
+                for found in tree.query(shape)
+            ]
+            later_shapes = [shapes[other] for other in overlap_indices if other > index]
+            if later_shapes:
+                shape = shape - unary_union(later_shapes)
+            if shape.is_empty:
+                continue
+            if any(
+                medium_indices[other] == medium_index for other in overlap_indices if other != index
+            ):
+                shapes_to_merge[medium_index].append(shape)
+            else:
+                shapes_separate[medium_index].append(shape)
+
+        # merge the shapes of each medium, the ones not touching are returned separately
+        medium_shapes = []
+        for medium, medium_index in mediums.items():
+            shape = unary_union(shapes_to_merge[medium_index])
+            parts = shapes_separate[medium_index] + list(getattr(shape, "geoms", [shape]))
+            medium_shapes += [(medium, part) for part in parts if not part.is_empty]
+        return medium_shapes
+
+    @cached_property
+    def _plane_shapes(self) -> Dict[Tuple[Axis, float], Tuple[list, List[Tuple[Medium, Shapely]]]]:
+        """Shapes of the structures on the planes plotted so far, keyed by ``(axis, position)``,
+        with the :func:`.cache_states` of the structures they were computed from."""
+        return {}
+
+    def _get_structures_plane(
+        self, x: float = None, y: float = None, z: float = None
+    ) -> List[Tuple[Medium, Shapely]]:
+        """Shapes of the structures on plane specified by {x,y,z}, as given by
+        :meth:`_filter_structures_plane`, computed once per plane, and again after the structures
+        are modified in place."""
+        plane_key = self.parse_xyz_kwargs(x=x, y=y, z=z)
+        states = cache_states(self.structures)
+        stored_states, shapes = self._plane_shapes.get(plane_key, (None, None))
+        if (
+            stored_states is None
+            or len(stored_states) != len(states)
+            or any(stored is not state for stored, state in zip(stored_states, states))
+        ):
+            if len(self._plane_shapes) >= MAX_CACHED_PLANES:
+                self._plane_shapes.clear()
+            shapes = self._filter_structures_plane(self.structures, x=x, y=y, z=z)
+            self._plane_shapes[plane_key] = (states, shapes)
+        return list(shapes)
 
     @property
     def frequency_range(self) -> FreqBound:
@@ -1234,11 +1477,32 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         float
             Time step (seconds).
         """
-        dl_mins = [np.min(sizes) for sizes in self.grid.sizes.to_list]
+        return self._grid_dt(self.grid)
+
+    def _grid_dt(self, grid: Grid) -> float:
+        """Simulation time step (seconds) given the simulation ``grid``."""
+        dl_mins = [np.min(sizes) for sizes in grid.sizes.to_list]
         dl_sum_inv_sq = sum([1 / dl**2 for dl in dl_mins])
         dl_avg = 1 / np.sqrt(dl_sum_inv_sq)
         return self.courant * dl_avg / C_0
 
+    @property
+    def time_mesh(self) -> TimeMesh:
+        """FDTD time stepping points, without storing all of the times.
+
+        Returns
+        -------
+        :class:`TimeMesh`
+            Times (seconds) that the simulation time steps through.
+        """
+        return self._make_time_mesh(self.dt)
+
+    def _make_time_mesh(self, dt: float) -> TimeMesh:
+        """FDTD time stepping points given the time step ``dt``."""
+        # same number of points as ``np.arange(0.0, run_time + dt, dt)``
+        num_steps = int(np.ceil((self.run_time + dt) / dt))
+        return TimeMesh(start=0.0, dt=dt, num_steps=num_steps)
+
     @property
     def tmesh(self) -> Coords1D:
         """FDTD time stepping points.
@@ -1248,14 +1512,13 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         np.ndarray
             Times (seconds) that the simulation time steps through.
         """
-        dt = self.dt
-        return np.arange(0.0, self.run_time + dt, dt)
+        return self.time_mesh.values
 
     @property
     def num_time_steps(self) -> int:
         """Number of time steps in simulation."""
 
-        return len(self.tmesh)
+        return len(self.time_mesh)
 
     @staticmethod
     def _make_bound_coords_uniform(dl, center, size):
@@ -1393,7 +1656,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         n_max, _ = AbstractMedium.eps_complex_to_nk(eps_max)
         return wvl_min / n_max
 
-    def min_sym_box(self, box: Box) -> Box:  # pylint:disable=too-many-locals
+    def min_sym_box(self, box: Box) -> Box:
         """Compute the smallest Box restricted to the first quadrant in the presence of symmetries
         that fully covers the original Box when symmetries are applied.
 
@@ -1409,8 +1672,15 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
             mapped from ``new_box`` using the simulation symmetries.
         """
 
+        return self._min_sym_box(box, self.bounds_pml)
+
+    def _min_sym_box(  # pylint:disable=too-many-locals
+        self, box: Box, bounds_pml: Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+    ) -> Box:
+        """Smallest symmetry-reduced Box covering ``box``, given the simulation ``bounds_pml``."""
+
         bounds_min, bounds_max = box.bounds
-        sim_bs_min, sim_bs_max = self.bounds_pml
+        sim_bs_min, sim_bs_max = bounds_pml
         bmin_new, bmax_new = [], []
 
         zipped = zip(self.center, self.symmetry, bounds_min, bounds_max, sim_bs_min, sim_bs_max)
@@ -1491,6 +1761,13 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         """
 
         sub_grid = self.discretize(box)
+        return self._epsilon_on_coords(coords=sub_grid[coord_key], coord_key=coord_key, freq=freq)
+
+    def _epsilon_on_coords(
+        self, coords: Coords, coord_key: str = "centers", freq: float = None
+    ) -> xr.DataArray:
+        """Get array of permittivity on the grid of points defined by ``coords``, see
+        :meth:`epsilon`."""
 
         def get_eps(medium: Medium, freq: float):
             """Select the correct epsilon component if field locations are requested."""
@@ -1506,14 +1783,20 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         def make_eps_data(coords: Coords):
             """returns epsilon data on grid of points defined by coords"""
             xs, ys, zs = coords.x, coords.y, coords.z
-            x, y, z = np.meshgrid(xs, ys, zs, indexing="ij")
-            eps_array = eps_background * np.ones(x.shape, dtype=complex)
+            eps_array = eps_background * np.ones((len(xs), len(ys), len(zs)), dtype=complex)
             for structure in self.structures:
+                # only test the points within the bounds of the structure
+                bounds_min, bounds_max = structure.geometry.bounds
+                slices = tuple(
+                    slice(np.searchsorted(xyz, x_min, "left"), np.searchsorted(xyz, x_max, "right"))
+                    for xyz, x_min, x_max in zip((xs, ys, zs), bounds_min, bounds_max)
+                )
+                x, y, z = np.meshgrid(xs[slices[0]], ys[slices[1]], zs[slices[2]], indexing="ij")
+                if x.size == 0:
+                    continue
                 eps_structure = get_eps(structure.medium, freq)
                 is_inside = structure.geometry.inside(x, y, z)
-                eps_array[np.where(is_inside)] = eps_structure
+                eps_array[slices][np.where(is_inside)] = eps_structure
             return xr.DataArray(eps_array, coords={"x": xs, "y": ys, "z": zs}, dims=("x", "y", "z"))
 
-        # combine all data into dictionary
-        coords = sub_grid[coord_key]
         return make_eps_data(coords)
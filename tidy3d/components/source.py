@@ -22,6 +22,9 @@ from ..log import SetupError
 # in spectrum computation, discard amplitudes with relative magnitude smaller than cutoff
 DFT_CUTOFF = 1e-8
 
+# in spectrum computation, maximum number of elements in the DFT matrix of each chunk of times
+DFT_CHUNK_ELEMENTS = 2**20
+
 
 class SourceTime(ABC, Tidy3dBaseModel):
     """Base class describing the time dependence of a source."""
@@ -57,6 +60,7 @@ class SourceTime(ABC, Tidy3dBaseModel):
         times : np.ndarray
             Times to use to evaluate spectrum Fourier transform.
             (Typically the simulation time mesh).
+            Can also be a :class:`.TimeMesh`, in which case the times are never all stored at once.
         freqs : np.ndarray
             Frequencies in Hz to evaluate spectrum at.
         dt : float or np.ndarray
@@ -69,16 +73,40 @@ class SourceTime(ABC, Tidy3dBaseModel):
             Complex-valued array (of len(freqs)) containing spectrum at those frequencies.
         """
 
-        time_amps = np.real(self.amp_time(times))
+        freqs = np.array(freqs)
+
+        # the DFT is accumulated over chunks of times to bound the size of the
+        # (Nf, Nt_chunk) matrix that gives the DFT when matrix multiplied with the signal
+        chunk_size = max(1, DFT_CHUNK_ELEMENTS // max(1, freqs.size))
+        chunks = [
+            slice(chunk_start, chunk_start + chunk_size)
+            for chunk_start in range(0, len(times), chunk_size)
+        ]
+
+        # maximum amplitude, used to cut to only relevant times
+        amp_max = max(
+            np.amax(np.abs(np.real(self.amp_time(np.array(times[chunk]))))) for chunk in chunks
+        )
+
+        spectrum = np.zeros(freqs.shape, dtype=complex)
+        for chunk in chunks:
+            times_chunk = np.array(times[chunk])
+            time_amps = np.real(self.amp_time(times_chunk))
+
+            # Cut to only relevant times
+            count_times = np.where(np.abs(time_amps) / amp_max > DFT_CUTOFF)
+            time_amps = time_amps[count_times]
+            times_cut = times_chunk[count_times]
+
+            # weigh each of the time intervals in the integral
+            dt_chunk = dt
+            if np.ndim(dt) > 0:
+                dt_chunk = np.array(dt)[chunk][count_times]
 
-        # Cut to only relevant times
-        count_times = np.where(np.abs(time_amps) / np.amax(np.abs(time_amps)) > DFT_CUTOFF)
-        time_amps = time_amps[count_times]
-        times_cut = times[count_times]
+            dft_matrix = np.exp(2j * np.pi * freqs[:, None] * times_cut)
+            spectrum += dft_matrix @ (dt_chunk * time_amps)
 
-        # (Nf, Nt_cut) matrix that gives DFT when matrix multiplied with signal
-        dft_matrix = np.exp(2j * np.pi * freqs[:, None] * times_cut) / np.sqrt(2 * np.pi)
-        return dt * dft_matrix @ time_amps
+        return spectrum / np.sqrt(2 * np.pi)
 
     @add_ax_if_none
     def plot(self, times: Array[float], ax: Ax = None) -> Ax:
@@ -100,6 +100,13 @@ Ax = Axes
 # generic numpy array
 Numpy = np.ndarray
 
+# floating point precision of stored data
+Precision = Literal["single", "double"]
+
+# numpy dtypes of single precision data, by dtype kind (float or complex)
+SINGLE_PRECISION_DTYPES = {"f": np.dtype(np.float32), "c": np.dtype(np.complex64)}
+DOUBLE_PRECISION_DTYPES = {"f": np.dtype(np.float64), "c": np.dtype(np.complex128)}
+
 
 class TypedArray(np.ndarray):
     """A numpy array with a type given by cls.inner_type"""
@@ -113,7 +120,14 @@ class TypedArray(np.ndarray):
     def validate_type(cls, val):
         """validator"""
         # need to fix, doesnt work for simulationdata_export and load?
-        return np.array(val, dtype=cls.inner_type)  # pylint: disable=no-member
+        dtype = np.dtype(cls.inner_type)  # pylint: disable=no-member
+
+        # keep single precision floating point data in single precision, don't upcast
+        val_dtype = getattr(val, "dtype", None)
+        if val_dtype in SINGLE_PRECISION_DTYPES.values() and dtype.kind in SINGLE_PRECISION_DTYPES:
+            dtype = SINGLE_PRECISION_DTYPES[dtype.kind]
+
+        return np.array(val, dtype=dtype)
 
     @classmethod
     def __modify_schema__(cls, field_schema):
@@ -1,6 +1,12 @@
 # pylint:disable=unused-argument
 """ Defines various validation functions that get used to ensure inputs are legit """
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, Sequence
+
 import pydantic
+import numpy as np
 
 from .geometry import Box
 from ..log import ValidationError, SetupError
@@ -35,8 +41,57 @@ from ..log import ValidationError, SetupError
     the original validator will be overwritten so be aware of this.
 
     For more details: `Pydantic Validators <https://pydantic-docs.helpmanual.io/usage/validators/>`_
+
+    Validators over many objects (eg. all structures of a simulation) should work on arrays:
+    ``get_bounds_array`` stacks the bounds of the objects into an array and
+    ``timed_validator`` records how long each validator takes, see ``get_validator_times``.
 """
 
+# total time in seconds spent in each validator wrapped by ``timed_validator``
+_VALIDATOR_TIMES = defaultdict(float)
+
+
+def timed_validator(name: str = None) -> Callable:
+    """Record the time spent in the decorated validator, under ``'{model name}.{name}'``.
+    ``name`` defaults to the name of the validator function."""
+
+    def decorator(func: Callable) -> Callable:
+        """Wrap ``func``, keeping its signature so that pydantic calls it the same way."""
+        validator_name = func.__name__ if name is None else name
+
+        @wraps(func)
+        def timed(cls, *args, **kwargs):
+            """Call the validator and add its run time to the total."""
+            time_start = time.perf_counter()
+            try:
+                return func(cls, *args, **kwargs)
+            finally:
+                key = f"{cls.__name__}.{validator_name}"
+                _VALIDATOR_TIMES[key] += time.perf_counter() - time_start
+
+        return timed
+
+    return decorator
+
+
+def get_validator_times() -> Dict[str, float]:
+    """Total time in seconds spent in each timed validator since the last
+    :func:`reset_validator_times`, keyed by ``'{model name}.{validator name}'``."""
+    return dict(_VALIDATOR_TIMES)
+
+
+def reset_validator_times() -> None:
+    """Set the time spent in each timed validator back to zero."""
+    _VALIDATOR_TIMES.clear()
+
+
+def get_bounds_array(geometric_objects: Sequence) -> np.ndarray:
+    """Bounds of the geometry of each object, stacked into an array of shape ``(N, 2, 3)`` holding
+    ``(min, max)`` for each object. The bounds of each geometry are computed once, as they are a
+    ``cached_property``, so only the stacking is repeated when validators call this again."""
+    bounds_list = [geometric_object.geometry.bounds for geometric_object in geometric_objects]
+    return np.array(bounds_list, dtype=float).reshape((-1, 2, 3))
+
 
 def assert_plane():
     """makes sure a field's `size` attribute has exactly 1 zero"""
@@ -71,6 +126,7 @@ def validate_mode_objects_symmetry(field_name: str):
     obj_type = "ModeSource" if field_name == "sources" else "ModeMonitor"
 
     @pydantic.validator(field_name, allow_reuse=True, always=True)
+    @timed_validator(f"check_symmetry[{field_name}]")
     def check_symmetry(cls, val, values):
         """check for intersection of each structure with simulation bounds."""
         sim_center = values.get("center")
@@ -99,6 +155,7 @@ def assert_unique_names(field_name: str, check_mediums=False):
     """makes sure all elements of a field have unique .name values"""
 
     @pydantic.validator(field_name, allow_reuse=True, always=True)
+    @timed_validator(f"field_has_unique_names[{field_name}]")
     def field_has_unique_names(cls, val, values):
         """check for intersection of each structure with simulation bounds."""
         if check_mediums:
@@ -119,19 +176,25 @@ def assert_objects_in_sim_bounds(field_name: str):
     """Makes sure all objects in field are at least partially inside of simulation bounds."""
 
     @pydantic.validator(field_name, allow_reuse=True, always=True)
+    @timed_validator(f"objects_in_sim_bounds[{field_name}]")
     def objects_in_sim_bounds(cls, val, values):
         """check for intersection of each structure with simulation bounds."""
         sim_center = values.get("center")
         sim_size = values.get("size")
-        sim_box = Box(size=sim_size, center=sim_center)
-
-        for position_index, geometric_object in enumerate(val):
-            if not sim_box.intersects(geometric_object.geometry):
-                raise SetupError(
-                    f"'{geometric_object}' "
-                    f"(at `simulation.{field_name}[{position_index}]`) "
-                    "is completely outside of simulation domain."
-                )
+        sim_bound_min, sim_bound_max = np.array(Box(size=sim_size, center=sim_center).bounds)
+
+        # same test as ``Box.intersects``, for all objects at once
+        bounds = get_bounds_array(val)
+        outside = np.any(bounds[:, 0] > sim_bound_max, axis=1)
+        outside |= np.any(bounds[:, 1] < sim_bound_min, axis=1)
+
+        if np.any(outside):
+            position_index = int(np.flatnonzero(outside)[0])
+            raise SetupError(
+                f"'{val[position_index]}' "
+                f"(at `simulation.{field_name}[{position_index}]`) "
+                "is completely outside of simulation domain."
+            )
 
         return val
 
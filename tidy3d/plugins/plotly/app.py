@@ -1,14 +1,15 @@
 """Makes an app to visualize SimulationData objects."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from jupyter_dash import JupyterDash
-from dash import Dash, dcc, html
+from dash import Dash, dcc, html, Output, Input
 import pydantic as pd
 
 from .simulation import SimulationPlotly
 from .data import DataPlotly
+from .component import UIComponent
 from ...components.base import Tidy3dBaseModel
 from ...components.simulation import Simulation
 from ...components.data import SimulationData
@@ -33,10 +34,11 @@ class App(Tidy3dBaseModel, ABC):
 
     def _initialize_app(self) -> Dash:
         """Creates an app based on specs."""
+        # callbacks may refer to components that are only in the layout once a tab is selected
         if "jupyter" in self.mode.lower():
-            return JupyterDash(__name__)
+            return JupyterDash(__name__, suppress_callback_exceptions=True)
         if "python" in self.mode.lower():
-            return Dash(__name__)
+            return Dash(__name__, suppress_callback_exceptions=True)
         raise NotImplementedError(f"App doesn't support mode='{self.mode}'.")
 
     @abstractmethod
@@ -86,15 +88,18 @@ class SimulationDataApp(App):
         ..., title="Simulation data", description="A :class:`.SimulationData` instance to view."
     )
 
-    def _make_layout(self, app: Dash) -> dcc.Tabs:
-        """Creates the layout for the app."""
+    lazy_tabs: bool = pd.Field(
+        False,
+        title="Lazy tabs",
+        description="Make the contents of each tab only when it is selected, so that the figures "
+        "of the other tabs are not computed and their data is not read.",
+    )
 
-        layout = dcc.Tabs([])
+    def _make_components(self) -> List[UIComponent]:
+        """Creates the UI components for the simulation and for each monitor."""
 
         # simulation
-        sim_plotly = SimulationPlotly(simulation=self.sim_data.simulation)
-        component = sim_plotly.make_component(app)
-        layout.children += [component]
+        components = [SimulationPlotly(simulation=self.sim_data.simulation)]
 
         # monitors
         for monitor_name, monitor_data in self.sim_data.monitor_data.items():
@@ -103,28 +108,65 @@ class SimulationDataApp(App):
             )
             if data_plotly is None:
                 continue
-            component = data_plotly.make_component(app)
-            layout.children += [component]
+            components.append(data_plotly)
 
-        # log
-        component = dcc.Tab(
+        return components
+
+    def _make_log_tab(self) -> dcc.Tab:
+        """Creates the tab showing the solver log."""
+        return dcc.Tab(
             [
                 html.Div([html.H1("Solver Log")]),
                 html.Div([html.Code(self.sim_data.log, style={"whiteSpace": "pre-wrap"})]),
             ],
             label="log",
         )
-        layout.children += [component]
 
-        return layout
+    def _make_layout(self, app: Dash) -> Union[dcc.Tabs, html.Div]:
+        """Creates the layout for the app."""
+
+        components = self._make_components()
+
+        if not self.lazy_tabs:
+            layout = dcc.Tabs([])
+            for component in components:
+                layout.children += [component.make_component(app)]
+            layout.children += [self._make_log_tab()]
+            return layout
+
+        # the tabs only hold their labels, their contents are made when they are selected
+        for component in components:
+            component.add_callbacks(app)
+        make_tabs = {
+            f"tab_{index}": component.make_layout for index, component in enumerate(components)
+        }
+        make_tabs["tab_log"] = self._make_log_tab
+        labels = [component.label for component in components] + ["log"]
+        tabs = dcc.Tabs(
+            [dcc.Tab(label=label, value=value) for label, value in zip(labels, make_tabs)],
+            value="tab_0",
+            id="app_tabs",
+        )
+
+        @app.callback(Output("app_tab_content", "children"), Input("app_tabs", "value"))
+        def set_tab_content(value_tab):
+            return make_tabs[value_tab]().children
+
+        return html.Div([tabs, html.Div(id="app_tab_content")])
 
     @classmethod
     def from_file(
-        cls, fname: str, mode: AppMode = DEFAULT_MODE, normalize_index: Optional[int] = 0
+        cls,
+        fname: str,
+        mode: AppMode = DEFAULT_MODE,
+        normalize_index: Optional[int] = 0,
+        lazy: bool = False,
     ):  # pylint:disable=arguments-differ
-        """Load the :class:`.SimulationDataApp` from a tidy3d data file in .hdf5 format."""
-        sim_data = SimulationData.from_file(fname, normalize_index=normalize_index)
-        return cls(sim_data=sim_data, mode=mode)
+        """Load the :class:`.SimulationDataApp` from a tidy3d data file in .hdf5 format.
+        If ``lazy``, the file is kept open and only the data plotted in the selected tab is read
+        from it, so that the app starts at once for files larger than the available memory."""
+        sim_data = SimulationData.from_file(fname, normalize_index=normalize_index, lazy=lazy)
+        return cls(sim_data=sim_data, mode=mode, lazy_tabs=lazy)
 
 
 class SimulationApp(App):
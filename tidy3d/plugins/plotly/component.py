@@ -1,6 +1,11 @@
 """Defines the structure of the components displayed in the app tabs."""
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import threading
+from typing import Callable, Hashable
+
 from dash import dcc
+import pydantic as pd
 
 from .utils import PlotlyFig
 from ...components.base import Tidy3dBaseModel
@@ -12,24 +17,63 @@ How the components work.
 2. For each UI component in the view:
     a) construct UI component using SimulationData object contents.
     b) call `make_component(app)`, which
-        i. generates the layout for the component.
-        ii. adds any callback functions to `app` to make it interactive.
-        iii. returns the layout.
+        i. adds any callback functions to `app` to make it interactive (`add_callbacks(app)`).
+        ii. generates and returns the layout for the component (`make_layout()`).
     c) add the layout from this component to the app.
 
+The callbacks are added before the app starts, but the layout can be generated only when the
+component is displayed, so that its figures are not computed (or its data read) before.
+
 If a figure is needed, the component can create it with `fig = self.make_figure()`
 This will use the internal state to contruct kwargs for a call to `fig = self.plotly(**kwargs)`
+The figures are kept by `self.cached_figure(key, ...)`, keyed by the state they were made from,
+so that going back to a previous state in the app does not compute the figure again.
 
 """
 
+# number of figures kept in memory by each component, the least recently used are dropped first
+FIGURE_CACHE_SIZE = 32
+
+# guards the figures kept by each component, it is not stored on the components so that they can
+# still be copied and pickled
+_FIGURE_CACHE_LOCK = threading.Lock()
+
 
 class UIComponent(Tidy3dBaseModel, ABC):
     """Base class for a UI component.  Individual data storage wrappers override this."""
 
-    @abstractmethod
+    # figures by the state they were made from, from least to most recently used
+    _figure_cache: OrderedDict = pd.PrivateAttr(default_factory=OrderedDict)
+
     def make_component(self, app) -> dcc.Tab:
         """Creates the dash component for this montor data."""
+        self.add_callbacks(app)
+        return self.make_layout()
+
+    @abstractmethod
+    def make_layout(self) -> dcc.Tab:
+        """Creates the layout of the dash component given its current state."""
+
+    def add_callbacks(self, app) -> None:
+        """Adds the callback functions linking the inputs of the component to its figure."""
 
     @abstractmethod
     def make_figure(self) -> PlotlyFig:
         """Creates a plotly figure for this component given its current state."""
+
+    def cached_figure(self, key: Hashable, make_figure: Callable[[], PlotlyFig]) -> PlotlyFig:
+        """Return the figure stored for ``key``, or make it with ``make_figure()`` and store it,
+        dropping the least recently used figures beyond ``FIGURE_CACHE_SIZE``."""
+
+        with _FIGURE_CACHE_LOCK:
+            if key in self._figure_cache:
+                self._figure_cache.move_to_end(key)
+                return self._figure_cache[key]
+
+        fig = make_figure()
+
+        with _FIGURE_CACHE_LOCK:
+            self._figure_cache[key] = fig
+            while len(self._figure_cache) > FIGURE_CACHE_SIZE:
+                self._figure_cache.popitem(last=False)
+        return fig
@@ -1,6 +1,6 @@
 """Defines how the specific data objects render as UI components."""
 from abc import ABC
-from typing import Union, Tuple, List
+from typing import Dict, Union, Tuple, List
 from typing_extensions import Literal
 
 import numpy as np
@@ -24,6 +24,10 @@ from ...log import Tidy3dKeyError, log
 PICOSECOND = 1e-12
 TERAHERTZ = 1e12
 
+# maximum number of points along each axis of a field heatmap, about the width of the figure in
+# pixels, the data is downsampled beyond it
+MAX_HEATMAP_POINTS = 500
+
 # supported data types
 Tidy3dDataType = Union[FluxData, FluxTimeData, FieldData, FieldTimeData, ModeData, ModeFieldData]
 
@@ -123,8 +127,8 @@ class AbstractFluxDataPlotly(DataPlotly, ABC):
         """Generate plotly figure from the current state of self."""
         return self.plotly()
 
-    def make_component(self, app: Dash) -> dcc.Tab:
-        """Creates the dash component for this montor data."""
+    def make_layout(self) -> dcc.Tab:
+        """Creates the layout of the dash component for this montor data."""
 
         # initital setup
         fig = self.make_figure()
@@ -250,12 +254,16 @@ class ModeDataPlotly(DataPlotly):
             self.mode_ind_val = self.mode_ind_coords[0]
 
         if self.amps_or_neff == "amps":
-            return self.plotly_amps(mode_index=self.mode_ind_val, dir_val=self.dir_val)
+            key = (self.amps_or_neff, self.val, self.mode_ind_val, self.dir_val)
+            return self.cached_figure(
+                key, lambda: self.plotly_amps(mode_index=self.mode_ind_val, dir_val=self.dir_val)
+            )
 
-        return self.plotly_neff(mode_index=self.mode_ind_val)
+        key = (self.amps_or_neff, self.val, self.mode_ind_val)
+        return self.cached_figure(key, lambda: self.plotly_neff(mode_index=self.mode_ind_val))
 
-    def make_component(self, app: Dash) -> dcc.Tab:
-        """Creates the dash component for this montor data."""
+    def make_layout(self) -> dcc.Tab:
+        """Creates the layout of the dash component for this montor data."""
 
         # initital setup
         fig = self.make_figure()
@@ -350,6 +358,11 @@ class ModeDataPlotly(DataPlotly):
             label=self.label,
         )
 
+        return component
+
+    def add_callbacks(self, app: Dash) -> None:
+        """Adds the callback functions linking the inputs of the component to its figure."""
+
         # link what happens in the inputs to what gets displayed in the figure
         @app.callback(
             Output(self.append_monitor_name("figure"), "figure"),
@@ -389,8 +402,6 @@ class ModeDataPlotly(DataPlotly):
             self.amps_or_neff = str(value_amps_or_neff)
             return self.dir_dropdown_hidden
 
-        return component
-
     def plotly_amps(self, mode_index: int, dir_val: str):
         """Make a line chart for the mode amplitudes."""
 
@@ -463,19 +474,36 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
         None, title="Mode index value", description="The component's mode index value value."
     )
 
+    # coordinate values of each field component, by field and coordinate name
+    _coords_cache: Dict[Tuple[str, str], np.ndarray] = pd.PrivateAttr(default_factory=dict)
+
+    def field_coords(self, coord_name: str) -> np.ndarray:
+        """Values of a coordinate of the current scalar field data, ``None`` if it does not have
+        this coordinate. Stored after the first call, as they are needed on each update."""
+        scalar_field_data = self.scalar_field_data
+        key = (self.field_val, coord_name)
+        if key not in self._coords_cache:
+            # read from the data directly, its values may be kept in a file
+            coords = getattr(scalar_field_data, coord_name, None)
+            self._coords_cache[key] = None if coords is None else np.array(coords)
+        return self._coords_cache[key]
+
+    @staticmethod
+    def nearest_index(coords: np.ndarray, value: float) -> int:
+        """Index of the coordinate nearest to ``value``."""
+        return int(np.argmin(np.abs(coords - value)))
+
     @property
     def ft_label_coords_units(self) -> Tuple[str, List[float], str]:
         """Get the `freq` or `time` label and coords."""
 
-        scalar_field_data = self.data.data_dict[self.field_val]
-
-        if "f" in self.scalar_field_data.data.coords:
+        if self.field_coords("f") is not None:
             ft_label = "freq"
-            ft_coords = scalar_field_data.data.coords["f"].values / TERAHERTZ
+            ft_coords = self.field_coords("f") / TERAHERTZ
             ft_units = "THz"
-        elif "t" in self.scalar_field_data.data.coords:
+        elif self.field_coords("t") is not None:
             ft_label = "time"
-            ft_coords = scalar_field_data.data.coords["t"].values / PICOSECOND
+            ft_coords = self.field_coords("t") / PICOSECOND
             ft_units = "ps"
         else:
             raise Tidy3dKeyError("neither frequency nor time data found in this data object.")
@@ -502,15 +530,13 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
     def xyz_label_coords(self) -> Tuple[str, List[float]]:
         """Get the plane normal direction label and coords."""
         xyz_label = "xyz"[self.cs_axis]
-        xyz_coords = self.scalar_field_data.data.coords[xyz_label].values
+        xyz_coords = self.field_coords(xyz_label)
         return xyz_label, xyz_coords
 
     @property
     def mode_ind_coords(self) -> List[int]:
         """Get the mode indices."""
-        if "mode_index" in self.scalar_field_data.data.coords:
-            return self.scalar_field_data.data.coords["mode_index"].values
-        return None
+        return self.field_coords("mode_index")
 
     def make_figure(self) -> PlotlyFig:
         """Generate plotly figure from the current state of self."""
@@ -534,18 +560,23 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
         if self.ft_val is None:
             self.ft_val = np.mean(ft_coords)
 
+        # use the nearest stored coordinates, so that close slider positions share a figure
+        cs_val = float(xyz_coords[self.nearest_index(xyz_coords, self.cs_val)])
+        ft_val = float(ft_coords[self.nearest_index(ft_coords, self.ft_val)])
+
         plotly_kwargs = {
-            xyz_label: self.cs_val,
+            xyz_label: cs_val,
             "field": self.field_val,
-            ft_label: self.ft_val,
+            ft_label: ft_val,
             "val": self.val,
             "mode_index": self.mode_ind_val,
         }
 
-        return self.plotly(**plotly_kwargs)
+        key = (self.cs_axis, cs_val, self.field_val, self.val, ft_val, self.mode_ind_val)
+        return self.cached_figure(key, lambda: self.plotly(**plotly_kwargs))
 
-    def make_component(self, app: Dash) -> dcc.Tab:  # pylint:disable=too-many-locals
-        """Creates the dash component."""
+    def make_layout(self) -> dcc.Tab:  # pylint:disable=too-many-locals
+        """Creates the layout of the dash component."""
 
         # initial setup
         xyz_label, xyz_coords = self.xyz_label_coords
@@ -625,7 +656,7 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
         )
 
         # add a mode index dropdown to right hand side, if applicable
-        if self.mode_ind_val is not None:
+        if self.mode_ind_coords is not None:
 
             # make a mode index label and dropdown
             mode_ind_label = html.H2("Mode Index component.")
@@ -664,6 +695,11 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
             label=self.label,
         )
 
+        return component
+
+    def add_callbacks(self, app: Dash) -> None:
+        """Adds the callback functions linking the inputs of the component to its figure."""
+
         # these are the inputs to the callback function which links the buttons to the figure
         app_inputs = [
             Input(self.append_monitor_name("field_dropdown"), "value"),
@@ -674,7 +710,7 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
         ]
 
         # add the mode index dropdown to the app inputs, if defined
-        if self.mode_ind_val is not None:
+        if self.mode_ind_coords is not None:
             app_inputs.append(Input(self.append_monitor_name("mode_index_selector"), "value"))
 
         # link what happens in the app_inputs to what gets displayed in the figure
@@ -722,8 +758,6 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
             _, xyz_coords = self.xyz_label_coords
             return xyz_coords[-1]
 
-        return component
-
     def plotly(  # pylint:disable=too-many-arguments, too-many-locals
         self,
         field: str,
@@ -735,31 +769,45 @@ class AbstractFieldDataPlotly(DataPlotly, ABC):
         z: float = None,
         mode_index: int = None,
     ) -> PlotlyFig:
-        """Creates the plotly figure given some parameters."""
+        """Creates the plotly figure given some parameters. The data nearest to the given
+        coordinates is plotted, downsampled to at most ``MAX_HEATMAP_POINTS`` along each axis."""
 
         axis, position = Geometry.parse_xyz_kwargs(x=x, y=y, z=z)
 
-        # grab by field name
-        scalar_field_data = self.scalar_field_data.data
+        # indices of the data to plot, found from the stored coordinates
+        isel_kwargs = {}
 
         # select mode_index, if given
-        if mode_index is not None and "mode_index" in scalar_field_data.coords:
-            scalar_field_data = scalar_field_data.sel(mode_index=mode_index)
+        mode_indices = self.field_coords("mode_index")
+        if mode_index is not None and mode_indices is not None:
+            isel_kwargs["mode_index"] = self.nearest_index(mode_indices, mode_index)
 
         # select by frequency, if given
         if freq is not None:
             freq *= TERAHERTZ
-            sel_ft = scalar_field_data.sel(f=freq, method="nearest")
+            isel_kwargs["f"] = self.nearest_index(self.field_coords("f"), freq)
 
         # select by time, if given
         if time is not None:
             time *= PICOSECOND
-            sel_ft = scalar_field_data.sel(t=time, method="nearest")
+            isel_kwargs["t"] = self.nearest_index(self.field_coords("t"), time)
 
         # select the cross sectional plane data
         xyz_labels = ["x", "y", "z"]
-        xyz_kwargs = {xyz_labels.pop(axis): position}
-        sel_xyz = sel_ft.sel(**xyz_kwargs, method="nearest")
+        normal_label = xyz_labels.pop(axis)
+        isel_kwargs[normal_label] = self.nearest_index(self.field_coords(normal_label), position)
+
+        # downsample the plane to about the resolution of the figure
+        for label in xyz_labels:
+            num_points = len(self.field_coords(label))
+            step = int(np.ceil(num_points / MAX_HEATMAP_POINTS))
+            isel_kwargs[label] = slice(None, None, step)
+
+        # only the selected values are read if the data is kept in a file
+        sel_xyz = self.scalar_field_data.isel(**isel_kwargs).data
+        sel_xyz = sel_xyz.squeeze(
+            dim=[dim for dim, inds in isel_kwargs.items() if not isinstance(inds, slice)]
+        )
 
         # get the correct field value (real, imaginary, abs)
         sel_val = self.sel_by_val(data=sel_xyz, val=val)
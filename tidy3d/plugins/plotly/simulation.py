@@ -103,6 +103,11 @@ class SimulationPlotly(UIComponent):
     cs_axis: Axis = 0
     cs_val: float = None
 
+    @property
+    def label(self) -> str:
+        """Get tab label for this component."""
+        return "Simulation"
+
     @property
     def xyz_label_bounds(self):
         """Get the plot normal axis label and the min and max bounds."""
@@ -120,10 +125,11 @@ class SimulationPlotly(UIComponent):
         if self.cs_val is None:
             self.cs_val = (xyz_min + xyz_max) / 2.0
         plotly_kwargs = {xyz_label: self.cs_val}
-        return self.plotly(**plotly_kwargs)
+        key = (self.cs_axis, self.cs_val)
+        return self.cached_figure(key, lambda: self.plotly(**plotly_kwargs))
 
-    def make_component(self, app):  # pylint: disable=too-many-locals
-        """Creates the dash component."""
+    def make_layout(self) -> dcc.Tab:
+        """Creates the layout of the dash component."""
 
         xyz_label, (xyz_min, xyz_max) = self.xyz_label_bounds
         figure = self.make_figure()
@@ -159,9 +165,14 @@ class SimulationPlotly(UIComponent):
                     [graph, xyz_selection], style={"display": "flex", "flex-direction": "row"}
                 ),
             ],
-            label="Simulation",
+            label=self.label,
         )
 
+        return component
+
+    def add_callbacks(self, app) -> None:
+        """Adds the callback functions linking the inputs of the component to its figure."""
+
         @app.callback(
             Output("simulation_plot", "figure"),
             [
@@ -203,8 +214,6 @@ class SimulationPlotly(UIComponent):
             _, (_, xyz_max) = self.xyz_label_bounds
             return xyz_max
 
-        return component
-
     @equal_aspect_plotly
     @add_fig_if_none
     def plotly(
@@ -319,9 +328,7 @@ class SimulationPlotly(UIComponent):
             The supplied or created plotly ``Figure``.
         """
 
-        medium_shapes = self.simulation._filter_structures_plane(
-            self.simulation.structures, x=x, y=y, z=z
-        )
+        medium_shapes = self.simulation._get_structures_plane(x=x, y=y, z=z)
         for (medium, shape) in medium_shapes:
             fig = self._plotly_shape_structure(medium=medium, shape=shape, fig=fig)
         return fig
@@ -368,9 +375,7 @@ class SimulationPlotly(UIComponent):
             The supplied or created plotly ``Figure``.
         """
 
-        medium_shapes = self.simulation._filter_structures_plane(
-            self.simulation.structures, x=x, y=y, z=z
-        )
+        medium_shapes = self.simulation._get_structures_plane(x=x, y=y, z=z)
         for (medium, shape) in medium_shapes:
             fig = self._plotly_shape_structure_eps(freq=freq, medium=medium, shape=shape, fig=fig)
         return fig
@@ -130,10 +130,10 @@ class ComponentModeler(Tidy3dBaseModel):
     def plot_sim(self, x: float = None, y: float = None, z: float = None, ax: Ax = None) -> Ax:
         """Plot a :class:`Simulation` with all sources added for each port, for troubleshooting."""
 
-        sim_plot = self.simulation.copy(deep=True)
-        for port_source in self.ports:
-            mode_source_0 = self._to_sources(port_source)[0]
-            sim_plot.sources.append(mode_source_0)
+        mode_sources_0 = [self._to_sources(port_source)[0] for port_source in self.ports]
+        sim_plot = self.simulation.updated_copy(
+            sources=list(self.simulation.sources) + mode_sources_0
+        )
         return sim_plot.plot(x=x, y=y, z=z, ax=ax)
 
     def _shift_value(self, port: Port) -> float:
@@ -150,28 +150,31 @@ class ComponentModeler(Tidy3dBaseModel):
         shift_value = self._shift_value(port)
         center_shifted = list(port.center)
         center_shifted[port.size.index(0.0)] += shift_value
-        port_shifted = port.copy(deep=True)
-        port_shifted.center = center_shifted
-        return port_shifted
+        return port.updated_copy(center=center_shifted)
 
     def _task_name(self, port_source: Port, mode_index: int) -> str:
         """The name of a task, determined by the port of the source and mode index."""
         return f"smatrix_port{port_source.name}_mode{mode_index}"
 
     def _make_sims(self) -> Dict[str, Simulation]:
-        """Generate all the :class:`Simulation` objects for the S matrix calculation."""
+        """Generate all the :class:`Simulation` objects for the S matrix calculation.
+        The structures and other components are shared between the simulations, not copied."""
         sim_dict = {}
         for port_source in self.ports:
+
+            # the monitors are the same for all modes of the source port
+            mode_monitors = []
+            for port_monitor in self.ports:
+                if port_source == port_monitor:
+                    port_monitor = self._shift_port(port_source)
+                mode_monitors.append(self._to_monitor(port_monitor))
+            monitors = list(self.simulation.monitors) + mode_monitors
+
             for mode_source in self._to_sources(port_source):
-                sim_copy = self.simulation.copy(deep=True)
-                sim_copy.sources = [mode_source]
-                for port_monitor in self.ports:
-                    if port_source == port_monitor:
-                        port_monitor = self._shift_port(port_source)
-                    mode_monitor = self._to_monitor(port_monitor)
-                    sim_copy.monitors.append(mode_monitor)
-                    task_name = self._task_name(port_source, mode_source.mode_index)
-                    sim_dict[task_name] = sim_copy
+                task_name = self._task_name(port_source, mode_source.mode_index)
+                sim_dict[task_name] = self.simulation.updated_copy(
+                    sources=[mode_source], monitors=monitors
+                )
         return sim_dict
 
     def _run_sims(
@@ -4,4 +4,6 @@ import sys
 from .webapi import run, upload, get_info, start, monitor, delete, download, load
 from .webapi import get_tasks, delete_old
 from .container import Job, Batch
+from .asyncapi import AsyncBatch
+from .cache import enable_cache, disable_cache, get_cache
 from .auth import get_credentials
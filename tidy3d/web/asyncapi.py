@@ -0,0 +1,234 @@
+"""asyncio counterparts of the webapi functions and :class:`.Batch`, to drive many tasks
+concurrently from one event loop."""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import pydantic as pd
+
+from . import webapi as web
+from .cache import get_cache
+from .container import WebContainer, Batch, BatchData, DEFAULT_DATA_DIR
+from .task import TaskId, TaskInfo, TaskName
+from ..components.data import SimulationData
+from ..components.simulation import Simulation
+from ..log import log
+
+END_STATUSES = ("success", "error", "diverged", "deleted", "draft")
+
+# maximum number of blocking webapi calls running at the same time, over all event loops
+MAX_CONCURRENT_CALLS = 16
+
+_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS, thread_name_prefix="tidy3d_web")
+
+
+async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking webapi call in a worker thread so the event loop keeps running."""
+    # the running loop, asyncio.get_running_loop needs python 3.7
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+async def upload(
+    simulation: Simulation, task_name: str, folder_name: str = "default", callback_url: str = None
+) -> TaskId:
+    """Upload simulation to server, but do not start running :class:`.Simulation`.
+    Same as :meth:`tidy3d.web.webapi.upload`."""
+    return await _run_blocking(
+        web.upload,
+        simulation=simulation,
+        task_name=task_name,
+        folder_name=folder_name,
+        callback_url=callback_url,
+    )
+
+
+async def get_info(task_id: TaskId) -> TaskInfo:
+    """Return information about a task. Same as :meth:`tidy3d.web.webapi.get_info`."""
+    return await _run_blocking(web.get_info, task_id)
+
+
+async def start(task_id: TaskId) -> None:
+    """Start running the simulation associated with task.
+    Same as :meth:`tidy3d.web.webapi.start`."""
+    await _run_blocking(web.start, task_id)
+
+
+async def get_status(task_id: TaskId) -> str:
+    """Get the status of a task, ``'visualize'`` is reported as ``'success'``."""
+    status = (await get_info(task_id)).status
+    if status == "visualize":
+        return "success"
+    return status
+
+
+async def monitor(task_id: TaskId) -> str:
+    """Wait until a task is finished, logging its status as it changes.
+
+    Parameters
+    ----------
+    task_id : str
+        Unique identifier of task on server.  Returned by :meth:`upload`.
+
+    Returns
+    -------
+    str
+        Final status of the task.
+    """
+    logged_status = None
+    refresh_time = web.REFRESH_TIME
+    while True:
+        status = await get_status(task_id)
+        if status != logged_status:
+            log.info(f"task '{task_id}': status = {status}")
+            logged_status = status
+            refresh_time = web.REFRESH_TIME
+        if status in END_STATUSES:
+            return status
+        await asyncio.sleep(refresh_time)
+        refresh_time = web.next_refresh_time(refresh_time)
+
+
+async def download(task_id: TaskId, path: str = "simulation_data.hdf5") -> None:
+    """Download results of task. Same as :meth:`tidy3d.web.webapi.download`."""
+    await _run_blocking(web.download, task_id=task_id, path=path)
+
+
+async def load(
+    task_id: TaskId,
+    path: str = "simulation_data.hdf5",
+    replace_existing: bool = True,
+    normalize_index: Optional[int] = 0,
+) -> SimulationData:
+    """Download and Load simultion results into :class:`.SimulationData` object.
+    Same as :meth:`tidy3d.web.webapi.load`."""
+    return await _run_blocking(
+        web.load,
+        task_id=task_id,
+        path=path,
+        replace_existing=replace_existing,
+        normalize_index=normalize_index,
+    )
+
+
+async def run(  # pylint:disable=too-many-arguments
+    simulation: Simulation,
+    task_name: str,
+    folder_name: str = "default",
+    path: str = "simulation_data.hdf5",
+    callback_url: str = None,
+    normalize_index: Optional[int] = 0,
+) -> SimulationData:
+    """Submits a :class:`.Simulation` to server, starts running, monitors progress, downloads,
+    and loads results as a :class:`.SimulationData` object.
+    Same as :meth:`tidy3d.web.webapi.run`, including the use of the cache.
+
+    Example
+    -------
+    >>> sim_datas = await asyncio.gather(*(run(sim, task_name=name) for name, sim in sims))
+    """
+    cache = get_cache()
+    if cache is not None and await _run_blocking(cache.get, simulation, path=path):
+        return await load(
+            task_id=None, path=path, replace_existing=False, normalize_index=normalize_index
+        )
+
+    task_id = await upload(
+        simulation=simulation,
+        task_name=task_name,
+        folder_name=folder_name,
+        callback_url=callback_url,
+    )
+    await start(task_id)
+    await monitor(task_id)
+    sim_data = await load(task_id=task_id, path=path, normalize_index=normalize_index)
+
+    if cache is not None:
+        await _run_blocking(cache.put, simulation, path=path)
+    return sim_data
+
+
+class AsyncBatch(WebContainer):
+    """Runs a :class:`.Batch` from an event loop, with its methods as coroutines. The jobs of the
+    batch are stored in ``batch.jobs`` when it is uploaded.
+
+    Example
+    -------
+    >>> async_batch = AsyncBatch(batch=Batch(simulations=sims))
+    >>> batch_data = asyncio.get_event_loop().run_until_complete(async_batch.run())
+    """
+
+    batch: Batch = pd.Field(..., title="Batch", description="Batch of tasks to run.")
+
+    async def upload(self) -> None:
+        """Create a series of tasks in the batch and upload them to server,
+        see :meth:`.Batch.upload`."""
+        await _run_blocking(self.batch.upload)
+
+    async def start(self) -> None:
+        """Start running all tasks in the batch, see :meth:`.Batch.start`."""
+        await _run_blocking(self.batch.start)
+
+    async def monitor(self) -> Dict[TaskName, str]:
+        """Wait until all tasks are finished, logging the number of tasks with each status as it
+        changes.
+
+        Returns
+        -------
+        Dict[str, str]
+            Final status of each task.
+        """
+        # pylint:disable=protected-access
+        folder = await _run_blocking(web._query_or_create_folder, self.batch.folder_name)
+        status_counts = None
+        refresh_time = web.REFRESH_TIME
+        while True:
+            statuses = await _run_blocking(self.batch._get_statuses, folder)
+            new_status_counts = {
+                status: list(statuses.values()).count(status) for status in set(statuses.values())
+            }
+            if new_status_counts != status_counts:
+                status_counts = new_status_counts
+                refresh_time = web.REFRESH_TIME
+                counts = ", ".join(
+                    f"{num} {status}" for status, num in sorted(status_counts.items())
+                )
+                log.info(f"batch status: {counts}")
+            if all(status in END_STATUSES for status in statuses.values()):
+                return statuses
+            await asyncio.sleep(refresh_time)
+            refresh_time = web.next_refresh_time(refresh_time)
+
+    async def download(self, path_dir: str = DEFAULT_DATA_DIR) -> None:
+        """Download results of each task, see :meth:`.Batch.download`."""
+        await _run_blocking(self.batch.download, path_dir=path_dir)
+
+    async def run(
+        self, path_dir: str = DEFAULT_DATA_DIR, normalize_index: Optional[int] = 0
+    ) -> BatchData:
+        """Upload and run each simulation in the batch, see :meth:`.Batch.run`, including the use
+        of the cache."""
+
+        cache = get_cache()
+        if cache is None:
+            await self.upload()
+            await self.start()
+            await self.monitor()
+            return self.batch.load(path_dir=path_dir, normalize_index=normalize_index)
+
+        # pylint:disable=protected-access
+        task_paths, batch_run = await _run_blocking(self.batch._get_cached, cache, path_dir)
+        task_ids = {task_name: None for task_name in task_paths}
+        if batch_run is not None:
+            async_batch_run = AsyncBatch(batch=batch_run)
+            await async_batch_run.upload()
+            await async_batch_run.start()
+            await async_batch_run.monitor()
+            batch_data_run = await _run_blocking(
+                self.batch._put_cached, cache, async_batch_run.batch, path_dir, normalize_index
+            )
+            task_paths.update(batch_data_run.task_paths)
+            task_ids.update(batch_data_run.task_ids)
+
+        return BatchData(task_paths=task_paths, task_ids=task_ids, normalize_index=normalize_index)
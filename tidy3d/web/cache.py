@@ -0,0 +1,231 @@
+""" local cache of downloaded simulation results, to avoid running the same simulation twice """
+import os
+import hashlib
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from ..components.simulation import Simulation
+from ..log import log
+from ..version import __version__
+
+try:
+    import fcntl
+
+    def _lock_file(lock_file) -> None:
+        """Wait for an exclusive lock on an open file."""
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(lock_file) -> None:
+        """Release the lock on an open file."""
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover
+    import msvcrt
+
+    def _lock_file(lock_file) -> None:
+        """Wait for an exclusive lock on an open file."""
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(lock_file) -> None:
+        """Release the lock on an open file."""
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+DEFAULT_CACHE_DIR = "~/.tidy3d/cache"
+DEFAULT_CACHE_SIZE_BYTES = 10e9
+
+CACHE_EXTENSION = ".hdf5"
+LOCK_FNAME = ".lock"
+
+
+class ResultCache:
+    """Size-bounded store of simulation data files on disk, keyed by the simulation contents.
+
+    When the total size of the stored files exceeds ``max_size_bytes``, the least recently used
+    files are removed. All operations lock the cache directory, so it can be shared by several
+    threads and processes.
+
+    Example
+    -------
+    >>> cache = ResultCache(directory="~/.tidy3d/cache", max_size_bytes=1e9)
+    >>> found = cache.get(simulation, path="simulation_data.hdf5")
+    """
+
+    def __init__(
+        self, directory: str = DEFAULT_CACHE_DIR, max_size_bytes: float = DEFAULT_CACHE_SIZE_BYTES
+    ):
+        """Make a cache storing files in ``directory``, using at most ``max_size_bytes`` of disk."""
+        self.directory = os.path.expanduser(directory)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._thread_lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(simulation: Simulation) -> str:
+        """Stable hash of the contents of a :class:`.Simulation` and of the tidy3d version.
+
+        Note
+        ----
+        The data is stored before normalization, which is applied when it is loaded, so the same
+        entry is used for any ``normalize_index``.
+        """
+        json_string = simulation._json_string(indent=None)  # pylint:disable=protected-access
+        return hashlib.sha256(f"{__version__}:{json_string}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Path of the file stored for ``key``."""
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+
+    @contextmanager
+    def _lock(self):
+        """Exclusive lock on the cache directory, across threads and processes."""
+        with self._thread_lock:
+            with open(os.path.join(self.directory, LOCK_FNAME), "a+b") as lock_file:
+                _lock_file(lock_file)
+                try:
+                    yield
+                finally:
+                    _unlock_file(lock_file)
+
+    def get(self, simulation: Simulation, path: str) -> bool:
+        """Copy the data of a :class:`.Simulation` from the cache to ``path``, if it is stored.
+
+        Parameters
+        ----------
+        simulation : :class:`.Simulation`
+            Simulation to look up.
+        path : str
+            Path to copy the data file to (including filename).
+
+        Returns
+        -------
+        bool
+            Whether the data was found in the cache.
+        """
+        cache_path = self._path(self.key(simulation))
+        with self._lock():
+            if not os.path.isfile(cache_path):
+                self.misses += 1
+                return False
+            self.hits += 1
+            # mark as recently used
+            os.utime(cache_path)
+            if os.path.abspath(path) != os.path.abspath(cache_path):
+                directory, _ = os.path.split(path)
+                if directory != "":
+                    os.makedirs(directory, exist_ok=True)
+                shutil.copyfile(cache_path, path)
+        log.info(f"loaded cached data of simulation to '{path}'.")
+        return True
+
+    def put(self, simulation: Simulation, path: str) -> None:
+        """Store a copy of the data file at ``path`` as the data of a :class:`.Simulation`.
+
+        Parameters
+        ----------
+        simulation : :class:`.Simulation`
+            Simulation that produced the data.
+        path : str
+            Path to the data file (including filename).
+        """
+        if not os.path.isfile(path):
+            return
+        cache_path = self._path(self.key(simulation))
+
+        # copy outside of the lock, then move into place at once so the entry is never partial
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmp:
+            tmp_path = tmp.name
+        shutil.copyfile(path, tmp_path)
+        with self._lock():
+            os.replace(tmp_path, cache_path)
+            self._evict(keep=cache_path)
+
+    def _entries(self) -> Dict[str, os.stat_result]:
+        """Path and file information of every stored data file."""
+        entries = {}
+        for fname in os.listdir(self.directory):
+            if fname.endswith(CACHE_EXTENSION):
+                path = os.path.join(self.directory, fname)
+                entries[path] = os.stat(path)
+        return entries
+
+    def _evict(self, keep: str = None) -> None:
+        """Remove the least recently used files until the cache fits in ``max_size_bytes``,
+        never removing the file at ``keep`` (the file just stored, whose mtime may tie others)."""
+        entries = self._entries()
+        size_bytes = sum(stat.st_size for stat in entries.values())
+        for path, stat in sorted(entries.items(), key=lambda entry: entry[1].st_mtime):
+            if size_bytes <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            size_bytes -= stat.st_size
+            log.debug(f"removed '{path}' from the cache.")
+
+    def clear(self) -> None:
+        """Remove all stored data files."""
+        with self._lock():
+            for path in self._entries():
+                os.remove(path)
+
+    def stats(self) -> Dict[str, float]:
+        """Number of cache hits and misses since the cache was made, and current contents.
+
+        Returns
+        -------
+        Dict[str, float]
+            ``hits``, ``misses``, ``num_entries`` and ``size_bytes`` of the cache.
+        """
+        with self._lock():
+            entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "num_entries": len(entries),
+            "size_bytes": sum(stat.st_size for stat in entries.values()),
+        }
+
+
+# cache used by ``web.run``, ``Job.run`` and ``Batch.run``, if enabled
+_RESULT_CACHE = None
+
+
+def enable_cache(
+    directory: str = DEFAULT_CACHE_DIR, max_size_bytes: float = DEFAULT_CACHE_SIZE_BYTES
+) -> ResultCache:
+    """Reuse the data of simulations that were already run, instead of running them again.
+
+    Parameters
+    ----------
+    directory : str = "~/.tidy3d/cache"
+        Directory where the data files are stored.
+    max_size_bytes : float = 10e9
+        Maximum total size of the stored files, the least recently used are removed beyond it.
+
+    Returns
+    -------
+    :class:`ResultCache`
+        The cache used by ``web.run``, ``Job.run`` and ``Batch.run``.
+    """
+    global _RESULT_CACHE  # pylint:disable=global-statement
+    _RESULT_CACHE = ResultCache(directory=directory, max_size_bytes=max_size_bytes)
+    return _RESULT_CACHE
+
+
+def disable_cache() -> None:
+    """Stop reusing the data of simulations that were already run (the files are kept)."""
+    global _RESULT_CACHE  # pylint:disable=global-statement
+    _RESULT_CACHE = None
+
+
+def get_cache() -> Optional[ResultCache]:
+    """The cache used by ``web.run``, ``Job.run`` and ``Batch.run``, ``None`` if not enabled."""
+    return _RESULT_CACHE
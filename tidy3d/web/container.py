@@ -1,7 +1,10 @@
 """higher level wrappers for webapi functions for individual (Job) and batch (Batch) tasks."""
 import os
 from abc import ABC
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, Callable, Any
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 
 from rich.console import Console
@@ -9,14 +12,22 @@ from rich.progress import Progress
 import pydantic as pd
 
 from . import webapi as web
-from .task import TaskId, TaskInfo, RunInfo, TaskName
-from ..components.simulation import Simulation
+from .cache import get_cache, ResultCache
+from .task import TaskId, TaskInfo, RunInfo, TaskName, Folder
+from ..components.simulation import Simulation, SimulationEstimate
 from ..components.data import SimulationData
 from ..components.base import Tidy3dBaseModel
+from ..log import log
 
 
 DEFAULT_DATA_PATH = "simulation_data.hdf5"
 DEFAULT_DATA_DIR = "."
+DEFAULT_NUM_WORKERS = 8
+DEFAULT_CACHE_SIZE_BYTES = 1e9
+
+# guards the loaded data kept in memory by each BatchData, it is not stored on the instances so
+# that they can still be copied and pickled
+_SIM_DATA_CACHE_LOCK = threading.Lock()
 
 
 class WebContainer(Tidy3dBaseModel, ABC):
@@ -69,12 +80,27 @@ class Job(WebContainer):
         -------
         Dict[str: :class:`.SimulationData`]
             Dictionary mapping task name to :class:`.SimulationData` for :class:`Job`.
+
+        Note
+        ----
+        If the cache is enabled with :meth:`.enable_cache` and the same :class:`.Simulation` was
+        already run, its cached data is copied to ``path`` and loaded instead of running it again.
         """
 
+        cache = get_cache()
+        if cache is not None and cache.get(self.simulation, path=path):
+            return web.load(
+                task_id=None, path=path, replace_existing=False, normalize_index=normalize_index
+            )
+
         self.upload()
         self.start()
         self.monitor()
-        return self.load(path=path, normalize_index=normalize_index)
+        sim_data = self.load(path=path, normalize_index=normalize_index)
+
+        if cache is not None:
+            cache.put(self.simulation, path=path)
+        return sim_data
 
     def upload(self) -> None:
         """Upload simulation to server without running.
@@ -186,7 +212,13 @@ class Job(WebContainer):
 
 
 class BatchData(Tidy3dBaseModel):
-    """Holds a collection of :class:`.SimulationData` returned by :class:`.Batch`."""
+    """Holds a collection of :class:`.SimulationData` returned by :class:`.Batch`.
+
+    Note
+    ----
+    The data of each task is stored in ``{task_id}.hdf5``, or in ``{task_name}.hdf5`` for all
+    tasks if the batch was run with the cache enabled, see :meth:`.Batch.run`.
+    """
 
     task_paths: Dict[TaskName, str] = pd.Field(
         ...,
@@ -194,8 +226,11 @@ class BatchData(Tidy3dBaseModel):
         description="Mapping of task_name to path to corresponding data for each task in batch.",
     )
 
-    task_ids: Dict[TaskName, str] = pd.Field(
-        ..., title="Task IDs", description="Mapping of task_name to task_id for each task in batch."
+    task_ids: Dict[TaskName, Optional[TaskId]] = pd.Field(
+        ...,
+        title="Task IDs",
+        description="Mapping of task_name to task_id for each task in batch. "
+        "The task_id is ``None`` for tasks whose data was loaded from the cache.",
     )
 
     normalize_index: Optional[int] = pd.Field(
@@ -206,21 +241,79 @@ class BatchData(Tidy3dBaseModel):
         "If ``None``, does not normalize.",
     )
 
+    cache_size_bytes: pd.NonNegativeFloat = pd.Field(
+        DEFAULT_CACHE_SIZE_BYTES,
+        title="Cache Size",
+        description="Maximum number of bytes of loaded :class:`.SimulationData` kept in memory, "
+        "so that accessing the same task again does not load it from file. "
+        "The least recently used data is dropped first.",
+    )
+
+    # loaded data by task name, from least to most recently used, and its total size in bytes
+    _sim_data_cache: OrderedDict = pd.PrivateAttr(default_factory=OrderedDict)
+    _sim_data_cache_bytes: int = pd.PrivateAttr(0)
+
     def load_sim_data(self, task_name: str) -> SimulationData:
-        """Load a :class:`.SimulationData` from file by task name."""
+        """Load a :class:`.SimulationData` from file by task name, or return it from memory if it
+        was loaded recently."""
+
+        with _SIM_DATA_CACHE_LOCK:
+            if task_name in self._sim_data_cache:
+                self._sim_data_cache.move_to_end(task_name)
+                return self._sim_data_cache[task_name]
+
         task_data_path = self.task_paths[task_name]
         task_id = self.task_ids[task_name]
-        return web.load(
+        sim_data = web.load(
             task_id=task_id,
             path=task_data_path,
             normalize_index=self.normalize_index,
             replace_existing=False,
         )
+        self._cache_sim_data(task_name, sim_data)
+        return sim_data
+
+    def _cache_sim_data(self, task_name: TaskName, sim_data: SimulationData) -> None:
+        """Keep loaded data in memory, dropping the least recently used data beyond the budget."""
 
-    def items(self) -> Tuple[TaskName, SimulationData]:
-        """Iterate through the :class:`.SimulationData` for each task_name."""
-        for task_name in self.task_paths.keys():
-            yield task_name, self.load_sim_data(task_name)
+        nbytes = sim_data.nbytes
+        if nbytes > self.cache_size_bytes:
+            return
+
+        with _SIM_DATA_CACHE_LOCK:
+            if task_name in self._sim_data_cache:
+                return
+            self._sim_data_cache[task_name] = sim_data
+            self._sim_data_cache_bytes += nbytes
+            while self._sim_data_cache_bytes > self.cache_size_bytes:
+                _, old_sim_data = self._sim_data_cache.popitem(last=False)
+                self._sim_data_cache_bytes -= old_sim_data.nbytes
+
+    def items(self, num_prefetch: int = 1) -> Tuple[TaskName, SimulationData]:
+        """Iterate through the :class:`.SimulationData` for each task_name.
+
+        Parameters
+        ----------
+        num_prefetch : int = 1
+            Number of the following tasks whose data is loaded in a background thread while the
+            current one is being processed. If ``0``, each is loaded only when it is reached.
+        """
+        task_names = list(self.task_paths.keys())
+        if num_prefetch <= 0:
+            for task_name in task_names:
+                yield task_name, self.load_sim_data(task_name)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = deque()
+            for task_name in task_names:
+                futures.append((task_name, executor.submit(self.load_sim_data, task_name)))
+                if len(futures) > num_prefetch:
+                    task_name_next, future = futures.popleft()
+                    yield task_name_next, future.result()
+            while futures:
+                task_name_next, future = futures.popleft()
+                yield task_name_next, future.result()
 
     def __getitem__(self, task_name: TaskName) -> SimulationData:
         """Get the :class:`.SimulationData` for a given ``task_name``."""
@@ -249,6 +342,13 @@ class Batch(WebContainer):
         description="Name of folder to store member of each batch on web UI.",
     )
 
+    num_workers: pd.PositiveInt = pd.Field(
+        DEFAULT_NUM_WORKERS,
+        title="Number of Workers",
+        description="Maximum number of tasks that are uploaded, started or downloaded "
+        "concurrently.",
+    )
+
     def run(
         self, path_dir: str = DEFAULT_DATA_DIR, normalize_index: Optional[int] = 0
     ) -> BatchData:
@@ -276,12 +376,75 @@ class Batch(WebContainer):
         rather it iterates over the task names
         and loads the corresponding :class:`.SimulationData` from file.
         If no file exists for that task, it downloads it.
+
+        If the cache is enabled with :meth:`.enable_cache`, only the simulations that were not
+        already run are uploaded. The data of the others is copied from the cache, and the data
+        of the tasks that were run is downloaded and added to the cache. The data of every task
+        is then stored in ``{path_dir}/{task_name}.hdf5``, instead of ``{task_id}.hdf5``, as the
+        cached tasks have no ``task_id``. Their ``task_id`` in the returned :class:`BatchData` is
+        ``None`` and they have no :class:`Job` in ``Batch.jobs``, so :meth:`Batch.get_info`,
+        :meth:`Batch.monitor` and :meth:`Batch.delete` only cover the tasks that were run.
         """
 
-        self.upload()
-        self.start()
-        self.monitor()
-        return self.load(path_dir=path_dir, normalize_index=normalize_index)
+        cache = get_cache()
+        if cache is None:
+            self.upload()
+            self.start()
+            self.monitor()
+            return self.load(path_dir=path_dir, normalize_index=normalize_index)
+
+        # tasks whose data is cached are not run
+        task_paths, batch_run = self._get_cached(cache, path_dir)
+        task_ids = {task_name: None for task_name in task_paths}
+        if batch_run is not None:
+            batch_run.upload()
+            batch_run.start()
+            batch_run.monitor()
+            batch_data_run = self._put_cached(cache, batch_run, path_dir, normalize_index)
+            task_paths.update(batch_data_run.task_paths)
+            task_ids.update(batch_data_run.task_ids)
+
+        return BatchData(task_paths=task_paths, task_ids=task_ids, normalize_index=normalize_index)
+
+    def _get_cached(self, cache: ResultCache, path_dir: str) -> Tuple[Dict[TaskName, str], "Batch"]:
+        """Copy the data of the tasks found in ``cache`` to ``{path_dir}/{task_name}.hdf5``.
+        Returns the paths of the data of these tasks and a copy of the :class:`Batch` with only
+        the other tasks, which is ``None`` if all of them were found."""
+
+        task_paths = {}
+        for task_name, simulation in self.simulations.items():
+            task_path = self._task_name_data_path(task_name=task_name, path_dir=path_dir)
+            if cache.get(simulation, path=task_path):
+                task_paths[task_name] = task_path
+
+        simulations_run = {
+            task_name: simulation
+            for task_name, simulation in self.simulations.items()
+            if task_name not in task_paths
+        }
+        if not simulations_run:
+            return task_paths, None
+        return task_paths, self.copy(update={"simulations": simulations_run})
+
+    def _put_cached(
+        self, cache: ResultCache, batch_run: "Batch", path_dir: str, normalize_index: Optional[int]
+    ) -> BatchData:
+        """Download the data of the tasks run by ``batch_run``, returned by
+        :meth:`Batch._get_cached`, to ``{path_dir}/{task_name}.hdf5`` like the data of the cached
+        tasks, add it to ``cache``, and keep their jobs."""
+
+        self.jobs = batch_run.jobs
+        task_paths = {
+            task_name: self._task_name_data_path(task_name=task_name, path_dir=path_dir)
+            for task_name in batch_run.jobs
+        }
+        batch_run._download_to(task_paths)  # pylint:disable=protected-access
+
+        task_ids = {}
+        for task_name, job in batch_run.jobs.items():
+            cache.put(batch_run.simulations[task_name], path=task_paths[task_name])
+            task_ids[task_name] = job.task_id
+        return BatchData(task_paths=task_paths, task_ids=task_ids, normalize_index=normalize_index)
 
     def upload(self) -> None:
         """Create a series of tasks in the :class:`.Batch` and upload them to server.
@@ -289,12 +452,57 @@ class Batch(WebContainer):
         Note
         ----
         To start the simulations running, must call :meth:`Batch.start` after uploaded.
+        All simulations are checked before any of them are uploaded, so that an invalid
+        simulation does not leave the :class:`Batch` partially uploaded.
         """
-        self.jobs = {}
-        for task_name, simulation in self.simulations.items():
-            job = Job(simulation=simulation, task_name=task_name, folder_name=self.folder_name)
-            self.jobs[task_name] = job
-            job.upload()
+        simulations = {
+            task_name: simulation.validate_deferred()
+            for task_name, simulation in self.simulations.items()
+        }
+        for simulation in simulations.values():
+            simulation.validate_pre_upload()
+
+        self.jobs = {
+            task_name: Job(simulation=simulation, task_name=task_name, folder_name=self.folder_name)
+            for task_name, simulation in simulations.items()
+        }
+
+        # all tasks go in the same folder, so it is only looked up once
+        folder = web._query_or_create_folder(self.folder_name)  # pylint:disable=protected-access
+
+        def upload_job(job: Job) -> None:
+            """Upload a single job to the batch folder."""
+            # pylint:disable=protected-access
+            job.task_id = web._upload_task(
+                simulation=job.simulation,
+                task_name=job.task_name,
+                folder_name=self.folder_name,
+                callback_url=job.callback_url,
+                folder=folder,
+                validated=True,
+            )
+            log.info(f"Uploaded task '{job.task_name}' with task_id '{job.task_id}'.")
+
+        self._map_jobs(upload_job)
+
+    def _map_jobs(self, func: Callable[[Job], Any]) -> None:
+        """Call ``func`` on each job in the :class:`Batch`, with at most ``num_workers`` calls
+        running concurrently. Raises the first exception raised by any of the calls."""
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            # consume the results so that exceptions in the threads are raised here
+            list(executor.map(func, self.jobs.values()))
+
+    def estimate(self) -> Dict[TaskName, SimulationEstimate]:
+        """Estimate the size of each simulation in the :class:`Batch` without uploading it.
+
+        Returns
+        -------
+        Dict[str, :class:`.SimulationEstimate`]
+            Mapping of task name to the size and cost estimate of its simulation.
+        """
+        return {
+            task_name: simulation.estimate() for task_name, simulation in self.simulations.items()
+        }
 
     def get_info(self) -> Dict[TaskName, TaskInfo]:
         """Get information about each task in the :class:`Batch`.
@@ -317,8 +525,7 @@ class Batch(WebContainer):
         ----
         To monitor the running simulations, can call :meth:`Batch.monitor`.
         """
-        for _, job in self.jobs.items():
-            job.start()
+        self._map_jobs(lambda job: job.start())
 
     def get_run_info(self) -> Dict[TaskName, RunInfo]:
         """get information about a each of the tasks in the :class:`Batch`.
@@ -362,25 +569,63 @@ class Batch(WebContainer):
 
         with Progress(console=console) as progress:
 
+            def update_pbars(statuses: Dict[TaskName, str]) -> None:
+                """Show the current statuses in the progressbars."""
+                for task_name, status in statuses.items():
+                    description = pbar_description(task_name, status)
+                    if status in run_statuses:
+                        completed = run_statuses.index(status)
+                        progress.update(pbar_tasks[task_name], completed=completed)
+                    progress.update(pbar_tasks[task_name], description=description)
+
+            # all tasks are in the same folder, so it is only looked up once
+            # pylint:disable=protected-access
+            folder = web._query_or_create_folder(self.folder_name)
+            statuses = self._get_statuses(folder)
+
             # create progressbars
             pbar_tasks = {}
-            for task_name, job in self.jobs.items():
-                status = job.status
+            for task_name, status in statuses.items():
                 description = pbar_description(task_name, status)
                 pbar = progress.add_task(description, total=len(run_statuses) - 1)
                 pbar_tasks[task_name] = pbar
-
-            while any(job.status not in end_statuses for job in self.jobs.values()):
-                for task_name, job in self.jobs.items():
-                    pbar = pbar_tasks[task_name]
-                    status = job.status
-                    description = pbar_description(task_name, status)
-                    completed = run_statuses.index(status)
-                    progress.update(pbar, description=description, completed=completed)
-                time.sleep(web.REFRESH_TIME)
+            update_pbars(statuses)
+
+            refresh_time = web.REFRESH_TIME
+            while any(status not in end_statuses for status in statuses.values()):
+                time.sleep(refresh_time)
+                new_statuses = self._get_statuses(folder)
+                if new_statuses == statuses:
+                    # back off while waiting on tasks that are queued or running for a long time
+                    refresh_time = web.next_refresh_time(refresh_time)
+                else:
+                    refresh_time = web.REFRESH_TIME
+                statuses = new_statuses
+                update_pbars(statuses)
 
         console.log("Batch complete.")
 
+    def _get_statuses(self, folder: Folder) -> Dict[TaskName, str]:
+        """Get the status of every task in the :class:`Batch`, using one request to get the
+        statuses of all tasks in ``folder`` and individual requests only for tasks not found."""
+
+        folder_statuses = web._get_folder_statuses(folder)  # pylint:disable=protected-access
+        statuses = {}
+        missing_jobs = {}
+        for task_name, job in self.jobs.items():
+            status = folder_statuses.get(job.task_id)
+            if status is None:
+                missing_jobs[task_name] = job
+            else:
+                statuses[task_name] = status
+
+        if missing_jobs:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                missing_statuses = executor.map(lambda job: job.status, missing_jobs.values())
+                statuses.update(zip(missing_jobs.keys(), missing_statuses))
+
+        return statuses
+
     @staticmethod
     def _job_data_path(task_id: TaskId, path_dir: str = DEFAULT_DATA_DIR):
         """Default path to data of a single :class:`Job` in :class:`Batch`.
@@ -399,6 +644,12 @@ class Batch(WebContainer):
         """
         return os.path.join(path_dir, f"{str(task_id)}.hdf5")
 
+    @staticmethod
+    def _task_name_data_path(task_name: TaskName, path_dir: str = DEFAULT_DATA_DIR):
+        """Path to the data of a task in a :class:`Batch` run with the cache enabled, which is
+        named after the task, as the tasks loaded from the cache have no task_id."""
+        return os.path.join(path_dir, f"{task_name}.hdf5")
+
     def download(self, path_dir: str = DEFAULT_DATA_DIR) -> None:
         """Download results of each task.
 
@@ -412,12 +663,30 @@ class Batch(WebContainer):
         To load the data into :class:`.SimulationData`objets, can call :meth:`Batch.items`.
 
         The data for each task will be named as ``{path_dir}/{task_name}.hdf5``.
+        Up to ``num_workers`` tasks are downloaded at the same time, files that already match the
+        results on the server are skipped and interrupted downloads are resumed.
 
         """
 
-        for job in self.jobs.values():
-            job_path = self._job_data_path(task_id=job.task_id, path_dir=path_dir)
-            job.download(path=job_path)
+        task_paths = {
+            task_name: self._job_data_path(task_id=job.task_id, path_dir=path_dir)
+            for task_name, job in self.jobs.items()
+        }
+        self._download_to(task_paths)
+
+    def _download_to(self, task_paths: Dict[TaskName, str]) -> None:
+        """Download results of each task to its path in ``task_paths``, see :meth:`download`."""
+
+        with Progress() as progress:
+
+            def download_job(job: Job) -> None:
+                """Download the data of a single job."""
+                # pylint:disable=protected-access
+                web._download_task(
+                    task_id=job.task_id, path=task_paths[job.task_name], progress=progress
+                )
+
+            self._map_jobs(download_job)
 
     def load(
         self, path_dir: str = DEFAULT_DATA_DIR, normalize_index: Optional[int] = 0
@@ -2,13 +2,27 @@
 # import os
 from typing import Dict
 from enum import Enum
+from collections import Counter
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .auth import get_credentials
 from .config import DEFAULT_CONFIG as Config
 from ..log import WebError
 
+# maximum number of connections to the server kept alive by the shared session
+MAX_POOL_CONNECTIONS = 32
+
+SESSION = None
+_session_lock = threading.Lock()
+_auth_lock = threading.Lock()
+
+# number of requests made to the server, by http method
+_request_counts = Counter()
+_request_counts_lock = threading.Lock()
+
 
 class ResponseCodes(Enum):
     """HTTP response codes to handle individually."""
@@ -24,14 +38,21 @@ def handle_response(func):
         """New function to replace func with."""
 
         # call originl request
+        auth = Config.auth
         resp = func(*args, **kwargs)
+        _count_request(func.__name__)
 
         # while it's unauthorized
         while resp.status_code == ResponseCodes.UNAUTHORIZED.value:
 
-            # ask for credentials and call the http request again
-            get_credentials()
+            # ask for credentials, unless another thread already did since this request was made,
+            # and call the http request again
+            with _auth_lock:
+                if Config.auth is auth:
+                    get_credentials()
+                auth = Config.auth
             resp = func(*args, **kwargs)
+            _count_request(func.__name__)
 
         # if the request was not OK, raise an error
         if resp.status_code != ResponseCodes.OK.value:
@@ -49,15 +70,53 @@ def handle_response(func):
     return wrapper
 
 
+def _count_request(http_method: str) -> None:
+    """Record that a request was made to the server."""
+    with _request_counts_lock:
+        _request_counts[http_method] += 1
+
+
+def get_request_counts() -> Dict[str, int]:
+    """Number of requests made to the server for each http method (``'get'``, ``'post'``, ...)
+    since the start of the session or the last call to :meth:`reset_request_counts`."""
+    with _request_counts_lock:
+        return dict(_request_counts)
+
+
+def reset_request_counts() -> None:
+    """Set the number of requests made to the server back to zero."""
+    with _request_counts_lock:
+        _request_counts.clear()
+
+
 def get_query_url(method: str) -> str:
     """construct query url from method name"""
     return f"{Config.web_api_endpoint}/{method}"
     # return os.path.join(Config.web_api_endpoint, method)
 
 
+def get_session() -> requests.Session:
+    """Session shared by all requests (and threads), which keeps connections to the server alive
+    and reuses them instead of opening a new connection for every request."""
+    global SESSION  # pylint:disable=global-statement
+    with _session_lock:
+        if SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=MAX_POOL_CONNECTIONS, pool_maxsize=MAX_POOL_CONNECTIONS
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            SESSION = session
+        return SESSION
+
+
 def get_headers() -> Dict[str, str]:
     """get headers for http request"""
-    get_credentials()
+    # only log in if not done yet, expired credentials are refreshed by ``handle_response``
+    with _auth_lock:
+        if Config.auth is None:
+            get_credentials()
     access_token = Config.auth["accessToken"]
     return {
         "Authorization": f"Bearer {access_token}",
@@ -70,7 +129,7 @@ def post(method, data=None):
     """Uploads the file."""
     query_url = get_query_url(method)
     headers = get_headers()
-    return requests.post(query_url, headers=headers, json=data)
+    return get_session().post(query_url, headers=headers, json=data)
 
 
 @handle_response
@@ -78,7 +137,7 @@ def put(method, data):
     """Runs the file."""
     query_url = get_query_url(method)
     headers = get_headers()
-    return requests.put(query_url, headers=headers, json=data)
+    return get_session().put(query_url, headers=headers, json=data)
 
 
 @handle_response
@@ -86,7 +145,7 @@ def get(method):
     """Downloads the file."""
     query_url = get_query_url(method)
     headers = get_headers()
-    return requests.get(query_url, headers=headers)
+    return get_session().get(query_url, headers=headers)
 
 
 @handle_response
@@ -94,4 +153,4 @@ def delete(method):
     """Deletes the file."""
     query_url = get_query_url(method)
     headers = get_headers()
-    return requests.delete(query_url, headers=headers)
+    return get_session().delete(query_url, headers=headers)
@@ -1,18 +1,44 @@
 """ handles filesystem, storage """
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 import boto3
+from botocore.config import Config as BotoConfig
 
 from .config import DEFAULT_CONFIG as Config
+from .httputils import MAX_POOL_CONNECTIONS
+
+# files are downloaded in byte ranges of this size, several at a time, so that an interrupted
+# download can resume from the ranges that were already written
+DOWNLOAD_CHUNK_SIZE = 64 * 2**20
+DOWNLOAD_MAX_CONCURRENCY = 4
+
+# size of the blocks read from a response body or a file at once
+READ_BLOCK_SIZE = 2**20
+
+# s3 clients are thread safe but expensive to create, so one is kept per set of credentials
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
 
 
 def get_s3_client():
     """returns the client based on Config"""
     keys = Config.user
-    return boto3.client(
-        "s3",
-        aws_access_key_id=keys["userAccessKey"],
-        aws_secret_access_key=keys["userSecretAccessKey"],
-        region_name=Config.s3_region,
-    )
+    client_key = (keys["userAccessKey"], keys["userSecretAccessKey"], Config.s3_region)
+    with _s3_clients_lock:
+        if client_key not in _s3_clients:
+            _s3_clients[client_key] = boto3.client(
+                "s3",
+                aws_access_key_id=keys["userAccessKey"],
+                aws_secret_access_key=keys["userSecretAccessKey"],
+                region_name=Config.s3_region,
+                config=BotoConfig(max_pool_connections=MAX_POOL_CONNECTIONS),
+            )
+        return _s3_clients[client_key]
 
 
 def get_s3_user():
@@ -23,6 +49,125 @@ def get_s3_user():
     return client, bucket, user_id
 
 
+def file_matches_object(path: str, size_bytes: int, etag: str) -> bool:
+    """Whether the file at ``path`` has the same contents as an object on s3.
+
+    Parameters
+    ----------
+    path : str
+        Path to the local file.
+    size_bytes : int
+        Size of the object in bytes.
+    etag : str
+        ETag of the object, which is the md5 checksum of its contents unless it was uploaded in
+        multiple parts. In that case, only the size is compared.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file exists and matches the object.
+    """
+    if not os.path.isfile(path) or os.path.getsize(path) != size_bytes:
+        return False
+
+    etag = etag.strip('"')
+    if "-" in etag:
+        return True
+
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            md5.update(block)
+    return md5.hexdigest() == etag
+
+
+# pylint:disable=too-many-arguments,too-many-locals
+def download_resumable(
+    client,
+    bucket: str,
+    key: str,
+    path: str,
+    size_bytes: int,
+    etag: str,
+    callback: Callable[[int], None] = None,
+) -> None:
+    """Download an object from s3 in byte ranges of ``DOWNLOAD_CHUNK_SIZE``, fetched concurrently.
+
+    The data is written to ``{path}.part``, which is moved to ``path`` when complete. The ranges
+    written so far are recorded in ``{path}.part.json``, so if the download is interrupted,
+    downloading the same object again only fetches the missing ranges.
+
+    Parameters
+    ----------
+    client
+        s3 client.
+    bucket : str
+        Bucket of the object.
+    key : str
+        Key of the object.
+    path : str
+        Path where the file will be downloaded to (including filename).
+    size_bytes : int
+        Size of the object in bytes.
+    etag : str
+        ETag of the object, used to make sure it did not change since a previous download.
+    callback : Callable[[int], None] = None
+        Called with the number of bytes every time data is written.
+    """
+
+    part_path = f"{path}.part"
+    state_path = f"{part_path}.json"
+
+    chunks = [
+        (start, min(start + DOWNLOAD_CHUNK_SIZE, size_bytes) - 1)
+        for start in range(0, size_bytes, DOWNLOAD_CHUNK_SIZE)
+    ]
+
+    # resume if a previous download of the same object was interrupted
+    done = set()
+    if os.path.isfile(part_path) and os.path.isfile(state_path):
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state["etag"] == etag and state["size"] == size_bytes:
+                done = set(state["done"])
+        except (ValueError, KeyError):
+            done = set()
+    if not done:
+        with open(part_path, "wb") as f:
+            f.truncate(size_bytes)
+
+    if callback is not None:
+        callback(sum(chunks[ichunk][1] - chunks[ichunk][0] + 1 for ichunk in done))
+
+    state_lock = threading.Lock()
+
+    def fetch_chunk(ichunk: int) -> None:
+        """Download one byte range and record it as done."""
+        start, end = chunks[ichunk]
+        resp = client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag)
+        with open(part_path, "r+b") as f:
+            f.seek(start)
+            for block in resp["Body"].iter_chunks(READ_BLOCK_SIZE):
+                f.write(block)
+                if callback is not None:
+                    callback(len(block))
+            f.flush()
+            os.fsync(f.fileno())
+        with state_lock:
+            done.add(ichunk)
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "size": size_bytes, "done": sorted(done)}, f)
+
+    missing = [ichunk for ichunk in range(len(chunks)) if ichunk not in done]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_CONCURRENCY) as executor:
+        list(executor.map(fetch_chunk, missing))
+
+    os.replace(part_path, path)
+    if os.path.exists(state_path):
+        os.remove(state_path)
+
+
 class UploadProgress:
     """updates progressbar for the upload status"""
 
@@ -39,10 +184,10 @@ class UploadProgress:
 class DownloadProgress:
     """updates progressbar for the download status"""
 
-    def __init__(self, size_bytes, progress):
+    def __init__(self, size_bytes, progress, description="[red]Downloading..."):
         """initialize with the size of file and rich.progress.Progress() instance"""
         self.progress = progress
-        self.dl_task = self.progress.add_task("[red]Downloading...", total=size_bytes)
+        self.dl_task = self.progress.add_task(description, total=size_bytes)
 
     def report(self, bytes_in_chunk):
         """the progressbar with recent chunk"""
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import time
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -13,8 +14,9 @@ from rich.console import Console
 from rich.progress import Progress
 
 from . import httputils as http
+from .cache import get_cache
 from .config import DEFAULT_CONFIG
-from .s3utils import get_s3_user, DownloadProgress
+from .s3utils import get_s3_user, DownloadProgress, download_resumable, file_matches_object
 from .task import TaskId, TaskInfo, Folder
 from ..components.data import SimulationData
 from ..components.simulation import Simulation
@@ -25,6 +27,10 @@ from ..version import __version__
 REFRESH_TIME = 0.3
 TOTAL_DOTS = 3
 
+# while the status does not change, the time between status queries grows by this factor
+REFRESH_BACKOFF = 1.5
+MAX_REFRESH_TIME = 10.0
+
 
 def run(  # pylint:disable=too-many-arguments
     simulation: Simulation,
@@ -60,7 +66,18 @@ def run(  # pylint:disable=too-many-arguments
     -------
     :class:`.SimulationData`
         Object containing solver results for the supplied :class:`.Simulation`.
+
+    Note
+    ----
+    If the cache is enabled with :meth:`enable_cache` and the same :class:`.Simulation` was
+    already run, its cached data is copied to ``path`` and loaded instead of running it again.
     """
+    cache = get_cache()
+    if cache is not None and cache.get(simulation, path=path):
+        return load(
+            task_id=None, path=path, replace_existing=False, normalize_index=normalize_index
+        )
+
     task_id = upload(
         simulation=simulation,
         task_name=task_name,
@@ -69,7 +86,11 @@ def run(  # pylint:disable=too-many-arguments
     )
     start(task_id)
     monitor(task_id)
-    return load(task_id=task_id, path=path, normalize_index=normalize_index)
+    sim_data = load(task_id=task_id, path=path, normalize_index=normalize_index)
+
+    if cache is not None:
+        cache.put(simulation, path=path)
+    return sim_data
 
 
 def upload(
@@ -205,8 +226,6 @@ def monitor(task_id: TaskId) -> None:
     task_info = get_info(task_id)
     task_name = task_info.taskName
 
-    status = None
-
     break_statuses = ("success", "error", "diverged", "deleted", "draft")
 
     def get_status():
@@ -219,50 +238,103 @@ def monitor(task_id: TaskId) -> None:
     console = Console()
 
     # already done
-    if get_status() in break_statuses:
-        log.info(f"status = {get_status()}")
+    status = task_info.status if task_info.status != "visualize" else "success"
+    if status in break_statuses:
+        log.info(f"status = {status}")
         return
 
+    # last status printed to the log
+    logged_status = None
+
     # preprocessing
     with console.status(f"[bold green]Starting '{task_name}'...", spinner="runner"):
-        while get_status() not in break_statuses and get_status() != "running":
-            if status != get_status():
-                status = get_status()
-                if status != "running":
-                    log.info(f"status = {status}")
-            time.sleep(REFRESH_TIME)
+        refresh_time = REFRESH_TIME
+        while status not in break_statuses and status != "running":
+            if status != logged_status:
+                logged_status = status
+                log.info(f"status = {status}")
+                refresh_time = REFRESH_TIME
+            time.sleep(refresh_time)
+            refresh_time = next_refresh_time(refresh_time)
+            status = get_status()
 
     # startup phase where run info is not available
     log.info("starting up solver")
-    while get_run_info(task_id)[0] is None and get_status() == "running":
+    perc_done, field_decay = get_run_info(task_id)
+    while perc_done is None and status == "running":
         time.sleep(REFRESH_TIME)
+        perc_done, field_decay = get_run_info(task_id)
+        status = get_status()
 
     # phase where run % info is available
     log.info("running solver")
     with Progress(console=console) as progress:
         pbar_pd = progress.add_task("% done", total=100)
-        perc_done, _ = get_run_info(task_id)
-        while perc_done is not None and perc_done < 100 and get_status() == "running":
-            perc_done, field_decay = get_run_info(task_id)
+        while perc_done is not None and perc_done < 100 and status == "running":
             new_description = f"% done (field decay = {field_decay:.2e})"
             progress.update(pbar_pd, completed=perc_done, description=new_description)
             time.sleep(1.0)
-        if perc_done < 100:
+            perc_done, field_decay = get_run_info(task_id)
+            status = get_status()
+        if perc_done is None or perc_done < 100:
             log.info("early shutoff detected, exiting.")
         else:
             progress.update(pbar_pd, completed=100)
 
     # postprocessing
     with console.status(f"[bold green]Finishing '{task_name}'...", spinner="runner"):
-        while get_status() not in break_statuses:
-            if status != get_status():
-                status = get_status()
+        refresh_time = REFRESH_TIME
+        while status not in break_statuses:
+            if status != logged_status:
+                logged_status = status
                 log.info(f"status = {status}")
-            time.sleep(REFRESH_TIME)
+                refresh_time = REFRESH_TIME
+            time.sleep(refresh_time)
+            refresh_time = next_refresh_time(refresh_time)
+            status = get_status()
 
     # final status (if diffrent from the last printed status)
-    if status != get_status():
-        log.info(f"status = {get_status()}")
+    if status != logged_status:
+        log.info(f"status = {status}")
+
+
+def next_refresh_time(refresh_time: float) -> float:
+    """Time to wait before the next status query if the status did not change since the last one.
+
+    Parameters
+    ----------
+    refresh_time : float
+        Time (seconds) waited before the last status query.
+
+    Returns
+    -------
+    float
+        Time (seconds) to wait before the next status query.
+    """
+    return min(refresh_time * REFRESH_BACKOFF, MAX_REFRESH_TIME)
+
+
+def get_folder_statuses(folder_name: str = "default") -> Dict[TaskId, str]:
+    """Get the status of all tasks in a folder with a single request.
+
+    Parameters
+    ----------
+    folder_name : str = "default"
+        Name of the folder containing the tasks.
+
+    Returns
+    -------
+    Dict[str, str]
+        Mapping of task_id to status for each task in the folder.
+    """
+    folder = _query_or_create_folder(folder_name)
+    return _get_folder_statuses(folder)
+
+
+def _get_folder_statuses(folder: Folder) -> Dict[TaskId, str]:
+    """Get the status of all tasks in a folder that was already looked up."""
+    tasks = http.get(f"tidy3d/projects/{folder.projectId}/tasks")
+    return {task["taskId"]: task.get("status") for task in tasks or []}
 
 
 def download(task_id: TaskId, path: str = "simulation_data.hdf5") -> None:
@@ -278,7 +350,14 @@ def download(task_id: TaskId, path: str = "simulation_data.hdf5") -> None:
     Note
     ----
     To load downloaded results into data, call :meth:`load` with option `replace_existing=False`.
+    If the file at ``path`` already matches the results on the server, it is not downloaded again.
     """
+    _download_task(task_id=task_id, path=path)
+
+
+def _download_task(task_id: TaskId, path: str, progress: Progress = None) -> None:
+    """download with all kwargs exposed, ``progress`` is used to show the download progress
+    alongside that of other downloads"""
 
     # TODO: it should be possible to load "diverged" simulations
     task_info = get_info(task_id)
@@ -289,7 +368,7 @@ def download(task_id: TaskId, path: str = "simulation_data.hdf5") -> None:
     if directory != "":
         os.makedirs(directory, exist_ok=True)
 
-    _download_file(task_id, fname="monitor_data.hdf5", path=path)
+    _download_file(task_id, fname="monitor_data.hdf5", path=path, progress=progress)
 
 
 def load(
@@ -453,18 +532,27 @@ def _upload_task(  # pylint:disable=too-many-locals,too-many-arguments
     task_name: str,
     folder_name: str = "default",
     callback_url: str = None,
+    folder: Folder = None,
+    validated: bool = False,
 ) -> TaskId:
-    """upload with all kwargs exposed"""
+    """upload with all kwargs exposed, ``folder`` can be supplied to skip looking it up and
+    ``validated`` if the simulation was already checked by ``validate_deferred`` and
+    ``validate_pre_upload``"""
 
-    simulation.validate_pre_upload()
+    if not validated:
+        # models made by trusted construction are validated now, and the validated copy is uploaded
+        simulation = simulation.validate_deferred()
+        simulation.validate_pre_upload()
 
-    json_string = simulation._json_string()  # pylint:disable=protected-access
+    # no indentation, which takes up most of the size of large simulations
+    json_string = simulation._json_string(indent=None)  # pylint:disable=protected-access
     data = {
         "taskName": task_name,
         "callbackUrl": callback_url,
     }
 
-    folder = _query_or_create_folder(folder_name)
+    if folder is None:
+        folder = _query_or_create_folder(folder_name)
     method = f"tidy3d/projects/{folder.projectId}/tasks"
 
     log.debug("Creating task.")
@@ -502,7 +590,7 @@ def _upload_task(  # pylint:disable=too-many-locals,too-many-arguments
     return task_id
 
 
-def _download_file(task_id: TaskId, fname: str, path: str) -> None:
+def _download_file(task_id: TaskId, fname: str, path: str, progress: Progress = None) -> None:
     """Download a specific file from server.
 
     Parameters
@@ -513,24 +601,22 @@ def _download_file(task_id: TaskId, fname: str, path: str) -> None:
         Name of the file on server (eg. ``monitor_data.hdf5``, ``tidy3d.log``, ``simulation.json``)
     path : str
         Path where the file will be downloaded to (including filename).
+    progress : rich.progress.Progress = None
+        Progress display to add the download progressbar to, if not supplied a new one is made.
     """
     log.info(f'downloading file "{fname}" to "{path}"')
 
     try:
-        client, bucket, user_id = get_s3_user()
-
-        if fname in ("monitor_data.hdf5", "tidy3d.log"):
-            key = f"users/{user_id}/{task_id}/output/{fname}"
-        else:
-            key = f"users/{user_id}/{task_id}/{fname}"
-
-        head_object = client.head_object(Bucket=bucket, Key=key)
-        size_bytes = head_object["ContentLength"]
-        with Progress() as progress:
-            download_progress = DownloadProgress(size_bytes, progress)
-            client.download_file(
-                Bucket=bucket, Filename=path, Key=key, Callback=download_progress.report
-            )
+        start_time = time.perf_counter()
+        size_bytes = _download_s3_file(task_id, fname=fname, path=path, progress=progress)
+        if size_bytes is None:
+            log.info(f'file "{path}" is already downloaded, skipping.')
+            return
+        elapsed = time.perf_counter() - start_time
+        log.info(
+            f"downloaded \"{fname}\" of task '{task_id}': {size_bytes / 1e6:.1f} MB in "
+            f"{elapsed:.1f} s ({size_bytes / 1e6 / max(elapsed, 1e-9):.1f} MB/s)."
+        )
 
     except Exception as e:  # pylint:disable=broad-except
         task_info = get_info(task_id)
@@ -542,6 +628,45 @@ def _download_file(task_id: TaskId, fname: str, path: str) -> None:
         )
 
 
+def _download_s3_file(
+    task_id: TaskId, fname: str, path: str, progress: Progress = None
+) -> Optional[int]:
+    """Download a file of a task from s3 to ``path``, resuming an interrupted download.
+    Returns the size of the file in bytes, or ``None`` if the file at ``path`` already matches
+    the one on s3 and was not downloaded."""
+
+    client, bucket, user_id = get_s3_user()
+
+    if fname in ("monitor_data.hdf5", "tidy3d.log"):
+        key = f"users/{user_id}/{task_id}/output/{fname}"
+    else:
+        key = f"users/{user_id}/{task_id}/{fname}"
+
+    head_object = client.head_object(Bucket=bucket, Key=key)
+    size_bytes = head_object["ContentLength"]
+    etag = head_object["ETag"]
+
+    if file_matches_object(path, size_bytes=size_bytes, etag=etag):
+        return None
+
+    with ExitStack() as stack:
+        if progress is None:
+            progress = stack.enter_context(Progress())
+        download_progress = DownloadProgress(
+            size_bytes, progress, description=f"[red]Downloading {task_id}..."
+        )
+        download_resumable(
+            client,
+            bucket=bucket,
+            key=key,
+            path=path,
+            size_bytes=size_bytes,
+            etag=etag,
+            callback=download_progress.report,
+        )
+    return size_bytes
+
+
 def _rm_file(path: str):
     """Clear path if it exists."""
     if os.path.exists(path) and not os.path.isdir(path):